@@ -26,7 +26,7 @@ from typing import List, Dict
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config import Config
-from src.user_defined_data import read_user_data, UserConfiguration
+from src.user_defined_data import read_user_data, UserConfiguration, ensure_output_dir
 from src.data_reader import DataReader
 from src.unified_ticker_generator import generate_all_ticker_files
 from src.hve_screener import HVEScreener
@@ -51,26 +51,28 @@ def setup_logging() -> None:
     logging.getLogger().setLevel(logging.WARNING)  # Reduce noise
 
 
-def setup_output_directories(config: Config, timeframe: str) -> Path:
+def setup_output_directories(config: Config, timeframe: str,
+                             user_config: UserConfiguration = None) -> Path:
     """
     Create output directories for a specific timeframe.
 
     Args:
         config: Config object with directory paths
         timeframe: Timeframe name ('daily', 'weekly', 'monthly')
+        user_config: Already loaded user configuration (read from disk if None)
 
     Returns:
         Path: Output base directory for the timeframe
     """
     try:
         # Get HVE output directory from user config
-        user_config = read_user_data()
-        output_base = Path(user_config.hve_output_dir) / timeframe
-        output_base.mkdir(parents=True, exist_ok=True)
+        if user_config is None:
+            user_config = read_user_data()
+        output_base = ensure_output_dir(user_config.output_dirs['hve_output_dir'] / timeframe)
 
         # Create subdirectories
-        (output_base / 'details').mkdir(exist_ok=True)
-        (output_base / 'charts').mkdir(exist_ok=True)
+        ensure_output_dir(output_base / 'details')
+        ensure_output_dir(output_base / 'charts')
 
         print(f"📁 Output directory: {output_base}")
         logger.info(f"Output directory for {timeframe}: {output_base}")
@@ -129,7 +131,7 @@ def process_timeframe(
 
     try:
         # Setup output directories
-        output_base = setup_output_directories(config, timeframe)
+        output_base = setup_output_directories(config, timeframe, user_config)
 
         # Initialize HVE Screener with user configuration
         screener = HVEScreener(
@@ -330,7 +332,7 @@ def main():
             # Both exports can run simultaneously or independently
             # ================================================================
             
-            output_dir = Path(user_config.hve_output_dir)
+            output_dir = user_config.output_dirs['hve_output_dir']
             
             # ----------------------------------------------------------
             # HVE Historical Export (temporal milestones)
@@ -7,7 +7,7 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from src.user_defined_data import read_user_data_legacy, read_user_data, _get_default_ticker_filenames
+from src.user_defined_data import read_user_data_legacy, read_user_data, DEFAULT_TICKER_FILENAMES
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +21,12 @@ class Config:
 
         # Read user preferences first (needed for environment detection)
         self.user_choice, self.write_file_info = read_user_data_legacy()
-        user_config = read_user_data()
-        self.ticker_filenames = user_config.ticker_filenames
+        self.user_config = read_user_data()
+        self.ticker_filenames = self.user_config.ticker_filenames
 
         # Detect environment before setting up directories
-        self.environment = self._detect_environment(user_config)
+        self.environment = self._detect_environment(self.user_config)
+        self._environment_paths = {}
 
         # Initialize configuration components
         self._setup_directories()
@@ -76,7 +77,7 @@ class Config:
 
     def _setup_directories(self):
         """Define all directory paths using user-configurable settings."""
-        user_config = read_user_data()
+        user_config = self.user_config
 
         self.directories = {
             # Data directories
@@ -182,7 +183,7 @@ class Config:
         current_user_choice = user_choice if user_choice is not None else config.ticker_choice
 
         # Get ticker group filenames from user configuration (with fallback to defaults)
-        ticker_filenames = config.ticker_filenames or _get_default_ticker_filenames()
+        ticker_filenames = config.ticker_filenames or DEFAULT_TICKER_FILENAMES
         
         # Convert to the expected format (group_id -> list of files)
         group_files = {group_id: [filename] for group_id, filename in ticker_filenames.items()}
@@ -265,6 +266,21 @@ class Config:
     def _get_environment_specific_path(self, timeframe):
         """
         Get environment-specific market data path from user configuration.
+        Each timeframe is resolved once per Config and cached.
+
+        Args:
+            timeframe (str): 'daily', 'weekly', 'monthly', or 'intraday'
+
+        Returns:
+            str or None: Path string if found, None otherwise
+        """
+        if timeframe not in self._environment_paths:
+            self._environment_paths[timeframe] = self._resolve_environment_specific_path(timeframe)
+        return self._environment_paths[timeframe]
+
+    def _resolve_environment_specific_path(self, timeframe):
+        """
+        Resolve the market data path for a timeframe in the detected environment.
 
         Args:
             timeframe (str): 'daily', 'weekly', 'monthly', or 'intraday'
@@ -273,7 +289,7 @@ class Config:
             str or None: Path string if found, None otherwise
         """
         try:
-            user_config = read_user_data()
+            user_config = self.user_config
 
             # Map timeframes to config keys based on detected environment
             config_key_mapping = {
@@ -377,7 +393,7 @@ def get_ticker_files(config=None):
         return config.get_ticker_files()
     else:
         # New function - use provided config object
-        return config.ticker_filenames or _get_default_ticker_filenames()
+        return config.ticker_filenames or DEFAULT_TICKER_FILENAMES
 
 
 def find_ticker_file(filename, config):
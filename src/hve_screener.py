@@ -15,6 +15,43 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 
 
+def _volume_values(volume) -> np.ndarray:
+    """
+    Return volumes as a numpy array, using int64 whenever the conversion is lossless.
+
+    Volumes are whole share counts but usually arrive as float64 from CSV loading.
+    The running-max and comparison passes are memory-bound, so the narrower integer
+    representation is cheaper to scan. Series with gaps (NaN) stay float64.
+    """
+    values = np.asarray(volume)
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64, copy=False)
+    if np.isfinite(values).all() and (values == np.floor(values)).all():
+        return values.astype(np.int64)
+    return values.astype(np.float64, copy=False)
+
+
+def _new_high_mask(volumes: np.ndarray) -> np.ndarray:
+    """
+    Flag the positions where volume sets a new running maximum.
+
+    Missing volumes (NaN) never count as a new high and do not move the running max.
+    """
+    filled = np.nan_to_num(volumes, nan=0.0) if volumes.dtype.kind == 'f' else volumes
+    previous_max = np.empty_like(filled)
+    previous_max[:1] = 0
+    np.maximum.accumulate(filled[:-1], out=previous_max[1:])
+    return volumes > previous_max
+
+
+def _score_inputs(values) -> np.ndarray:
+    """
+    Return score inputs as a float64 array, with missing or non-numeric entries as NaN.
+    """
+    return np.asarray(pd.to_numeric(pd.Series(values, dtype=object), errors='coerce'),
+                      dtype=np.float64)
+
+
 class HVEScreener:
     """
     Screener for finding Highest Volume Ever (HVE) events in stock data.
@@ -77,16 +114,19 @@ class HVEScreener:
             # Sort by date to ensure chronological order
             df = df.sort_index()
 
-            # Calculate rolling maximum volume
-            df['Volume_Max'] = df['Volume'].expanding().max()
+            # Calculate rolling maximum volume (fmax skips NaN like expanding().max())
+            volumes = df['Volume'].to_numpy(dtype=np.float64)
+            volume_max = np.fmax.accumulate(volumes)
 
             # Identify HVE events: Volume equals rolling max AND is different from previous max
             # This ensures we only count new HVE events, not repeated max values
-            df['Volume_Max_Shifted'] = df['Volume_Max'].shift(1)
-            df['Is_HVE'] = (df['Volume'] == df['Volume_Max']) & (df['Volume'] > df['Volume_Max_Shifted'])
+            volume_max_shifted = np.empty_like(volume_max)
+            volume_max_shifted[:1] = np.nan
+            volume_max_shifted[1:] = volume_max[:-1]
+            is_hve = (volumes == volume_max) & (volumes > volume_max_shifted)
 
             # Get all HVE dates
-            hve_dates = df[df['Is_HVE']].index.tolist()
+            hve_dates = df.index[is_hve].tolist()
             hve_count = len(hve_dates)
 
             if hve_count == 0:
@@ -101,19 +141,26 @@ class HVEScreener:
             max_volume_ever = df['Volume'].max()
 
             # Build detailed HVE information
+            hve_rows = df[is_hve]
+            hve_volumes = hve_rows['Volume'].to_numpy()
+            hve_closes = hve_rows['Close'].to_numpy()
+            hve_opens = hve_rows['Open'].to_numpy() if 'Open' in df.columns else None
+            hve_highs = hve_rows['High'].to_numpy() if 'High' in df.columns else None
+            hve_lows = hve_rows['Low'].to_numpy() if 'Low' in df.columns else None
+
             hve_details = []
-            for hve_date in hve_dates:
-                hve_row = df.loc[hve_date]
+            for i, hve_date in enumerate(hve_dates):
+                hve_open = hve_opens[i] if hve_opens is not None else None
 
                 detail = {
                     'date': hve_date,
-                    'volume': hve_row['Volume'],
-                    'close': hve_row['Close'],
-                    'open': hve_row['Open'] if 'Open' in hve_row else None,
-                    'high': hve_row['High'] if 'High' in hve_row else None,
-                    'low': hve_row['Low'] if 'Low' in hve_row else None,
-                    'price_change_pct': ((hve_row['Close'] - hve_row['Open']) / hve_row['Open'] * 100)
-                                       if 'Open' in hve_row and hve_row['Open'] > 0 else None
+                    'volume': hve_volumes[i],
+                    'close': hve_closes[i],
+                    'open': hve_open,
+                    'high': hve_highs[i] if hve_highs is not None else None,
+                    'low': hve_lows[i] if hve_lows is not None else None,
+                    'price_change_pct': ((hve_closes[i] - hve_open) / hve_open * 100)
+                                       if hve_open is not None and hve_open > 0 else None
                 }
                 hve_details.append(detail)
 
@@ -185,41 +232,43 @@ class HVEScreener:
             # Define the 1-year window using calendar days
             one_year_ago = latest_date - pd.DateOffset(days=self.hv1y_window_days)
 
-            # Filter data to last year
-            df_1y = df[df.index >= one_year_ago].copy()
+            # Filter volumes and dates to last year (only the Volume column is needed);
+            # the index is sorted, so the window is a contiguous tail found by binary search
+            window_start = df.index.searchsorted(one_year_ago, side='left')
+            dates_1y = df.index[window_start:]
 
-            if len(df_1y) < 2:
+            if len(dates_1y) < 2:
                 return self._empty_hv1y_result()
 
-            # Calculate cumulative maximum volume within 1-year window
-            df_1y['cummax_volume_1y'] = df_1y['Volume'].cummax()
-
-            # Identify HV1Y events (similar to HVE logic)
-            df_1y['is_hv1y'] = df_1y['Volume'] == df_1y['cummax_volume_1y']
-            df_1y['is_new_hv1y'] = (df_1y['is_hv1y']) & (df_1y['Volume'] > df_1y['cummax_volume_1y'].shift(1).fillna(0))
+            # Identify HV1Y events within the 1-year window (same logic as HVE); the
+            # scan may run on int64, but reported volumes keep the column's dtype
+            source_volumes_1y = df['Volume'].to_numpy()[window_start:]
+            volumes_1y = _volume_values(source_volumes_1y)
+            is_new_hv1y = _new_high_mask(volumes_1y)
 
             # Get all HV1Y event dates
-            hv1y_events = df_1y[df_1y['is_new_hv1y']]
+            hv1y_dates = dates_1y[is_new_hv1y]
 
-            # Get the absolute highest volume in 1 year
-            max_volume_1y = df_1y['Volume'].max()
-            max_volume_1y_date = df_1y[df_1y['Volume'] == max_volume_1y].index[0]
+            # Get the absolute highest volume in 1 year (first occurrence)
+            max_position = int(np.argmax(np.nan_to_num(volumes_1y, nan=0.0)))
+            max_volume_1y = source_volumes_1y[max_position]
+            max_volume_1y_date = dates_1y[max_position]
 
             # Calculate days since latest HV1Y
             days_since_hv1y = (latest_date - max_volume_1y_date).days
 
             # Count HV1Y occurrences in last 1 year (all events are by definition in last year)
-            hv1y_occ_1y = len(hv1y_events)
+            hv1y_occ_1y = len(hv1y_dates)
 
             # Total HV1Y count (same as hv1y_occ_1y since we're looking at 1-year window)
-            total_hv1y_count = len(hv1y_events)
+            total_hv1y_count = len(hv1y_dates)
 
             # Build detailed list of all HV1Y events with dates and volumes
             all_hv1y_details = []
-            for hv1y_date_item in hv1y_events.index:
+            for hv1y_date_item, hv1y_volume in zip(hv1y_dates, source_volumes_1y[is_new_hv1y]):
                 all_hv1y_details.append({
                     'date': hv1y_date_item,
-                    'volume': df_1y.loc[hv1y_date_item, 'Volume']
+                    'volume': hv1y_volume
                 })
             # Sort by date (most recent first)
             all_hv1y_details = sorted(all_hv1y_details, key=lambda x: x['date'], reverse=True)
@@ -274,136 +323,18 @@ class HVEScreener:
 
         for ticker, df in batch_data.items():
             try:
-                # Ensure required columns exist
-                if 'Volume' not in df.columns:
-                    logger.warning(f"{ticker}: No Volume column, skipping")
-                    continue
-
-                # Apply minimum price filter
-                if self.min_price > 0:
-                    if 'Close' in df.columns:
-                        latest_price = df['Close'].iloc[-1]
-                        if latest_price < self.min_price:
-                            continue
-
-                # Apply minimum volume filter
-                if self.min_volume > 0:
-                    latest_volume = df['Volume'].iloc[-1]
-                    if latest_volume < self.min_volume:
-                        continue
-
-                # Apply date range filter based on mode
-                if self.date_range_mode == "fixed" and self.start_date and self.end_date:
-                    # Fixed date range mode: filter to specific start and end dates
-                    df = df[(df.index >= self.start_date) & (df.index <= self.end_date)]
-                elif self.limit_hist_years > 0:
-                    # Rolling mode: filter from now backwards by N years
-                    cutoff_date = pd.Timestamp.now() - pd.DateOffset(years=self.limit_hist_years)
-                    df = df[df.index >= cutoff_date]
-
-                # Find HVE events
-                if len(df) < 2:
-                    continue
-
-                # Ensure data is sorted by date
-                df = df.sort_index()
-
-                # Calculate cumulative maximum volume (rolling HVE)
-                df['cummax_volume'] = df['Volume'].cummax()
-
-                # Identify all HVE events (when volume equals cumulative max at that point)
-                # An HVE event is when volume reaches a new all-time high
-                df['is_hve'] = df['Volume'] == df['cummax_volume']
-
-                # Also need to filter out consecutive duplicates (same volume stays as max)
-                # Only count it as HVE when it's a NEW maximum
-                df['is_new_hve'] = (df['is_hve']) & (df['Volume'] > df['cummax_volume'].shift(1).fillna(0))
-
-                # Get all HVE event dates
-                hve_events = df[df['is_new_hve']]
-
-                # Get the absolute highest volume ever (most recent HVE)
-                max_volume = df['Volume'].max()
-                max_volume_date = df[df['Volume'] == max_volume].index[0]
-
-                # Calculate days since latest HVE
-                days_since_hve = (df.index[-1] - max_volume_date).days
-
-                # Count HVE occurrences in last 1 year
-                one_year_ago = df.index[-1] - pd.DateOffset(years=1)
-                hve_last_year = hve_events[hve_events.index >= one_year_ago]
-                hve_occ_1y = len(hve_last_year)
-
-                # Get all HVE dates for reference
-                all_hve_dates = hve_events.index.tolist()
-                total_hve_count = len(all_hve_dates)
-
-                # Build detailed list of all HVE events with dates and volumes
-                all_hve_details = []
-                for hve_date in hve_events.index:
-                    all_hve_details.append({
-                        'date': hve_date,
-                        'volume': df.loc[hve_date, 'Volume']
-                    })
-                # Sort by date (most recent first)
-                all_hve_details = sorted(all_hve_details, key=lambda x: x['date'], reverse=True)
-
-                # Get recent data
-                latest_date = df.index[-1]
-                latest_volume = df['Volume'].iloc[-1]
-                latest_close = df['Close'].iloc[-1] if 'Close' in df.columns else None
-
-                # Calculate volume ratio (latest vs max)
-                volume_ratio = latest_volume / max_volume if max_volume > 0 else 0
-
-                # Calculate HV1Y metrics if enabled
-                if self.hv1y_enabled:
-                    hv1y_metrics = self._calculate_hv1y_metrics(df, max_volume_date, max_volume)
-                else:
-                    hv1y_metrics = self._empty_hv1y_result()
-
-                # Build result dictionary
-                result_dict = {
-                    'ticker': ticker,
-                    'timeframe': timeframe,
-                    'hve_date': max_volume_date,
-                    'hve_volume': max_volume,
-                    'days_since_hve': days_since_hve,
-                    'hve_occ_1y': hve_occ_1y,
-                    'total_hve_count': total_hve_count,
-                    'all_hve_details': all_hve_details,
-                }
-
-                # Add HV1Y metrics if enabled
-                if self.hv1y_enabled:
-                    result_dict.update({
-                        'hv1y_date': hv1y_metrics['hv1y_date'],
-                        'hv1y_volume': hv1y_metrics['hv1y_volume'],
-                        'days_since_hv1y': hv1y_metrics['days_since_hv1y'],
-                        'hv1y_occ_1y': hv1y_metrics['hv1y_occ_1y'],
-                        'total_hv1y_count': hv1y_metrics['total_hv1y_count'],
-                        'is_hv1y_also_hve': hv1y_metrics['is_hv1y_also_hve'],
-                        'hv1y_to_hve_ratio': hv1y_metrics['hv1y_to_hve_ratio'],
-                        'all_hv1y_details': hv1y_metrics['all_hv1y_details'],
-                    })
-
-                # Add current data
-                result_dict.update({
-                    'latest_date': latest_date,
-                    'latest_volume': latest_volume,
-                    'latest_close': latest_close,
-                    'volume_ratio': volume_ratio,
-                    'data_points': len(df)
-                })
-
-                results.append(result_dict)
+                result_dict = self._screen_ticker(ticker, df, timeframe)
+                if result_dict:
+                    results.append(result_dict)
 
             except Exception as e:
                 logger.warning(f"Error screening {ticker}: {e}")
                 continue
 
         if results:
-            results_df = pd.DataFrame(results)
+            # Every result shares the same keys, so build the frame column-wise
+            results_df = pd.DataFrame({column: [result[column] for result in results]
+                                       for column in results[0]})
             # Sort by days since HVE (most recent first)
             results_df = results_df.sort_values('days_since_hve')
             logger.info(f"Found {len(results_df)} tickers with HVE data")
@@ -412,6 +343,135 @@ class HVEScreener:
             logger.info("No HVE events found")
             return pd.DataFrame()
 
+    def _screen_ticker(self, ticker: str, df: pd.DataFrame, timeframe: str) -> Optional[Dict]:
+        """
+        Screen a single ticker for HVE events.
+
+        Args:
+            ticker: Ticker symbol
+            df: DataFrame with OHLCV data
+            timeframe: Timeframe being analyzed ('daily', 'weekly', 'monthly')
+
+        Returns:
+            Result dictionary, or None if the ticker is filtered out
+        """
+        # Ensure required columns exist
+        if 'Volume' not in df.columns:
+            logger.warning(f"{ticker}: No Volume column, skipping")
+            return None
+
+        # Apply minimum price filter
+        if self.min_price > 0:
+            if 'Close' in df.columns:
+                latest_price = df['Close'].iloc[-1]
+                if latest_price < self.min_price:
+                    return None
+
+        # Apply minimum volume filter
+        if self.min_volume > 0:
+            latest_volume = df['Volume'].iloc[-1]
+            if latest_volume < self.min_volume:
+                return None
+
+        # Apply date range filter based on mode
+        if self.date_range_mode == "fixed" and self.start_date and self.end_date:
+            # Fixed date range mode: filter to specific start and end dates
+            df = df[(df.index >= self.start_date) & (df.index <= self.end_date)]
+        elif self.limit_hist_years > 0:
+            # Rolling mode: filter from now backwards by N years
+            cutoff_date = pd.Timestamp.now() - pd.DateOffset(years=self.limit_hist_years)
+            df = df[df.index >= cutoff_date]
+
+        # Find HVE events
+        if len(df) < 2:
+            return None
+
+        # Ensure data is sorted by date
+        df = df.sort_index()
+
+        # Work on int64 volumes when possible (halves bandwidth vs float64); reported
+        # volumes come from the source column so their dtype does not depend on the data
+        source_volumes = df['Volume'].to_numpy()
+        volumes = _volume_values(source_volumes)
+
+        # Identify all HVE events: volume strictly above the previous running max
+        # (repeated equal maxima are not counted as new HVE events)
+        is_new_hve = _new_high_mask(volumes)
+
+        # Get all HVE event dates
+        hve_events = df[is_new_hve]
+
+        # Get the absolute highest volume ever (first occurrence)
+        max_position = int(np.argmax(np.nan_to_num(volumes, nan=0.0)))
+        max_volume = source_volumes[max_position]
+        max_volume_date = df.index[max_position]
+
+        # Calculate days since latest HVE
+        days_since_hve = (df.index[-1] - max_volume_date).days
+
+        # Count HVE occurrences in last 1 year
+        one_year_ago = df.index[-1] - pd.DateOffset(years=1)
+        hve_occ_1y = int(len(hve_events) - hve_events.index.searchsorted(one_year_ago, side='left'))
+
+        # Get all HVE dates for reference
+        all_hve_dates = hve_events.index.tolist()
+        total_hve_count = len(all_hve_dates)
+
+        # Build detailed list of all HVE events with dates and volumes
+        all_hve_details = []
+        for hve_date, hve_volume in zip(hve_events.index, source_volumes[is_new_hve]):
+            all_hve_details.append({
+                'date': hve_date,
+                'volume': hve_volume
+            })
+        # Sort by date (most recent first)
+        all_hve_details = sorted(all_hve_details, key=lambda x: x['date'], reverse=True)
+
+        # Get recent data
+        latest_date = df.index[-1]
+        latest_volume = source_volumes[-1]
+        latest_close = df['Close'].iloc[-1] if 'Close' in df.columns else None
+
+        # Calculate volume ratio (latest vs max)
+        volume_ratio = latest_volume / max_volume if max_volume > 0 else 0
+
+        # Build result dictionary
+        result_dict = {
+            'ticker': ticker,
+            'timeframe': timeframe,
+            'hve_date': max_volume_date,
+            'hve_volume': max_volume,
+            'days_since_hve': days_since_hve,
+            'hve_occ_1y': hve_occ_1y,
+            'total_hve_count': total_hve_count,
+            'all_hve_details': all_hve_details,
+        }
+
+        # Calculate and add HV1Y metrics if enabled
+        if self.hv1y_enabled:
+            hv1y_metrics = self._calculate_hv1y_metrics(df, max_volume_date, max_volume)
+            result_dict.update({
+                'hv1y_date': hv1y_metrics['hv1y_date'],
+                'hv1y_volume': hv1y_metrics['hv1y_volume'],
+                'days_since_hv1y': hv1y_metrics['days_since_hv1y'],
+                'hv1y_occ_1y': hv1y_metrics['hv1y_occ_1y'],
+                'total_hv1y_count': hv1y_metrics['total_hv1y_count'],
+                'is_hv1y_also_hve': hv1y_metrics['is_hv1y_also_hve'],
+                'hv1y_to_hve_ratio': hv1y_metrics['hv1y_to_hve_ratio'],
+                'all_hv1y_details': hv1y_metrics['all_hv1y_details'],
+            })
+
+        # Add current data
+        result_dict.update({
+            'latest_date': latest_date,
+            'latest_volume': latest_volume,
+            'latest_close': latest_close,
+            'volume_ratio': volume_ratio,
+            'data_points': len(df)
+        })
+
+        return result_dict
+
     def calculate_score(self, result: Dict) -> float:
         """
         Calculate a screening score for ranking HVE candidates.
@@ -428,40 +488,52 @@ class HVEScreener:
             Numeric score (higher = better candidate)
         """
         try:
-            score = 0.0
-
-            # Recency score (0-50 points)
-            # Recent HVE within 30 days gets max points, decays over time
-            days_since = result.get('days_since_latest_hve', 9999)
-            if days_since <= 30:
-                recency_score = 50
-            elif days_since <= 90:
-                recency_score = 50 * (1 - (days_since - 30) / 60 * 0.5)  # Decay to 25
-            elif days_since <= 365:
-                recency_score = 25 * (1 - (days_since - 90) / 275 * 0.8)  # Decay to 5
-            else:
-                recency_score = 5 * max(0, (1 - (days_since - 365) / 365))  # Decay to 0
-
-            score += recency_score
-
-            # Frequency score (0-30 points)
-            # More HVE events indicates consistent high volume activity
-            hve_count = result.get('hve_count', 0)
-            frequency_score = min(30, hve_count * 3)
-            score += frequency_score
-
-            # Volume ratio score (0-20 points)
-            # Current volume relative to max volume
-            volume_ratio = result.get('volume_ratio_to_max', 0)
-            volume_score = min(20, volume_ratio / 5)  # 100% ratio = 20 points
-            score += volume_score
-
-            return round(score, 2)
+            # Single-row case of compute_scores, so both paths share one formula
+            return float(self.compute_scores(
+                [result.get('days_since_latest_hve', 9999)],
+                [result.get('hve_count', 0)],
+                [result.get('volume_ratio_to_max', 0)]
+            )[0])
 
         except Exception as e:
             logger.error(f"Error calculating score: {e}")
             return 0.0
 
+    def compute_scores(self, days_since, hve_count, volume_ratio) -> np.ndarray:
+        """
+        Calculate screening scores for many results at once (see calculate_score).
+
+        Args:
+            days_since: Days since latest HVE for each result
+            hve_count: Number of HVE events for each result
+            volume_ratio: Current volume relative to max (percent) for each result
+
+        Returns:
+            Array of scores rounded to 2 decimals (0.0 where an input is missing or not numeric)
+        """
+        days_since = _score_inputs(days_since)
+        hve_count = _score_inputs(hve_count)
+        volume_ratio = _score_inputs(volume_ratio)
+
+        # Recency score (0-50 points): full within 30 days, then decays to 25 at
+        # 90 days, 5 at 365 days and 0 after two years
+        recency_score = np.select(
+            [days_since <= 30, days_since <= 90, days_since <= 365],
+            [50.0,
+             50 * (1 - (days_since - 30) / 60 * 0.5),
+             25 * (1 - (days_since - 90) / 275 * 0.8)],
+            default=5 * np.maximum(0, 1 - (days_since - 365) / 365)
+        )
+
+        # Frequency score (0-30 points): more HVE events indicates consistent activity;
+        # volume ratio score (0-20 points): 100% of the max volume earns the full 20
+        frequency_score = np.minimum(30, hve_count * 3)
+        volume_score = np.minimum(20, volume_ratio / 5)
+
+        scores = np.round(recency_score + frequency_score + volume_score, 2)
+        missing = np.isnan(days_since) | np.isnan(hve_count) | np.isnan(volume_ratio)
+        return np.where(missing, 0.0, scores)
+
     def enrich_results_with_scores(self, results: List[Dict]) -> List[Dict]:
         """
         Add screening scores to results and re-sort by score.
@@ -472,8 +544,16 @@ class HVEScreener:
         Returns:
             Enriched results sorted by score (descending)
         """
-        for result in results:
-            result['score'] = self.calculate_score(result)
+        if not results:
+            return results
+
+        scores = self.compute_scores(
+            [result.get('days_since_latest_hve', 9999) for result in results],
+            [result.get('hve_count', 0) for result in results],
+            [result.get('volume_ratio_to_max', 0) for result in results]
+        )
+        for result, score in zip(results, scores.tolist()):
+            result['score'] = score
 
         # Sort by score (highest first)
         results.sort(key=lambda x: x['score'], reverse=True)
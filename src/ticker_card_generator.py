@@ -6,10 +6,12 @@ Generates individual ticker cards showing all HVE and HV1Y events
 across all timeframes (daily, weekly, monthly).
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,60 +49,73 @@ class TickerCardGenerator:
             if results_df is None or results_df.empty:
                 continue
 
-            for _, row in results_df.iterrows():
-                ticker = row['ticker']
-
-                if ticker not in ticker_data:
-                    ticker_data[ticker] = {}
-
-                ticker_data[ticker][timeframe] = row.to_dict()
+            for record in results_df.to_dict(orient='records'):
+                ticker_data.setdefault(record['ticker'], {})[timeframe] = record
 
         logger.info(f"Collected data for {len(ticker_data)} tickers across all timeframes")
         return ticker_data
 
     def format_volume(self, volume) -> str:
         """Format volume with commas."""
-        if pd.isna(volume):
+        # NaN/NaT are the only values not equal to themselves
+        if volume is None or volume is pd.NA or volume != volume:
             return "N/A"
         return f"{int(volume):,}"
 
-    def format_date(self, date) -> str:
-        """Format date as YYYY-MM-DD."""
-        if pd.isna(date):
-            return "N/A"
-        if isinstance(date, str):
-            return date
-        return date.strftime('%Y-%m-%d')
-
-    def calculate_days_ago(self, event_date, latest_date) -> str:
-        """Calculate and format days ago from an event."""
-        if pd.isna(event_date) or pd.isna(latest_date):
-            return ""
+    def _format_event_lines(self, events: List[Dict], latest_date, hve_date=None) -> List[str]:
+        """
+        Format a list of volume events as numbered card lines.
 
-        if isinstance(event_date, str):
-            event_date = pd.Timestamp(event_date)
-        if isinstance(latest_date, str):
-            latest_date = pd.Timestamp(latest_date)
+        Dates, volumes and day offsets are formatted column-wise for the whole
+        event list rather than one event at a time.
 
-        days = (latest_date - event_date).days
-        return f"({days} days ago)"
+        Args:
+            events: List of {'date', 'volume'} event dictionaries
+            latest_date: Latest data date used for the "days ago" column
+            hve_date: If given, events on this date are flagged "[Also HVE]"
 
-    def generate_card_text(self, ticker: str, timeframe_data: Dict) -> str:
+        Returns:
+            List of formatted lines, one per event
+        """
+        dates = pd.DatetimeIndex(pd.to_datetime([event['date'] for event in events]))
+        date_strs = ['N/A' if d is None or d != d else d for d in dates.strftime('%Y-%m-%d')]
+        volume_strs = [self.format_volume(event['volume']) for event in events]
+
+        if pd.isna(latest_date):
+            days_ago = [""] * len(events)
+        else:
+            day_counts = (pd.Timestamp(latest_date) - dates).days
+            days_ago = ["" if d != d else f"({int(d)} days ago)" for d in day_counts]
+
+        if hve_date is None or pd.isna(hve_date):
+            flags = [""] * len(events)
+        else:
+            flags = np.where(dates == pd.Timestamp(hve_date), "  [Also HVE]", "").tolist()
+
+        return [f"  {idx}. {d}  Volume: {v}  {ago}{flag}"
+                for idx, (d, v, ago, flag) in enumerate(zip(date_strs, volume_strs, days_ago, flags), 1)]
+
+    def generate_card_text(self, ticker: str, timeframe_data: Dict,
+                           generated_at: Optional[str] = None) -> str:
         """
         Generate text content for a ticker card.
 
         Args:
             ticker: Ticker symbol
             timeframe_data: Dictionary mapping timeframe -> data
+            generated_at: Timestamp string for the header (defaults to now)
 
         Returns:
             Formatted text content for the card
         """
+        if generated_at is None:
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
         lines = []
         lines.append("=" * 80)
         lines.append(f"TICKER CARD: {ticker}")
         lines.append("=" * 80)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Generated: {generated_at}")
         lines.append("")
 
         # Process each timeframe in order: daily, weekly, monthly
@@ -120,12 +135,7 @@ class TickerCardGenerator:
 
             all_hve_details = data.get('all_hve_details', [])
             if all_hve_details:
-                latest_date = data.get('latest_date')
-                for idx, event in enumerate(all_hve_details, 1):
-                    date_str = self.format_date(event['date'])
-                    volume_str = self.format_volume(event['volume'])
-                    days_ago = self.calculate_days_ago(event['date'], latest_date)
-                    lines.append(f"  {idx}. {date_str}  Volume: {volume_str}  {days_ago}")
+                lines.extend(self._format_event_lines(all_hve_details, data.get('latest_date')))
             else:
                 lines.append("  No HVE events found")
 
@@ -137,19 +147,9 @@ class TickerCardGenerator:
 
                 all_hv1y_details = data.get('all_hv1y_details', [])
                 if all_hv1y_details:
-                    latest_date = data.get('latest_date')
-                    hve_date = data.get('hve_date')
-
-                    for idx, event in enumerate(all_hv1y_details, 1):
-                        date_str = self.format_date(event['date'])
-                        volume_str = self.format_volume(event['volume'])
-                        days_ago = self.calculate_days_ago(event['date'], latest_date)
-
-                        # Check if this HV1Y event is also an HVE
-                        is_hve = (event['date'] == hve_date)
-                        hve_flag = "  [Also HVE]" if is_hve else ""
-
-                        lines.append(f"  {idx}. {date_str}  Volume: {volume_str}  {days_ago}{hve_flag}")
+                    # Flag HV1Y events that are also the HVE
+                    lines.extend(self._format_event_lines(all_hv1y_details, data.get('latest_date'),
+                                                          hve_date=data.get('hve_date')))
                 else:
                     lines.append("  No HV1Y events found")
 
@@ -185,19 +185,39 @@ class TickerCardGenerator:
 
         return "\n".join(lines)
 
-    def generate_card(self, ticker: str, timeframe_data: Dict) -> Path:
+    def generate_card(self, ticker: str, timeframe_data: Dict,
+                      generated_at: Optional[str] = None) -> Path:
         """
         Generate a ticker card file.
 
         Args:
             ticker: Ticker symbol
             timeframe_data: Dictionary mapping timeframe -> data
+            generated_at: Timestamp string for the header (defaults to now)
 
         Returns:
             Path to the generated card file
         """
         try:
-            card_text = self.generate_card_text(ticker, timeframe_data)
+            card_text = self.generate_card_text(ticker, timeframe_data, generated_at)
+        except Exception as e:
+            logger.error(f"Error generating card for {ticker}: {e}")
+            return None
+
+        return self._write_card(ticker, card_text)
+
+    def _write_card(self, ticker: str, card_text: str) -> Optional[Path]:
+        """
+        Write card text to the ticker's card file.
+
+        Args:
+            ticker: Ticker symbol
+            card_text: Formatted card content
+
+        Returns:
+            Path to the written card file, or None on failure
+        """
+        try:
             card_file = self.ticker_cards_dir / f"{ticker}.txt"
 
             with open(card_file, 'w') as f:
@@ -207,15 +227,21 @@ class TickerCardGenerator:
             return card_file
 
         except Exception as e:
-            logger.error(f"Error generating card for {ticker}: {e}")
+            logger.error(f"Error writing card for {ticker}: {e}")
             return None
 
-    def generate_all_cards(self, all_results: Dict[str, pd.DataFrame]) -> int:
+    def generate_all_cards(self, all_results: Dict[str, pd.DataFrame],
+                           max_workers: Optional[int] = None) -> int:
         """
         Generate ticker cards for all tickers in the results.
 
+        Card text is built sequentially; the file writes are I/O-bound and run
+        on a thread pool so the per-file open/write/close syscalls overlap.
+
         Args:
             all_results: Dictionary mapping timeframe -> results DataFrame
+            max_workers: Number of threads used to write card files; None uses the
+                ThreadPoolExecutor default
 
         Returns:
             Number of cards generated
@@ -223,12 +249,24 @@ class TickerCardGenerator:
         # Collect data for all tickers
         ticker_data = self.collect_ticker_data(all_results)
 
-        # Generate a card for each ticker
-        cards_generated = 0
+        # One timestamp for the whole batch
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # Build the text for each card
+        cards = []
         for ticker, timeframe_data in ticker_data.items():
-            card_file = self.generate_card(ticker, timeframe_data)
-            if card_file:
-                cards_generated += 1
+            try:
+                cards.append((ticker, self.generate_card_text(ticker, timeframe_data, generated_at)))
+            except Exception as e:
+                logger.error(f"Error generating card for {ticker}: {e}")
+
+        # Write all cards concurrently
+        cards_generated = 0
+        if cards:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for card_file in executor.map(lambda card: self._write_card(*card), cards):
+                    if card_file:
+                        cards_generated += 1
 
         logger.info(f"Generated {cards_generated} ticker cards in {self.ticker_cards_dir}")
         return cards_generated
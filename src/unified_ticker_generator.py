@@ -11,42 +11,100 @@ Core Requirements:
 - Generate 3 file types: combined_tickers_*.csv, combined_info_tickers_*.csv, combined_info_tickers_clean_*.csv
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
+import hashlib
 import logging
+import re
+import shutil
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional: multithreaded CSV parser, Parquet cache and Arrow string kernels
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# Bump when the boolean-universe transformation changes so existing Parquet caches are rebuilt
+UNIVERSE_CACHE_VERSION = 1
+
+_CHOICE_SEPARATOR = re.compile(r'\s*-\s*')
+_CHOICE_NUMBER = re.compile(r'[0-9]+')
+
+
+# Free-text columns of the TradingView universe export; declaring them skips type inference
+UNIVERSE_TEXT_COLUMNS = {
+    'Symbol': str,
+    'Description': str,
+    'Market capitalization - Currency': str,
+    'Sector': str,
+    'Industry': str,
+    'Exchange': str,
+    'Analyst Rating': str,
+    'Index': str,
+}
+
+
+def _read_csv(path, dtype=None):
+    """Read a ticker CSV, using the PyArrow parser when it is installed."""
+    return pd.read_csv(path, engine=CSV_ENGINE, dtype=dtype)
+
+
+@lru_cache(maxsize=64)
+def _parse_dash_choices(user_choice: str) -> tuple:
+    """Parse a dash-separated choice string ('1-2', ' 3 - 4 ') into a tuple of ints, skipping non-numeric parts."""
+    return tuple(int(part) for part in _CHOICE_SEPARATOR.split(user_choice.strip())
+                 if _CHOICE_NUMBER.fullmatch(part))
+
 
 class UnifiedTickerGenerator:
-    """Generates all ticker files for any user choice format."""
+    """
+    Generates all ticker files for any user choice format.
+
+    When pyarrow is installed, the boolean-enhanced universe is also cached in
+    TICKERS_DIR as tradingview_universe_bool.parquet, next to a
+    tradingview_universe_bool.stamp file holding UNIVERSE_CACHE_VERSION and the
+    SHA-256 of the root tradingview_universe.csv. The cache is reused only when
+    both match; otherwise the cache and stamp are deleted and rebuilt.
+    """
+    
+    # Choice mapping: choice -> boolean column filters (shared by all instances)
+    CHOICE_FILTERS = {
+        0: (),                          # Full universe (no filtering)
+        1: ('SP500',),                  # S&P 500 only
+        2: ('NASDAQ100',),              # NASDAQ 100 only  
+        3: ('NASDAQComposite',),        # All NASDAQ
+        4: ('Russell1000',),            # Russell 1000
+        5: ('SP500', 'NASDAQ100'),      # S&P 500 + NASDAQ 100
+        6: ('SP500', 'NASDAQComposite'), # S&P 500 + All NASDAQ
+        7: ('SP500', 'Russell1000'),    # S&P 500 + Russell 1000
+        8: ('NASDAQ100', 'NASDAQComposite'), # NASDAQ 100 + All NASDAQ
+        9: ('NASDAQ100', 'Russell1000'), # NASDAQ 100 + Russell 1000
+        10: ('NASDAQComposite', 'Russell1000'), # All NASDAQ + Russell 1000
+        11: ('SP500', 'NASDAQ100', 'NASDAQComposite'), # Major indexes
+        12: ('SP500', 'NASDAQ100', 'Russell1000'), # Major indexes
+        13: ('SP500', 'NASDAQComposite', 'Russell1000'), # Major indexes
+        14: ('NASDAQ100', 'NASDAQComposite', 'Russell1000'), # Tech heavy
+        15: ('SP500', 'NASDAQ100', 'Russell1000', 'NASDAQComposite'), # All major
+    }
     
     def __init__(self, config):
         """Initialize with config object containing directories."""
         self.config = config
         self.tickers_dir = Path(config.directories['TICKERS_DIR'])
         self.tickers_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Choice mapping: choice -> list of boolean column filters
-        self.choice_filters = {
-            0: [],                          # Full universe (no filtering)
-            1: ['SP500'],                   # S&P 500 only
-            2: ['NASDAQ100'],               # NASDAQ 100 only  
-            3: ['NASDAQComposite'],         # All NASDAQ
-            4: ['Russell1000'],             # Russell 1000
-            5: ['SP500', 'NASDAQ100'],      # S&P 500 + NASDAQ 100
-            6: ['SP500', 'NASDAQComposite'], # S&P 500 + All NASDAQ
-            7: ['SP500', 'Russell1000'],    # S&P 500 + Russell 1000
-            8: ['NASDAQ100', 'NASDAQComposite'], # NASDAQ 100 + All NASDAQ
-            9: ['NASDAQ100', 'Russell1000'], # NASDAQ 100 + Russell 1000
-            10: ['NASDAQComposite', 'Russell1000'], # All NASDAQ + Russell 1000
-            11: ['SP500', 'NASDAQ100', 'NASDAQComposite'], # Major indexes
-            12: ['SP500', 'NASDAQ100', 'Russell1000'], # Major indexes
-            13: ['SP500', 'NASDAQComposite', 'Russell1000'], # Major indexes
-            14: ['NASDAQ100', 'NASDAQComposite', 'Russell1000'], # Tech heavy
-            15: ['SP500', 'NASDAQ100', 'Russell1000', 'NASDAQComposite'], # All major
-        }
+        self.universe_bool_file = self.tickers_dir / 'tradingview_universe_bool.csv'
+        self.universe_cache_file = self.tickers_dir / 'tradingview_universe_bool.parquet'
+        self.universe_stamp_file = self.tickers_dir / 'tradingview_universe_bool.stamp'
+        self._universe_df = None
     
     def clean_ticker_name(self, ticker: str) -> Optional[str]:
         """
@@ -79,11 +137,15 @@ class UnifiedTickerGenerator:
         Generate all ticker files for any user choice format.
         
         Args:
-            user_choice (int, str): User choice (0, 1, "1;2", etc.)
+            user_choice (int, str, tuple): User choice (0, 1, "1-2", (1, 2), etc.)
             
         Returns:
             bool: True if successful, False otherwise
         """
+        if isinstance(user_choice, tuple):
+            # Already-parsed choices name their combined files like '1-2'
+            user_choice = '-'.join(str(choice) for choice in user_choice)
+
         try:
             print(f"\n{'='*60}")
             print("UNIFIED TICKER FILE GENERATION")
@@ -133,25 +195,85 @@ class UnifiedTickerGenerator:
             logger.error(f"Error generating ticker files: {e}")
             return False
     
+    def _universe(self):
+        """Return the boolean-enhanced universe, parsing the CSV at most once per generation run."""
+        if self._universe_df is None:
+            self._universe_df = _read_csv(self.universe_bool_file)
+        return self._universe_df
+    
+    def _universe_source_stamp(self, root_universe):
+        """Identify the root universe file by cache version and content hash."""
+        digest = hashlib.sha256()
+        with open(root_universe, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return f"v{UNIVERSE_CACHE_VERSION}:{digest.hexdigest()}"
+    
+    def _clear_universe_cache(self):
+        """Delete the Parquet universe cache and its stamp file."""
+        for cache_file in (self.universe_cache_file, self.universe_stamp_file):
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove {cache_file}: {e}")
+    
+    def _load_cached_universe(self, source_stamp):
+        """Load the Parquet universe cache if it was built from the current root universe."""
+        if not HAS_PYARROW:
+            return False
+        try:
+            if not (self.universe_bool_file.exists() and self.universe_cache_file.exists()
+                    and self.universe_stamp_file.exists()):
+                self._clear_universe_cache()
+                return False
+            if self.universe_stamp_file.read_text().strip() != source_stamp:
+                self._clear_universe_cache()
+                return False
+            self._universe_df = pd.read_parquet(self.universe_cache_file, engine='pyarrow')
+            return True
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable universe cache: {e}")
+            self._clear_universe_cache()
+            return False
+    
+    def _save_universe_cache(self, df, source_stamp):
+        """Persist the boolean-enhanced universe as Parquet, stamped with its source version."""
+        if not HAS_PYARROW:
+            return
+        try:
+            df.to_parquet(self.universe_cache_file, engine='pyarrow', compression='zstd', index=False)
+            self.universe_stamp_file.write_text(source_stamp)
+        except Exception as e:
+            logger.warning(f"Could not write universe cache: {e}")
+            self._clear_universe_cache()
+    
     def _ensure_universe_data(self):
-        """Force regeneration of TradingView universe data with boolean columns."""
-        universe_bool_file = self.tickers_dir / 'tradingview_universe_bool.csv'
-        
-        # Always regenerate - remove existing file if present
-        if universe_bool_file.exists():
-            universe_bool_file.unlink()
-            print(f"🔄 Removed existing universe data for regeneration")
+        """Regenerate TradingView universe data with boolean columns unless the cached copy is current."""
+        universe_bool_file = self.universe_bool_file
+        self._universe_df = None
         
         # Create universe data from root tradingview_universe.csv
         root_universe = Path('tradingview_universe.csv')
         if not root_universe.exists():
             print(f"❌ Missing root TradingView universe file: {root_universe}")
+            self._clear_universe_cache()
             return False
         
+        # Reuse the Parquet cache when the root universe has not changed since it was built
+        source_stamp = self._universe_source_stamp(root_universe)
+        if self._load_cached_universe(source_stamp):
+            print(f"♻️  Root universe unchanged, using cached universe data ({len(self._universe_df)} tickers)")
+            return True
+        
+        # Regenerate - remove existing file if present
+        if universe_bool_file.exists():
+            universe_bool_file.unlink()
+            print(f"🔄 Removed existing universe data for regeneration")
+        
         print(f"🔄 Creating boolean-enhanced universe data...")
         try:
             # Read root universe
-            df = pd.read_csv(root_universe)
+            df = _read_csv(root_universe, dtype=UNIVERSE_TEXT_COLUMNS)
             print(f"📊 Loaded {len(df)} tickers from root universe")
             
             # Standardize to 'ticker' column name
@@ -162,12 +284,12 @@ class UnifiedTickerGenerator:
             print("🧹 Cleaning ticker names...")
             original_count = len(df)
             
-            # Apply ticker cleaning
-            df['cleaned_ticker'] = df['ticker'].apply(self.clean_ticker_name)
-            # Remove rows where ticker should be excluded (None values)
-            df = df.dropna(subset=['cleaned_ticker'])
-            df['ticker'] = df['cleaned_ticker']
-            df.drop('cleaned_ticker', axis=1, inplace=True)
+            # Apply ticker cleaning (vectorized equivalent of clean_ticker_name)
+            tickers = df['ticker'].astype('string').str.strip()
+            # Remove rows where ticker should be excluded (missing or containing '/')
+            keep = tickers.notna() & ~tickers.str.contains('/', regex=False)
+            df = df.loc[keep].copy()
+            df['ticker'] = tickers[keep].str.replace('.', '-', regex=False).astype(str)
             
             filtered_count = original_count - len(df)
             print(f"📊 Original tickers: {original_count}")
@@ -191,11 +313,13 @@ class UnifiedTickerGenerator:
             if 'index' in df.columns:
                 df_bool = self._create_boolean_columns(df)
                 df_bool.to_csv(universe_bool_file, index=False)
+                self._save_universe_cache(df_bool, source_stamp)
                 print(f"✅ Created boolean-enhanced universe: {len(df_bool)} tickers, {len(df_bool.columns)} columns")
                 return True
             else:
                 print(f"⚠️  No index column found, using basic universe data")
                 df.to_csv(universe_bool_file, index=False)
+                self._save_universe_cache(df, source_stamp)
                 return True
                 
         except Exception as e:
@@ -206,86 +330,112 @@ class UnifiedTickerGenerator:
         """Create boolean columns from Index data."""
         # Copy original dataframe
         df_enhanced = df.copy()
+        boolean_frames = []
         
         # Parse indexes and create boolean columns
-        index_counts = {}
-        
-        for idx, row in df.iterrows():
-            if pd.notna(row.get('index')):
-                # Split by comma (not semicolon) since the data uses comma-separated values
-                indexes = str(row['index']).split(',')
-                for index_name in indexes:
-                    index_name = index_name.strip()
-                    if index_name:
-                        # Clean index name for column - more comprehensive cleaning
-                        col_name = (index_name
-                                   .replace(' ', '')
-                                   .replace('&', '')
-                                   .replace('-', '')
-                                   .replace('.', '')
-                                   .replace('/', '')
-                                   .replace('(', '')
-                                   .replace(')', ''))
-                        
-                        # Initialize column if not exists
-                        if col_name not in df_enhanced.columns:
-                            df_enhanced[col_name] = False
-                            index_counts[col_name] = 0
-                        
-                        # Set boolean value
-                        df_enhanced.at[idx, col_name] = True
-                        index_counts[col_name] += 1
-        
+        index_names = self._split_index_names(df['index'])
+
+        # Clean index name for column - more comprehensive cleaning
+        col_names = index_names.str.replace(r'[ &\-./()]', '', regex=True)
+
+        # One column per cleaned index name, in order of first appearance
+        index_counts = col_names.value_counts(sort=False).reindex(pd.unique(col_names)).to_dict()
+        if index_counts:
+            boolean_frames.append(pd.get_dummies(col_names)
+                                  .groupby(level=0).any()
+                                  .reindex(index=df.index, columns=list(index_counts), fill_value=False))
+
         print(f"🏗️  Created {len(index_counts)} boolean index columns")
         if index_counts:
             top_indexes = sorted(index_counts.items(), key=lambda x: x[1], reverse=True)[:10]
             print(f"🎯 Top indexes: {', '.join([f'{name}({count})' for name, count in top_indexes])}")
 
         # Add boolean columns for exchange categories
-        exchange_counts = {}
-        if 'exchange' in df_enhanced.columns:
-            exchanges = df_enhanced['exchange'].dropna().unique()
-            for exchange in exchanges:
-                if pd.notna(exchange) and exchange != '':
-                    col_name = f'exchange_{exchange}'
-                    df_enhanced[col_name] = (df_enhanced['exchange'] == exchange)
-                    exchange_counts[col_name] = df_enhanced[col_name].sum()
+        if 'exchange' in df.columns:
+            exchange_dummies = self._one_hot_columns(df['exchange'], 'exchange')
+            exchange_counts = exchange_dummies.sum().to_dict()
+            boolean_frames.append(exchange_dummies)
 
             print(f"🏗️  Created {len(exchange_counts)} boolean exchange columns")
             if exchange_counts:
                 print(f"🎯 Exchanges: {', '.join([f'{name}({count})' for name, count in exchange_counts.items()])}")
 
         # Add boolean columns for analyst rating categories
-        rating_counts = {}
-        if 'analyst rating' in df_enhanced.columns:
-            ratings = df_enhanced['analyst rating'].dropna().unique()
-            for rating in ratings:
-                if pd.notna(rating) and rating != '':
-                    # Clean rating name for column (handle spaces and special chars)
-                    clean_rating = rating.replace(' ', '_').replace('-', '_')
-                    col_name = f'rating_{clean_rating}'
-                    df_enhanced[col_name] = (df_enhanced['analyst rating'] == rating)
-                    rating_counts[col_name] = df_enhanced[col_name].sum()
+        if 'analyst rating' in df.columns:
+            # Clean rating name for column (handle spaces and special chars)
+            clean_ratings = df['analyst rating'].str.replace(r'[ \-]', '_', regex=True)
+            rating_dummies = self._one_hot_columns(clean_ratings, 'rating')
+            rating_counts = rating_dummies.sum().to_dict()
+            boolean_frames.append(rating_dummies)
 
             print(f"🏗️  Created {len(rating_counts)} boolean rating columns")
             if rating_counts:
                 print(f"🎯 Ratings: {', '.join([f'{name}({count})' for name, count in rating_counts.items()])}")
 
-        return df_enhanced
+        if boolean_frames:
+            df_enhanced = pd.concat([df_enhanced] + boolean_frames, axis=1)
+
+        return self._shrink_dtypes(df_enhanced)
+    
+    def _shrink_dtypes(self, df):
+        """
+        Narrow column dtypes to cut the universe's memory footprint.
+
+        Low-cardinality text columns (exchange, sector, rating, ...) become categoricals and
+        integer columns are downcast. Floats are left as float64 so written values do not change.
+        """
+        for col in df.columns:
+            series = df[col]
+            if col == 'ticker' or series.dtype == bool:
+                continue
+            if pd.api.types.is_integer_dtype(series):
+                df[col] = pd.to_numeric(series, downcast='integer')
+            elif (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)) and len(df):
+                if series.nunique(dropna=True) / len(df) < 0.5:
+                    df[col] = series.astype('category')
+        return df
+    
+    def _split_index_names(self, index_values):
+        """
+        Split the comma-separated index column into one stripped name per row entry.
+
+        Returns a Series labelled by the originating row; empty names are dropped.
+        Uses Arrow compute kernels when pyarrow is available.
+        """
+        # Split by comma (not semicolon) since the data uses comma-separated values
+        values = index_values.dropna().astype(str)
+        if HAS_PYARROW:
+            lists = pc.split_pattern(pa.array(values.to_numpy(dtype=object), type=pa.string()), pattern=',')
+            names = pc.utf8_trim_whitespace(lists.flatten())
+            rows = values.index.to_numpy()[pc.list_parent_indices(lists).to_numpy()]
+            names = pd.Series(names.to_numpy(zero_copy_only=False), index=rows, dtype=object)
+        else:
+            names = values.str.split(',').explode().str.strip()
+        return names[names != '']
+    
+    def _one_hot_columns(self, values, prefix):
+        """
+        One-hot encode a category column into '{prefix}_{value}' boolean columns.
+
+        Missing and empty values get no column; columns follow first-appearance order.
+        """
+        present = values[values.notna() & (values != '')]
+        columns = [f'{prefix}_{value}' for value in pd.unique(present)]
+        return (pd.get_dummies(present, prefix=prefix, prefix_sep='_', dtype=bool)
+                .reindex(index=values.index, columns=columns, fill_value=False))
     
     def _parse_user_choice(self, user_choice):
         """Parse user choice into list of individual choices."""
         if user_choice == 0 or user_choice == '0':
             return [0]
         
+        # Handle already-parsed choices, e.g. a cached tuple of ints
+        if isinstance(user_choice, tuple):
+            return list(user_choice)
+
         # Handle string with dashes
         if isinstance(user_choice, str) and '-' in user_choice:
-            try:
-                choices = [int(c.strip()) for c in user_choice.split('-') if c.strip().isdigit()]
-                return choices
-            except ValueError:
-                print(f"❌ Invalid choice format: {user_choice}")
-                return []
+            return list(_parse_dash_choices(user_choice))
         
         # Handle single choice
         try:
@@ -304,44 +454,29 @@ class UnifiedTickerGenerator:
             
             # Standard TradingView filtering mode
             # Load universe data
-            universe_file = self.tickers_dir / 'tradingview_universe_bool.csv'
+            universe_file = self.universe_bool_file
             if not universe_file.exists():
                 print(f"❌ Universe boolean file not found: {universe_file}")
                 return False
             
-            df = pd.read_csv(universe_file)
+            df = self._universe()
             
             # Apply filtering
             filtered_df = self._filter_by_choice(df, choice)
             if filtered_df is None:
                 return False
             
-            # Generate 3 file types - force regeneration by removing existing files
-            choice_str = str(choice)
-            
-            # Remove existing files if they exist
-            files_to_regenerate = [
-                self.tickers_dir / f'combined_tickers_{choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_{choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_clean_{choice_str}.csv'
-            ]
-            
-            for file_path in files_to_regenerate:
-                if file_path.exists():
-                    file_path.unlink()
+            # Generate 3 file types - writes truncate and overwrite any existing files
+            ticker_file, info_file, clean_file = self._expected_files(choice)
             
             # 1. combined_tickers_{choice}.csv (ticker column only)
-            tickers_only = pd.DataFrame({'ticker': filtered_df['ticker'].tolist()})
-            ticker_file = self.tickers_dir / f'combined_tickers_{choice_str}.csv'
-            tickers_only.to_csv(ticker_file, index=False)
+            self._write_tickers(ticker_file, filtered_df['ticker'].tolist())
             
             # 2. combined_info_tickers_{choice}.csv (all columns)
-            info_file = self.tickers_dir / f'combined_info_tickers_{choice_str}.csv'
             filtered_df.to_csv(info_file, index=False)
             
-            # 3. combined_info_tickers_clean_{choice}.csv (same as info)
-            clean_file = self.tickers_dir / f'combined_info_tickers_clean_{choice_str}.csv'
-            filtered_df.to_csv(clean_file, index=False)
+            # 3. combined_info_tickers_clean_{choice}.csv (same as info - copy the bytes, don't re-serialize)
+            shutil.copyfile(info_file, clean_file)
             
             print(f"✅ Force-generated files for choice {choice}: {len(filtered_df)} tickers")
             return True
@@ -354,88 +489,89 @@ class UnifiedTickerGenerator:
         """Force regenerate combined files for multi-choice selections."""
         try:
             # Combine tickers from all individual choice files
-            all_tickers = []
-            all_info_data = []
+            ticker_arrays = []
+            source_choices = []
+            info_files = []
             
             print(f"  • Combining tickers from individual choice files...")
             
             for choice in choices:
                 # Load tickers from each individual choice file
-                choice_file = self.tickers_dir / f'combined_tickers_{choice}.csv'
-                info_file = self.tickers_dir / f'combined_info_tickers_{choice}.csv'
+                choice_file, info_file, _ = self._expected_files(choice)
                 
                 if choice_file.exists():
-                    choice_df = pd.read_csv(choice_file)
-                    choice_tickers = choice_df['ticker'].tolist()
-                    all_tickers.extend(choice_tickers)
+                    choice_tickers = self._read_tickers(choice_file)
+                    ticker_arrays.append(choice_tickers)
+                    source_choices.append(choice)
                     print(f"    - Choice {choice}: {len(choice_tickers)} tickers")
                     
-                    # Also load info data if available
+                    # Also use info data if available
                     if info_file.exists():
-                        info_df = pd.read_csv(info_file)
-                        all_info_data.append(info_df)
+                        info_files.append(info_file)
                 else:
                     print(f"    ⚠️  Choice file not found: {choice_file}")
             
-            if not all_tickers:
+            all_tickers = np.concatenate(ticker_arrays) if ticker_arrays else np.empty(0, dtype=object)
+            if len(all_tickers) == 0:
                 print(f"❌ No tickers found from any choice files")
                 return False
             
-            # Remove duplicates while preserving order
-            unique_tickers = list(dict.fromkeys(all_tickers))
+            # Remove duplicates while preserving order (hash-based, first occurrence wins)
+            unique_tickers = pd.unique(all_tickers).tolist()
             print(f"  • Combined {len(all_tickers)} total tickers -> {len(unique_tickers)} unique tickers")
             
+            ticker_file, info_file, clean_file = self._expected_files(combined_choice_str)
+            
+            # Short-circuit: the union of a single duplicate-free source is that source itself,
+            # so copy its files instead of re-parsing and re-serializing the info frame
+            if (len(set(source_choices)) == 1 and len(info_files) > 0
+                    and len(unique_tickers) == len(ticker_arrays[0])):
+                source_ticker_file, source_info_file, _ = self._expected_files(source_choices[0])
+                shutil.copyfile(source_ticker_file, ticker_file)
+                shutil.copyfile(source_info_file, info_file)
+                shutil.copyfile(info_file, clean_file)
+                print(f"✅ Force-generated combined files for {combined_choice_str}: {len(unique_tickers)} tickers")
+                return True
+            
             # Combine info data
+            all_info_data = [_read_csv(path) for path in info_files]
             if all_info_data:
                 # Concatenate all info dataframes and remove duplicates based on ticker
                 combined_info_df = pd.concat(all_info_data, ignore_index=True)
                 combined_info_df = combined_info_df.drop_duplicates(subset=['ticker'], keep='first')
                 
                 # Ensure all unique tickers are represented
-                missing_tickers = set(unique_tickers) - set(combined_info_df['ticker'])
+                present_tickers = set(combined_info_df['ticker'])
+                missing_tickers = [ticker for ticker in unique_tickers if ticker not in present_tickers]
                 if missing_tickers:
                     print(f"  • Adding {len(missing_tickers)} missing tickers with minimal data")
-                    for ticker in missing_tickers:
-                        minimal_row = {'ticker': ticker}
-                        # Fill other columns with default values
-                        for col in combined_info_df.columns:
-                            if col != 'ticker':
-                                minimal_row[col] = False if col.isupper() else ''
-                        combined_info_df = pd.concat([combined_info_df, pd.DataFrame([minimal_row])], ignore_index=True)
+                    # Fill other columns with default values, appending all missing rows at once
+                    missing_df = pd.DataFrame({
+                        col: missing_tickers if col == 'ticker' else [False if col.isupper() else ''] * len(missing_tickers)
+                        for col in combined_info_df.columns
+                    })
+                    combined_info_df = pd.concat([combined_info_df, missing_df], ignore_index=True)
                 
-                # Sort by the order of unique_tickers
-                ticker_order = {ticker: i for i, ticker in enumerate(unique_tickers)}
-                combined_info_df['_sort_order'] = combined_info_df['ticker'].map(ticker_order)
-                combined_info_df = combined_info_df.sort_values('_sort_order').drop('_sort_order', axis=1)
+                # Order rows by unique_tickers with a hash reindex instead of a sort
+                columns = combined_info_df.columns
+                combined_info_df = (combined_info_df.set_index('ticker')
+                                    .reindex(unique_tickers)
+                                    .rename_axis('ticker')
+                                    .reset_index()[columns])
                 
             else:
                 # Create minimal info dataframe
                 combined_info_df = pd.DataFrame({'ticker': unique_tickers})
             
-            # Force regeneration by removing existing files
-            files_to_regenerate = [
-                self.tickers_dir / f'combined_tickers_{combined_choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_{combined_choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_clean_{combined_choice_str}.csv'
-            ]
-            
-            for file_path in files_to_regenerate:
-                if file_path.exists():
-                    file_path.unlink()
-            
             # Generate 3 file types with combined choice name
             # 1. combined_tickers_{choice}.csv (ticker column only)
-            tickers_only = pd.DataFrame({'ticker': unique_tickers})
-            ticker_file = self.tickers_dir / f'combined_tickers_{combined_choice_str}.csv'
-            tickers_only.to_csv(ticker_file, index=False)
+            self._write_tickers(ticker_file, unique_tickers)
             
             # 2. combined_info_tickers_{choice}.csv (all columns)
-            info_file = self.tickers_dir / f'combined_info_tickers_{combined_choice_str}.csv'
             combined_info_df.to_csv(info_file, index=False)
             
-            # 3. combined_info_tickers_clean_{choice}.csv (same as info)
-            clean_file = self.tickers_dir / f'combined_info_tickers_clean_{combined_choice_str}.csv'
-            combined_info_df.to_csv(clean_file, index=False)
+            # 3. combined_info_tickers_clean_{choice}.csv (same as info - copy the bytes, don't re-serialize)
+            shutil.copyfile(info_file, clean_file)
             
             print(f"✅ Force-generated combined files for {combined_choice_str}: {len(unique_tickers)} tickers")
             return True
@@ -469,7 +605,7 @@ class UnifiedTickerGenerator:
             print(f"  📂 Loading individual file: {ticker_file_path}")
             
             # Load ticker file
-            df_tickers = pd.read_csv(ticker_file_path)
+            df_tickers = _read_csv(ticker_file_path)
             
             # Ensure 'ticker' column exists
             if 'ticker' not in df_tickers.columns:
@@ -487,32 +623,27 @@ class UnifiedTickerGenerator:
             print(f"  📊 Loaded {len(tickers)} tickers from individual file")
             
             # Load universe data for enrichment
-            universe_file = self.tickers_dir / 'tradingview_universe_bool.csv'
+            universe_file = self.universe_bool_file
             if universe_file.exists():
-                universe_df = pd.read_csv(universe_file)
-                
-                # Create enriched dataframe by matching tickers
-                enriched_data = []
-                matched_count = 0
-                
-                for ticker in tickers:
-                    # Find matching row in universe
-                    universe_match = universe_df[universe_df['ticker'] == ticker]
-                    
-                    if not universe_match.empty:
-                        enriched_data.append(universe_match.iloc[0])
-                        matched_count += 1
-                    else:
-                        # Create minimal row for ticker not in universe
-                        minimal_row = pd.Series({'ticker': ticker})
-                        # Fill missing columns with default values
-                        for col in universe_df.columns:
-                            if col not in minimal_row.index:
-                                minimal_row[col] = False if col.isupper() else ''
-                        enriched_data.append(minimal_row)
+                universe_df = self._universe()
                 
-                if enriched_data:
-                    filtered_df = pd.DataFrame(enriched_data).reset_index(drop=True)
+                # Create enriched dataframe by joining tickers against the universe on a ticker index
+                universe_by_ticker = universe_df.drop_duplicates(subset=['ticker']).set_index('ticker')
+                in_universe = pd.Index(tickers).isin(universe_by_ticker.index)
+                matched_tickers = [ticker for ticker, found in zip(tickers, in_universe) if found]
+                missing_tickers = [ticker for ticker, found in zip(tickers, in_universe) if not found]
+                matched_count = len(matched_tickers)
+
+                if tickers:
+                    matched_df = universe_by_ticker.loc[matched_tickers].rename_axis('ticker').reset_index()
+                    # Create minimal rows for tickers not in universe, filling columns with default values
+                    missing_df = pd.DataFrame({
+                        col: missing_tickers if col == 'ticker' else [False if col.isupper() else ''] * len(missing_tickers)
+                        for col in universe_df.columns
+                    })
+                    filtered_df = (pd.concat([matched_df, missing_df], ignore_index=True)
+                                   .set_index('ticker').reindex(tickers)
+                                   .rename_axis('ticker').reset_index()[universe_df.columns])
                     print(f"  ✅ Enriched {matched_count}/{len(tickers)} tickers with universe data")
                 else:
                     # Fallback to basic ticker dataframe
@@ -522,31 +653,17 @@ class UnifiedTickerGenerator:
                 print(f"  ⚠️  Universe file not found, using basic ticker data")
                 filtered_df = df_tickers[['ticker']].drop_duplicates()
             
-            # Force regeneration by removing existing files
-            choice_str = str(choice)
-            files_to_regenerate = [
-                self.tickers_dir / f'combined_tickers_{choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_{choice_str}.csv',
-                self.tickers_dir / f'combined_info_tickers_clean_{choice_str}.csv'
-            ]
-            
-            for file_path in files_to_regenerate:
-                if file_path.exists():
-                    file_path.unlink()
-            
             # Generate 3 file types
+            ticker_file, info_file, clean_file = self._expected_files(choice)
+            
             # 1. combined_tickers_{choice}.csv (ticker column only)
-            tickers_only = pd.DataFrame({'ticker': filtered_df['ticker'].tolist()})
-            ticker_file = self.tickers_dir / f'combined_tickers_{choice_str}.csv'
-            tickers_only.to_csv(ticker_file, index=False)
+            self._write_tickers(ticker_file, filtered_df['ticker'].tolist())
             
             # 2. combined_info_tickers_{choice}.csv (all columns)
-            info_file = self.tickers_dir / f'combined_info_tickers_{choice_str}.csv'
             filtered_df.to_csv(info_file, index=False)
             
-            # 3. combined_info_tickers_clean_{choice}.csv (same as info)
-            clean_file = self.tickers_dir / f'combined_info_tickers_clean_{choice_str}.csv'
-            filtered_df.to_csv(clean_file, index=False)
+            # 3. combined_info_tickers_clean_{choice}.csv (same as info - copy the bytes, don't re-serialize)
+            shutil.copyfile(info_file, clean_file)
             
             print(f"✅ Generated individual mode files for choice {choice}: {len(filtered_df)} tickers")
             return True
@@ -557,7 +674,7 @@ class UnifiedTickerGenerator:
     
     def _filter_by_choice(self, df, choice):
         """Filter dataframe by choice using boolean columns."""
-        filters = self.choice_filters.get(choice)
+        filters = self.CHOICE_FILTERS.get(choice)
         if filters is None:
             print(f"❌ No filter definition for choice {choice}")
             return None
@@ -568,23 +685,45 @@ class UnifiedTickerGenerator:
             return df
         
         # Apply OR filtering for multiple indexes
-        mask = pd.Series([False] * len(df))
-        found_filters = []
-        
+        found_cols = []
+        available_cols = frozenset(df.columns)
         for filter_col in filters:
-            if filter_col in df.columns:
-                mask = mask | df[filter_col]
-                count = df[filter_col].sum()
-                found_filters.append(f"{filter_col}({count})")
+            if filter_col in available_cols:
+                found_cols.append(filter_col)
             else:
                 print(f"  ⚠️  Column {filter_col} not found in universe file")
         
+        # Reduce the boolean columns row-wise in a single pass over one 2-D block
+        flags = df[found_cols].to_numpy(dtype=bool, na_value=False)
+        mask = flags.any(axis=1)
+        found_filters = [f"{col}({count})" for col, count in zip(found_cols, flags.sum(axis=0))]
+        
         filtered_df = df[mask]
         print(f"  • Applied filters: {', '.join(found_filters)}")
         print(f"  • Choice {choice}: {len(filtered_df)} tickers after filtering")
         
         return filtered_df
     
+    def _expected_files(self, choice):
+        """Return the (tickers, info, clean info) file paths generated for a choice."""
+        return (
+            self.tickers_dir / f'combined_tickers_{choice}.csv',
+            self.tickers_dir / f'combined_info_tickers_{choice}.csv',
+            self.tickers_dir / f'combined_info_tickers_clean_{choice}.csv',
+        )
+    
+    def _read_tickers(self, path):
+        """Read a single-column ticker CSV written by _write_tickers as an object array."""
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()[1:]
+        return np.array([line.strip() for line in lines if line.strip()], dtype=object)
+    
+    def _write_tickers(self, path, tickers):
+        """Write a single-column ticker CSV directly, without building a DataFrame."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('ticker\n')
+            f.write(''.join(f'{ticker}\n' for ticker in tickers))
+    
     def _print_summary(self, user_choice, choices):
         """Print summary of generated files."""
         print(f"\n📋 FILE GENERATION SUMMARY")
@@ -595,17 +734,17 @@ class UnifiedTickerGenerator:
         # Count generated files
         total_files = 0
         for choice in [0] + [c for c in choices if c != 0]:
-            choice_files = list(self.tickers_dir.glob(f'*_{choice}.csv'))
-            total_files += len(choice_files)
-            print(f"  Choice {choice}: {len(choice_files)} files")
+            choice_files = sum(1 for path in self._expected_files(choice) if path.exists())
+            total_files += choice_files
+            print(f"  Choice {choice}: {choice_files} files")
         
         # Combined files
         if len(choices) > 1 or (len(choices) == 1 and choices[0] != 0):
             combined_name = str(user_choice)
             if combined_name not in [str(c) for c in choices]:
-                combined_files = list(self.tickers_dir.glob(f'*_{combined_name}.csv'))
-                total_files += len(combined_files)
-                print(f"  Combined {combined_name}: {len(combined_files)} files")
+                combined_files = sum(1 for path in self._expected_files(combined_name) if path.exists())
+                total_files += combined_files
+                print(f"  Combined {combined_name}: {combined_files} files")
         
         print(f"Total files generated: {total_files}")
 
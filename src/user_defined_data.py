@@ -1,13 +1,213 @@
-import pandas as pd
-from dataclasses import dataclass, field
-from typing import Optional, List
+from __future__ import annotations
+
+import csv
+import hashlib
+import logging
+import os
+import pickle
+import re
+import sys
+from enum import StrEnum
+from functools import lru_cache, wraps
+from pathlib import Path
+from dataclasses import MISSING, dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+TIMEFRAMES = ('daily', 'weekly', 'monthly')
+
+# Timeframe scaling factors for screener periods
+_TIMEFRAME_SCALING = {
+    'daily': 1.0,
+    'weekly': 0.2,  # 5 weeks = 1 month daily
+    'monthly': 0.05  # 12 months = 1 year daily
+}
+
+# Configured periods that screeners scale by timeframe: module -> (param key,
+# source field, floor); scaled once per configuration (see ``scaled_periods``)
+_SCALED_PERIOD_FIELDS = {
+    'volume_suite': (
+        ('hv_month_cutoff', 'volume_suite_hv_month_cutoff', 1),
+        ('hv_day_cutoff', 'volume_suite_hv_day_cutoff', 1),
+    ),
+    'rti': (
+        ('rti_period', 'rti_period', 5),
+        ('rti_short_period', 'rti_short_period', 2),
+        ('rti_swing_period', 'rti_swing_period', 3),
+        ('consecutive_low_vol_bars', 'rti_consecutive_low_vol_bars', 1),
+        ('min_consolidation_period', 'rti_min_consolidation_period', 1),
+        ('breakout_confirmation_period', 'rti_breakout_confirmation_period', 1),
+    ),
+}
+
+# Optional on-disk cache of parsed user_data.csv files, keyed by content hash (see
+# read_user_data). Off unless METAVOLUME_USER_DATA_CACHE names a private directory;
+# only the newest USER_DATA_CACHE_MAX_ENTRIES files are kept
+USER_DATA_CACHE_DIR = (Path(os.environ['METAVOLUME_USER_DATA_CACHE'])
+                       if os.environ.get('METAVOLUME_USER_DATA_CACHE') else None)
+USER_DATA_CACHE_MAX_ENTRIES = 16
+
+
+class MAType(StrEnum):
+    """Moving average type used by the screeners."""
+    SMA = "SMA"
+    EMA = "EMA"
+    WMA = "WMA"
+
+    @classmethod
+    def _missing_(cls, value):
+        # Accept case/whitespace variants such as " ema "
+        if isinstance(value, str):
+            return cls.__members__.get(value.strip().upper())
+        return None
+
 
+class TradeDirection(StrEnum):
+    """Signal direction for the PVB models."""
+    LONG = "Long"
+    SHORT = "Short"
+    LONG_AND_SHORT = "Long and Short"
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            for member in cls:
+                if member.value.lower() == normalized:
+                    return member
+        return None
 
-@dataclass
+
+# Default ticker group id -> filename mapping, shared read-only by all configurations
+DEFAULT_TICKER_FILENAMES = MappingProxyType({
+    0: 'tradingview_universe.csv',
+    1: 'sp500_tickers.csv',
+    2: 'nasdaq100_tickers.csv',
+    3: 'nasdaq_all_tickers.csv',
+    4: 'iwm1000_tickers.csv',
+    5: 'indexes_tickers.csv',
+    6: 'portofolio_tickers.csv',
+    7: 'etf_tickers.csv',
+    8: 'test_tickers.csv'
+})
+
+# Default market breadth universe (single 'all' universe), shared read-only
+DEFAULT_MARKET_BREADTH_UNIVERSE = MappingProxyType({
+    'type': 'single',
+    'universes': ['all'],
+    'display_name': 'all',
+    'file_count': 1,
+    'raw_config': 'all'
+})
+
+
+@dataclass(slots=True, frozen=True)
+class ATR1Params:
+    """ATR1 settings for a single timeframe."""
+    length: int
+    factor: float
+    length2: int
+    factor2: float
+
+
+@dataclass(slots=True, frozen=True)
+class ATR2Params:
+    """ATR2 settings for a single timeframe."""
+    atr_period: int
+    sma_period: int
+    percentile_period: int
+
+
+@dataclass(slots=True, frozen=True)
+class StageParams:
+    """Stage analysis settings for a single timeframe."""
+    enabled: bool
+    ema_fast_period: int
+    sma_medium_period: int
+    sma_slow_period: int
+    atr_period: int
+    atr_threshold_low: float
+    atr_threshold_high: float
+    ma_convergence_threshold: float
+
+
+@dataclass(slots=True, frozen=True)
+class PVBTWmodelParams:
+    """PVB TWmodel settings for a single timeframe."""
+    price_breakout_period: int
+    volume_breakout_period: int
+    trendline_length: int
+    close_threshold: int
+    signal_max_age: int
+
+
+@dataclass(slots=True, frozen=True, init=False)
 class UserConfiguration:
     """
     Data class to hold all user configuration settings.
+
+    Instances are immutable and slotted: ``read_user_data`` builds one in a
+    single constructor call, and overrides go through ``with_overrides``.
+    The constructor takes keyword arguments only and fills every slot in one
+    loop over the precomputed field defaults.
     """
+    # Semicolon-separated settings stored as tuples; CSV text is split by the
+    # CONFIG_MAP converters, other string inputs are split in __post_init__
+    _PERIOD_FIELDS: ClassVar[tuple] = (
+        'index_daily_daily_periods', 'index_daily_weekly_periods', 'index_daily_monthly_periods',
+        'index_daily_quarterly_periods', 'index_daily_yearly_periods',
+        'index_weekly_weekly_periods', 'index_weekly_monthly_periods', 'index_monthly_monthly_periods',
+        'index_daily_rs_periods', 'index_daily_rs_short_periods', 'index_daily_rs_long_periods',
+        'index_weekly_rs_periods', 'index_weekly_rs_short_periods', 'index_weekly_rs_long_periods',
+        'index_monthly_rs_periods',
+        'daily_daily_periods', 'daily_weekly_periods', 'daily_monthly_periods',
+        'daily_quarterly_periods', 'daily_yearly_periods',
+        'weekly_weekly_periods', 'weekly_monthly_periods', 'monthly_monthly_periods', 'RS_monthly_periods',
+        'daily_ema_periods', 'daily_sma_periods', 'weekly_ema_periods', 'weekly_sma_periods',
+        'monthly_ema_periods', 'monthly_sma_periods', 'rs_ma_method',
+        'adl_screener_short_term_periods', 'adl_screener_ma_periods',
+        'market_pulse_gmi2_sma', 'market_pulse_chillax_mas_sma', 'market_pulse_chillax_display_sma',
+        'market_pulse_ma_cycles_ma_period',
+    )
+    # Module -> per-timeframe enable flag template, summarised in ``enabled_timeframes``
+    _TIMEFRAME_FLAGS: ClassVar[dict] = {
+        'basic_calc': 'basic_calc_{}_enable',
+        'rs': 'rs_{}_enable',
+        'stage_analysis': 'stage_analysis_{}_enabled',
+        'sr': 'sr_timeframe_{}',
+        'sr_mmm': 'sr_mmm_{}_enable',
+        'pvb_TWmodel': 'pvb_TWmodel_{}_enable',
+        'volume_suite': 'volume_suite_{}_enable',
+        'stockbee_suite': 'stockbee_suite_{}_enable',
+        'adl_screener': 'adl_screener_{}_enable',
+        'guppy_screener': 'guppy_screener_{}_enable',
+        'gold_launch_pad': 'gold_launch_pad_{}_enable',
+        'rti': 'rti_{}_enable',
+        'market_breadth': 'market_breadth_{}_enable',
+    }
+    # Enum-valued fields coerced from plain strings in __post_init__
+    _ENUM_FIELDS: ClassVar[dict] = {
+        'pvb_TWmodel_order_direction': TradeDirection,
+        'volume_suite_pvb_clmodel_direction': TradeDirection,
+        'volume_suite_pvb_TWmodel_direction': TradeDirection,
+        'adl_screener_ma_type': MAType,
+        'guppy_screener_ma_type': MAType,
+        'gold_launch_pad_ma_type': MAType,
+    }
+    _TEXT_LIST_FIELDS: ClassVar[tuple] = (
+        'rs_benchmark_tickers', 'sr_overview_values_indexes', 'sr_overview_values_sectors',
+        'sr_overview_charts_tickers', 'sr_mmm_gaps_tickers',
+        'market_pulse_gmi2_index', 'market_pulse_chillax_mas_indexes', 'market_pulse_chillax_mas_charts',
+        'market_pulse_ma_cycles_indexes', 'market_pulse_ma_cycles_charts',
+        'drwish_lookback_period', 'drwish_calculate_historical_GLB', 'drwish_confirmation_period',
+    )
+
     # Ticker data sources
     web_tickers_down: bool = False
     tw_tickers_down: bool = True  
@@ -46,7 +246,7 @@ class UserConfiguration:
     batch_size: int = 100
     
     # Ticker group filenames
-    ticker_filenames: dict = None
+    ticker_filenames: Mapping[int, str] = field(default_factory=lambda: DEFAULT_TICKER_FILENAMES)
     
     # POST-PROCESSING CONFIGURATION
     # Input historical data sources (local data loading)
@@ -57,19 +257,19 @@ class UserConfiguration:
 
     # Environment detection and paths
     auto_detect_environment: bool = True
-    manual_environment_override: Optional[str] = None
+    manual_environment_override: str | None = None
 
     # Local environment paths
-    yf_daily_data_files_local: Optional[str] = None
-    yf_weekly_data_files_local: Optional[str] = None
-    yf_monthly_data_files_local: Optional[str] = None
-    tw_intraday_folder_local: Optional[str] = None
+    yf_daily_data_files_local: str | None = None
+    yf_weekly_data_files_local: str | None = None
+    yf_monthly_data_files_local: str | None = None
+    tw_intraday_folder_local: str | None = None
 
     # Colab environment paths
-    yf_daily_data_files_colab: Optional[str] = None
-    yf_weekly_data_files_colab: Optional[str] = None
-    yf_monthly_data_files_colab: Optional[str] = None
-    tw_intraday_folder_colab: Optional[str] = None
+    yf_daily_data_files_colab: str | None = None
+    yf_weekly_data_files_colab: str | None = None
+    yf_monthly_data_files_colab: str | None = None
+    tw_intraday_folder_colab: str | None = None
 
     # Overview files
     indexes_overview_file: str = "indexes_overview.csv"
@@ -81,28 +281,28 @@ class UserConfiguration:
     
     # Index Overview Period Configurations
     # Daily Period Percent Change Configuration        
-    index_daily_daily_periods: str = "2;3;5"    # Daily data: daily percent change periods (semicolon separated - 2d;3d;5d)
-    index_daily_weekly_periods: str = "7"    # Daily data: weekly percent change periods (days back)
-    index_daily_monthly_periods: str = "22;44"    # Daily data: monthly percent change periods (semicolon separated - 1m;2m)
-    index_daily_quarterly_periods: str = "66;132"    # Daily data: quarterly percent change periods (semicolon separated - 1q;2q)
-    index_daily_yearly_periods: str = "252"    # Daily data: yearly percent change periods (days back)
+    index_daily_daily_periods: tuple[int, ...] = (2, 3, 5)    # Daily data: daily percent change periods (semicolon separated - 2d;3d;5d)
+    index_daily_weekly_periods: tuple[int, ...] = (7,)    # Daily data: weekly percent change periods (days back)
+    index_daily_monthly_periods: tuple[int, ...] = (22, 44)    # Daily data: monthly percent change periods (semicolon separated - 1m;2m)
+    index_daily_quarterly_periods: tuple[int, ...] = (66, 132)    # Daily data: quarterly percent change periods (semicolon separated - 1q;2q)
+    index_daily_yearly_periods: tuple[int, ...] = (252,)    # Daily data: yearly percent change periods (days back)
     # Weekly Period Percent Change Configuration        
-    index_weekly_weekly_periods: str = "2;4"    # Weekly data: weekly percent change periods (weeks back)
-    index_weekly_monthly_periods: str = "4;8"    # Weekly data: monthly percent change periods (semicolon separated - 1m;2m)
+    index_weekly_weekly_periods: tuple[int, ...] = (2, 4)    # Weekly data: weekly percent change periods (weeks back)
+    index_weekly_monthly_periods: tuple[int, ...] = (4, 8)    # Weekly data: monthly percent change periods (semicolon separated - 1m;2m)
     # Monthly Period Percent Change Configuration        
-    index_monthly_monthly_periods: str = "2;3;6"    # Monthly data: monthly percent change periods (months back)
+    index_monthly_monthly_periods: tuple[int, ...] = (2, 3, 6)    # Monthly data: monthly percent change periods (months back)
     
     # Index Overview RS Period Configurations
     # Daily RS Configuration
-    index_daily_rs_periods: str = "10;20;50;100"    # Daily RS periods (days)
-    index_daily_rs_short_periods: str = "5;10"    # Short-term RS periods
-    index_daily_rs_long_periods: str = "100;200"    # Long-term RS periods
+    index_daily_rs_periods: tuple[int, ...] = (10, 20, 50, 100)    # Daily RS periods (days)
+    index_daily_rs_short_periods: tuple[int, ...] = (5, 10)    # Short-term RS periods
+    index_daily_rs_long_periods: tuple[int, ...] = (100, 200)    # Long-term RS periods
     # Weekly RS Configuration  
-    index_weekly_rs_periods: str = "4;13;26;52"    # Weekly RS periods (weeks)
-    index_weekly_rs_short_periods: str = "2;4"    # Short-term weekly RS
-    index_weekly_rs_long_periods: str = "26;52"    # Long-term weekly RS
+    index_weekly_rs_periods: tuple[int, ...] = (4, 13, 26, 52)    # Weekly RS periods (weeks)
+    index_weekly_rs_short_periods: tuple[int, ...] = (2, 4)    # Short-term weekly RS
+    index_weekly_rs_long_periods: tuple[int, ...] = (26, 52)    # Long-term weekly RS
     # Monthly RS Configuration
-    index_monthly_rs_periods: str = "3;6;12"    # Monthly RS periods (months)
+    index_monthly_rs_periods: tuple[int, ...] = (3, 6, 12)    # Monthly RS periods (months)
     
     # Output directory configuration
     basic_calculation_output_dir: str = "results/basic_calculation"
@@ -129,18 +329,18 @@ class UserConfiguration:
     basic_calc_weekly_enable: bool = True
     basic_calc_monthly_enable: bool = True
     # Daily period percent change configuration
-    daily_daily_periods: str = "2;3;5"
-    daily_weekly_periods: str = "7"
-    daily_monthly_periods: str = "22;44"  
-    daily_quarterly_periods: str = "66;132"
-    daily_yearly_periods: str = "252"
+    daily_daily_periods: tuple[int, ...] = (2, 3, 5)
+    daily_weekly_periods: tuple[int, ...] = (7,)
+    daily_monthly_periods: tuple[int, ...] = (22, 44)  
+    daily_quarterly_periods: tuple[int, ...] = (66, 132)
+    daily_yearly_periods: tuple[int, ...] = (252,)
     # Weekly period percent change configuration
-    weekly_weekly_periods: str = "2;4"
-    weekly_monthly_periods: str = "4;8"
+    weekly_weekly_periods: tuple[int, ...] = (2, 4)
+    weekly_monthly_periods: tuple[int, ...] = (4, 8)
     # Monthly period percent change configuration
-    monthly_monthly_periods: str = "2;3;6"
+    monthly_monthly_periods: tuple[int, ...] = (2, 3, 6)
     # Monthly RS periods
-    RS_monthly_periods: str = "1;3;6"
+    RS_monthly_periods: tuple[int, ...] = (1, 3, 6)
 
     # SUSTAINABILITY RATIOS (SR) CONFIGURATION
     sr_enable: bool = False
@@ -170,13 +370,13 @@ class UserConfiguration:
     sr_overview_values_enable: bool = True
     sr_overview_charts_enable: bool = True
     sr_overview_values_history: int = 10
-    sr_overview_values_indexes: str = "SPY;IWM"
-    sr_overview_values_sectors: str = "XLY;XLC"
+    sr_overview_values_indexes: tuple[str, ...] = ('SPY', 'IWM')
+    sr_overview_values_sectors: tuple[str, ...] = ('XLY', 'XLC')
     sr_overview_values_industries: str = "NVDA"
     sr_overview_values_timeframe: str = "latest;5;latest_Wednesday"
     sr_overview_output_dir: str = "results/sustainability_ratios/overview"
     sr_overview_filename_prefix: str = "sr_overview"
-    sr_overview_charts_tickers: str = "SPY;IWM"
+    sr_overview_charts_tickers: tuple[str, ...] = ('SPY', 'IWM')
     sr_overview_charts_display_panel: str = "user_data_sr_overview.csv"
     sr_overview_charts_display_history: int = 30
 
@@ -186,7 +386,7 @@ class UserConfiguration:
     sr_mmm_weekly_enable: bool = False
     sr_mmm_monthly_enable: bool = False
     sr_mmm_gaps_values: bool = True
-    sr_mmm_gaps_tickers: str = "XLY;XLC"
+    sr_mmm_gaps_tickers: tuple[str, ...] = ('XLY', 'XLC')
     sr_mmm_gaps_values_input_folder_daily: str = "../downloadData_v1/data/market_data/daily/"
     sr_mmm_gaps_values_input_folder_weekly: str = "../downloadData_v1/data/market_data/weekly/"
     sr_mmm_gaps_values_input_folder_monthly: str = "../downloadData_v1/data/market_data/monthly/"
@@ -231,21 +431,16 @@ class UserConfiguration:
     report_format: str = "PDF"
     report_include_metadata: bool = True
     
-    # INDEX OVERVIEW CONFIGURATION
-    sp500_overview: bool = True
-    nasdaq100_overview: bool = True
-    djia_overview: bool = True
-    
     # TECHNICAL INDICATORS CONFIGURATION
     # Daily timeframe indicators
-    daily_ema_periods: str = "10;20"
-    daily_sma_periods: str = "20;50;200;250;350"
+    daily_ema_periods: tuple[int, ...] = (10, 20)
+    daily_sma_periods: tuple[int, ...] = (20, 50, 200, 250, 350)
     # Weekly timeframe indicators  
-    weekly_ema_periods: str = "10"
-    weekly_sma_periods: str = "20;50"
+    weekly_ema_periods: tuple[int, ...] = (10,)
+    weekly_sma_periods: tuple[int, ...] = (20, 50)
     # Monthly timeframe indicators
-    monthly_ema_periods: str = "10"
-    monthly_sma_periods: str = "12;24"
+    monthly_ema_periods: tuple[int, ...] = (10,)
+    monthly_sma_periods: tuple[int, ...] = (12, 24)
     
     # PERCENTAGE MOVERS CONFIGURATION
     enable_movers_analysis: bool = True
@@ -352,7 +547,7 @@ class UserConfiguration:
     rs_enable_sectors: bool = True
     rs_enable_industries: bool = True
     # Multi-benchmark configuration
-    rs_benchmark_tickers: str = "SPY;QQQ"
+    rs_benchmark_tickers: tuple[str, ...] = ('SPY', 'QQQ')
     # Legacy single benchmark (backward compatibility)
     rs_benchmark_ticker: str = "SPY"
     rs_composite_method: str = "equal_weighted"
@@ -376,7 +571,7 @@ class UserConfiguration:
 
     # MOVING AVERAGE RS CONFIGURATION
     rs_ma_enable: bool = False
-    rs_ma_method: str = "20;50"
+    rs_ma_method: tuple[int, ...] = (20, 50)
     rs_method_for_per: str = "IBD"
 
     # TECHNICAL INDICATORS CONFIGURATION
@@ -448,7 +643,7 @@ class UserConfiguration:
     pvb_TWmodel_monthly_close_threshold: int = 1
     pvb_TWmodel_monthly_signal_max_age: int = 6
     # Common PVB parameters
-    pvb_TWmodel_order_direction: str = "Long and Short"
+    pvb_TWmodel_order_direction: TradeDirection = TradeDirection.LONG_AND_SHORT
     pvb_TWmodel_min_volume: int = 10000
     pvb_TWmodel_min_price: float = 1.0
     # TradingView Watchlist Export Configuration
@@ -482,9 +677,9 @@ class UserConfiguration:
     drwish_min_price: float = 5.0
     drwish_min_volume: int = 100000
     drwish_pivot_strength: int = 10
-    drwish_lookback_period: str = "3m"
-    drwish_calculate_historical_GLB: str = "1y"
-    drwish_confirmation_period: str = "2w"
+    drwish_lookback_period: tuple[str, ...] = ('3m',)
+    drwish_calculate_historical_GLB: tuple[str, ...] = ('1y',)
+    drwish_confirmation_period: tuple[str, ...] = ('2w',)
     drwish_require_confirmation: bool = True
     drwish_enable_glb: bool = True
     drwish_enable_blue_dot: bool = True
@@ -545,7 +740,7 @@ class UserConfiguration:
     volume_suite_pvb_clmodel_volume_period: int = 15
     volume_suite_pvb_clmodel_trend_length: int = 50
     volume_suite_pvb_clmodel_volume_multiplier: float = 1.5
-    volume_suite_pvb_clmodel_direction: str = "Long"
+    volume_suite_pvb_clmodel_direction: TradeDirection = TradeDirection.LONG
 
     # Stockbee Suite Configuration
     stockbee_suite_enable: bool = True
@@ -581,6 +776,8 @@ class UserConfiguration:
     stockbee_suite_industry_top_stocks: int = 4  # Top 4 per industry
     stockbee_suite_industry_min_size: int = 3  # Minimum stocks per industry
     stockbee_suite_save_individual_files: bool = True  # Save individual screener files
+    stockbee_suite_9m_relative_volume: float = 1.25
+    stockbee_suite_weekly_min_volume: int = 100000
 
     # Qullamaggie Suite Configuration
     qullamaggie_suite_enable: bool = True
@@ -621,15 +818,15 @@ class UserConfiguration:
 
     # Short-term Momentum Analysis (Step 3)
     adl_screener_short_term_enable: bool = True
-    adl_screener_short_term_periods: str = "5;10;20"  # Periods for percentage change calculation
+    adl_screener_short_term_periods: tuple[int, ...] = (5, 10, 20)  # Periods for percentage change calculation
     adl_screener_short_term_momentum_threshold: float = 5.0  # Minimum % change for momentum shift
     adl_screener_short_term_acceleration_detect: bool = True  # Enable acceleration detection
     adl_screener_short_term_min_score: float = 50.0  # Minimum momentum score (0-100)
 
     # Moving Average Analysis (Step 4)
     adl_screener_ma_enable: bool = True
-    adl_screener_ma_periods: str = "20;50;100"  # MA periods (semicolon separated)
-    adl_screener_ma_type: str = "SMA"  # Type: SMA or EMA
+    adl_screener_ma_periods: tuple[int, ...] = (20, 50, 100)  # MA periods (semicolon separated)
+    adl_screener_ma_type: MAType = MAType.SMA  # Type: SMA or EMA
     adl_screener_ma_bullish_alignment_required: bool = True  # Require 20 > 50 > 100
     adl_screener_ma_crossover_detection: bool = True  # Detect MA crossovers
     adl_screener_ma_crossover_lookback: int = 10  # Periods to look back for crossovers
@@ -656,9 +853,9 @@ class UserConfiguration:
     guppy_screener_daily_enable: bool = True
     guppy_screener_weekly_enable: bool = False
     guppy_screener_monthly_enable: bool = False
-    guppy_screener_ma_type: str = "EMA"  # Moving average type: EMA or SMA
-    guppy_screener_short_term_emas: List[int] = field(default_factory=lambda: [3, 5, 8, 10, 12, 15])  # Trader behavior EMAs
-    guppy_screener_long_term_emas: List[int] = field(default_factory=lambda: [30, 35, 40, 45, 50, 60])  # Investor behavior EMAs
+    guppy_screener_ma_type: MAType = MAType.EMA  # Moving average type: EMA or SMA
+    guppy_screener_short_term_emas: tuple[int, ...] = (3, 5, 8, 10, 12, 15)  # Trader behavior EMAs
+    guppy_screener_long_term_emas: tuple[int, ...] = (30, 35, 40, 45, 50, 60)  # Investor behavior EMAs
     guppy_screener_min_compression_ratio: float = 0.02  # 2% compression threshold
     guppy_screener_min_expansion_ratio: float = 0.05  # 5% expansion threshold
     guppy_screener_crossover_confirmation_days: int = 3  # Days to confirm crossover
@@ -673,8 +870,8 @@ class UserConfiguration:
     gold_launch_pad_daily_enable: bool = True
     gold_launch_pad_weekly_enable: bool = True
     gold_launch_pad_monthly_enable: bool = True
-    gold_launch_pad_ma_periods: List[int] = field(default_factory=lambda: [10, 20, 50])
-    gold_launch_pad_ma_type: str = "EMA"  # EMA, SMA, WMA
+    gold_launch_pad_ma_periods: tuple[int, ...] = (10, 20, 50)
+    gold_launch_pad_ma_type: MAType = MAType.EMA  # EMA, SMA, WMA
     gold_launch_pad_zscore_window: int = 50
     gold_launch_pad_max_spread_threshold: float = 1.0
     gold_launch_pad_slope_lookback_pct: float = 0.3
@@ -710,7 +907,7 @@ class UserConfiguration:
     volume_suite_pvb_TWmodel_volume_period: int = 30
     volume_suite_pvb_TWmodel_trend_length: int = 50
     volume_suite_pvb_TWmodel_volume_multiplier: float = 1.5
-    volume_suite_pvb_TWmodel_direction: str = "Long"
+    volume_suite_pvb_TWmodel_direction: TradeDirection = TradeDirection.LONG
     
     # Output settings
     volume_suite_output_dir: str = "results/screeners/volume_suite"
@@ -736,8 +933,8 @@ class UserConfiguration:
 
     # GMI2 Configuration (Multi-SMA Requirements Model)
     market_pulse_gmi2_enable: bool = False
-    market_pulse_gmi2_index: str = "SPY;QQQ"  # Multiple indexes separated by semicolon
-    market_pulse_gmi2_sma: str = "10;20;50;150"  # Exactly 4 SMA values separated by semicolon
+    market_pulse_gmi2_index: tuple[str, ...] = ('SPY', 'QQQ')  # Multiple indexes separated by semicolon
+    market_pulse_gmi2_sma: tuple[int, ...] = (10, 20, 50, 150)  # Exactly 4 SMA values separated by semicolon
     market_pulse_gmi2_index_stochastic_threshold: int = 20
     market_pulse_gmi2_threshold: int = 5  # Out of 9 possible points
     market_pulse_gmi2_confirmation_days: int = 2
@@ -752,7 +949,7 @@ class UserConfiguration:
     
     # Net New Highs/Lows Configuration
     market_pulse_net_highs_lows_enable: bool = True
-    market_pulse_net_highs_lows_timeframes: List[str] = field(default_factory=lambda: ['52week', '3month', '1month'])
+    market_pulse_net_highs_lows_timeframes: tuple[str, ...] = ('52week', '3month', '1month')
     market_pulse_breadth_threshold_healthy: float = 2.0  # >2% net new highs = healthy
     market_pulse_breadth_threshold_unhealthy: float = -2.0  # >2% net new lows = unhealthy
     
@@ -763,17 +960,17 @@ class UserConfiguration:
     market_pulse_chillax_trend_days: int = 5  # Days to check for trend confirmation
 
     # Chillax MAs Enhanced Configuration
-    market_pulse_chillax_mas_indexes: str = "SPY;QQQ;IWM"  # Chillax MA analysis indexes (semicolon separated)
-    market_pulse_chillax_mas_sma: str = "10;20"  # Chillax MA SMA periods (semicolon separated)
-    market_pulse_chillax_mas_charts: str = "SPY;QQQ"  # Indexes to create charts for (if empty creates for all chillax_mas_indexes)
+    market_pulse_chillax_mas_indexes: tuple[str, ...] = ('SPY', 'QQQ', 'IWM')  # Chillax MA analysis indexes (semicolon separated)
+    market_pulse_chillax_mas_sma: tuple[int, ...] = (10, 20)  # Chillax MA SMA periods (semicolon separated)
+    market_pulse_chillax_mas_charts: tuple[str, ...] = ('SPY', 'QQQ')  # Indexes to create charts for (if empty creates for all chillax_mas_indexes)
     market_pulse_chillax_mas_charts_timeframe: int = 150  # Chart timeframe in trading days (150 daily = ~30 weeks)
-    market_pulse_chillax_display_sma: str = "50;150;200"  # Additional moving averages to be displayed on chart
+    market_pulse_chillax_display_sma: tuple[int, ...] = (50, 150, 200)  # Additional moving averages to be displayed on chart
     
     # Moving Average Cycles Enhanced Configuration
     market_pulse_ma_cycles_enable: bool = True
-    market_pulse_ma_cycles_indexes: str = "SPY;QQQ;IWM"  # MA Cycles analysis indexes (semicolon separated)
-    market_pulse_ma_cycles_ma_period: str = "20;50"  # MA periods for cycle analysis (semicolon separated)
-    market_pulse_ma_cycles_charts: str = "SPY;QQQ"  # Indexes to create charts for (if empty creates for all ma_cycles_indexes)
+    market_pulse_ma_cycles_indexes: tuple[str, ...] = ('SPY', 'QQQ', 'IWM')  # MA Cycles analysis indexes (semicolon separated)
+    market_pulse_ma_cycles_ma_period: tuple[int, ...] = (20, 50)  # MA periods for cycle analysis (semicolon separated)
+    market_pulse_ma_cycles_charts: tuple[str, ...] = ('SPY', 'QQQ')  # Indexes to create charts for (if empty creates for all ma_cycles_indexes)
     market_pulse_ma_cycles_charts_timeframe: int = 200  # Chart timeframe in trading days
     market_pulse_ma_cycles_cycle_mode: str = "Sharp"  # Cycle detection mode (Sharp, Smooth, etc.)
     market_pulse_ma_cycles_smoothed_candles: int = 3  # Number of candles for smoothing
@@ -790,21 +987,16 @@ class UserConfiguration:
     # Report Generation Configuration
     market_pulse_ftd_dd_report_enable: bool = False
     market_pulse_comprehensive_report_enable: bool = True
+    market_pulse_gmigmi2_report_enable: bool = False
     
     # Market Breadth Analysis Configuration
     market_breadth_enable: bool = True
     market_breadth_daily_enable: bool = True
     market_breadth_weekly_enable: bool = False
     market_breadth_monthly_enable: bool = False
-    market_breadth_universe: dict = field(default_factory=lambda: {
-        'type': 'single',
-        'universes': ['all'],
-        'display_name': 'all',
-        'file_count': 1,
-        'raw_config': 'all'
-    })
+    market_breadth_universe: Mapping[str, object] = field(default_factory=lambda: DEFAULT_MARKET_BREADTH_UNIVERSE)
     market_breadth_lookback_days: int = 252
-    market_breadth_ma_periods: List[int] = field(default_factory=lambda: [20, 50, 200])
+    market_breadth_ma_periods: tuple[int, ...] = (20, 50, 200)
     # 252-day threshold configuration
     market_breadth_daily_252day_new_highs_threshold: int = 100
     market_breadth_ten_day_success_threshold: int = 5
@@ -829,6 +1021,29 @@ class UserConfiguration:
     # Output configuration
     market_breadth_save_detailed_results: bool = True
     market_breadth_output_dir: str = "results/market_breadth"
+    market_breadth_force_file: bool = False
+    # Per-timeframe period configuration
+    market_breadth_daily_ma_periods: tuple[int, ...] = (20, 50, 200)
+    market_breadth_daily_new_high_lows_periods: tuple[int, ...] = (252, 63, 20)
+    market_breadth_weekly_ma_periods: tuple[int, ...] = (10, 20, 40)
+    market_breadth_weekly_new_high_lows_periods: tuple[int, ...] = (52, 13, 4)
+    market_breadth_monthly_ma_periods: tuple[int, ...] = (3, 6, 12)
+    market_breadth_monthly_new_high_lows_periods: tuple[int, ...] = (12, 6, 3)
+    # Long/medium/short threshold configuration
+    market_breadth_new_highs_threshold_long: int = 100
+    market_breadth_new_highs_threshold_medium: int = 100
+    market_breadth_new_highs_threshold_short: int = 100
+    market_breadth_success_window_pct_long: int = 5
+    market_breadth_success_window_pct_medium: int = 10
+    market_breadth_success_window_pct_short: int = 30
+    market_breadth_success_threshold_pct_long: int = 5
+    market_breadth_success_threshold_pct_medium: int = 10
+    market_breadth_success_threshold_pct_short: int = 30
+    # Tornado chart and report configuration
+    market_breadth_tornado_chart: bool = False
+    market_breadth_tornado_chart_display_units_time: int = 20
+    market_breadth_report_enable: bool = False
+    market_breadth_report_template_type: str = "default"
     
     # Dashboard Configuration
     dashboard_enable: bool = True
@@ -857,82 +1072,337 @@ class UserConfiguration:
     hv1y_enable: bool = True
     hv1y_window_days: int = 365
 
+    # Output directory field name -> Path, e.g. output_dirs['rs_output_dir']
+    output_dirs: Mapping[str, Path] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Module -> frozenset of timeframes whose enable flag is set
+    enabled_timeframes: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # (module, timeframe) pairs whose master and timeframe flags are both set
+    enabled_modules: frozenset = field(default_factory=frozenset, init=False, repr=False, compare=False)
+
+    # (module, timeframe) -> scaled periods from ``_SCALED_PERIOD_FIELDS``
+    scaled_periods: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Per-timeframe parameter groups, keyed by 'daily'/'weekly'/'monthly'
+    atr1: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    atr2: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    stage: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    pvb_TWmodel: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Content hash computed on first use (see ``__hash__``)
+    hash_value: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    # get_*_params_for_timeframe results keyed by (getter name, timeframe)
+    param_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __init__(self, **overrides):
+        unknown = overrides.keys() - _INIT_FIELD_NAMES
+        if unknown:
+            raise TypeError(f"UserConfiguration got unexpected field(s): {', '.join(sorted(unknown))}")
+
+        set_field = object.__setattr__
+        for name, default, factory in _FIELD_DEFAULTS:
+            if name in overrides:
+                set_field(self, name, overrides[name])
+            elif factory is None:
+                set_field(self, name, default)
+            else:
+                set_field(self, name, factory())
+        self.__post_init__()
+
+    def __post_init__(self):
+        if not isinstance(self.ticker_filenames, MappingProxyType):
+            object.__setattr__(self, 'ticker_filenames', MappingProxyType(dict(self.ticker_filenames)))
+
+        for name, enum_type in self._ENUM_FIELDS.items():
+            value = getattr(self, name)
+            if not isinstance(value, enum_type):
+                try:
+                    value = enum_type(value)
+                except ValueError:
+                    default = self.__dataclass_fields__[name].default
+                    print(f"Warning: Invalid value '{value}' for {name}. Using default ('{default}').")
+                    value = default
+                object.__setattr__(self, name, value)
+
+        for name in _INTERN_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
+        for name in self._PERIOD_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, _split_semicolon_ints(value))
+        for name in self._TEXT_LIST_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, _split_semicolon(value))
+
+        object.__setattr__(self, 'output_dirs', MappingProxyType(
+            {name: Path(getattr(self, name)) for name in _OUTPUT_DIR_FIELDS}
+        ))
+
+        object.__setattr__(self, 'enabled_timeframes', {
+            module: frozenset(tf for tf in TIMEFRAMES if getattr(self, flag.format(tf)))
+            for module, flag in self._TIMEFRAME_FLAGS.items()
+        })
+        object.__setattr__(self, 'enabled_modules', frozenset(
+            (module, tf)
+            for module, timeframes in self.enabled_timeframes.items()
+            if getattr(self, f'{module}_enable', True)
+            for tf in timeframes
+        ))
+        object.__setattr__(self, 'scaled_periods', {
+            (module, tf): {key: max(floor, int(getattr(self, name) * scale)) for key, name, floor in periods}
+            for module, periods in _SCALED_PERIOD_FIELDS.items()
+            for tf, scale in _TIMEFRAME_SCALING.items()
+        })
+
+        object.__setattr__(self, 'atr1', {tf: ATR1Params(
+            length=getattr(self, f'atr1_{tf}_length'),
+            factor=getattr(self, f'atr1_{tf}_factor'),
+            length2=getattr(self, f'atr1_{tf}_length2'),
+            factor2=getattr(self, f'atr1_{tf}_factor2'),
+        ) for tf in TIMEFRAMES})
+        object.__setattr__(self, 'atr2', {tf: ATR2Params(
+            atr_period=getattr(self, f'atr2_{tf}_atr_period'),
+            sma_period=getattr(self, f'atr2_{tf}_sma_period'),
+            percentile_period=getattr(self, f'atr2_{tf}_percentile_period'),
+        ) for tf in TIMEFRAMES})
+        object.__setattr__(self, 'stage', {tf: StageParams(
+            enabled=getattr(self, f'stage_analysis_{tf}_enabled'),
+            ema_fast_period=getattr(self, f'stage_{tf}_ema_fast_period'),
+            sma_medium_period=getattr(self, f'stage_{tf}_sma_medium_period'),
+            sma_slow_period=getattr(self, f'stage_{tf}_sma_slow_period'),
+            atr_period=getattr(self, f'stage_{tf}_atr_period'),
+            atr_threshold_low=getattr(self, f'stage_{tf}_atr_threshold_low'),
+            atr_threshold_high=getattr(self, f'stage_{tf}_atr_threshold_high'),
+            ma_convergence_threshold=getattr(self, f'stage_{tf}_ma_convergence_threshold'),
+        ) for tf in TIMEFRAMES})
+        object.__setattr__(self, 'pvb_TWmodel', {tf: PVBTWmodelParams(
+            price_breakout_period=getattr(self, f'pvb_TWmodel_{tf}_price_breakout_period'),
+            volume_breakout_period=getattr(self, f'pvb_TWmodel_{tf}_volume_breakout_period'),
+            trendline_length=getattr(self, f'pvb_TWmodel_{tf}_trendline_length'),
+            close_threshold=getattr(self, f'pvb_TWmodel_{tf}_close_threshold'),
+            signal_max_age=getattr(self, f'pvb_TWmodel_{tf}_signal_max_age'),
+        ) for tf in TIMEFRAMES})
+
+    def parsed(self, name: str) -> tuple:
+        """
+        Get the parsed form of a semicolon-separated field.
+
+        Args:
+            name: Field name, e.g. 'daily_sma_periods' or 'rs_benchmark_tickers'
+
+        Returns:
+            Tuple of ints for period fields, tuple of strings for list fields
+        """
+        if name not in self._PERIOD_FIELDS and name not in self._TEXT_LIST_FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __hash__(self) -> int:
+        # Hash the compared fields once; list/dict settings are folded into
+        # hashable equivalents so the hash stays consistent with __eq__
+        if self.hash_value is None:
+            object.__setattr__(self, 'hash_value', hash(tuple(
+                _hashable(getattr(self, name)) for name in _COMPARE_FIELD_NAMES
+            )))
+        return self.hash_value
+
+    def is_timeframe_enabled(self, module: str, timeframe: str) -> bool:
+        """
+        Check a module's per-timeframe enable flag.
+
+        Args:
+            module: Module key from ``_TIMEFRAME_FLAGS``, e.g. 'stockbee_suite'
+            timeframe: 'daily', 'weekly', or 'monthly'
+
+        Returns:
+            True if enabled; timeframes without a flag count as enabled
+        """
+        return timeframe in self.enabled_timeframes[module] or timeframe not in TIMEFRAMES
+
+    def is_module_enabled(self, module: str, timeframe: str) -> bool:
+        """
+        Check a module's master enable flag and its per-timeframe flag together.
+
+        Args:
+            module: Module key from ``_TIMEFRAME_FLAGS``, e.g. 'stockbee_suite'
+            timeframe: 'daily', 'weekly', or 'monthly'
+
+        Returns:
+            True if both flags are set; timeframes without a flag only need the master flag
+        """
+        if timeframe in TIMEFRAMES:
+            return (module, timeframe) in self.enabled_modules
+        return getattr(self, f'{module}_enable', True)
+
+    def with_overrides(self, **changes) -> UserConfiguration:
+        """
+        Return a copy of this configuration with the given fields replaced.
+
+        Args:
+            **changes: Field names and their new values
+
+        Returns:
+            New UserConfiguration instance
+        """
+        return replace(self, **changes)
+
+
+# Path and enum-like string fields interned in __post_init__: repeated values across
+# configurations share one object and equality checks short-circuit on identity
+_INTERN_SUFFIXES = ('_dir', '_file', '_files', '_folder', '_type', '_method', '_direction',
+                    '_mode', '_format', '_style', '_size', '_source')
+_INTERN_FIELDS = tuple(
+    f.name for f in fields(UserConfiguration) if f.init and f.name.endswith(_INTERN_SUFFIXES)
+)
+
+_OUTPUT_DIR_FIELDS = tuple(
+    f.name for f in fields(UserConfiguration) if f.init and f.name.endswith('_output_dir')
+)
+
+# (name, default, default_factory) for every field, built once at import
+_FIELD_DEFAULTS = tuple(
+    (f.name, f.default, None if f.default_factory is MISSING else f.default_factory)
+    for f in fields(UserConfiguration)
+)
+_INIT_FIELD_NAMES = frozenset(f.name for f in fields(UserConfiguration) if f.init)
+_COMPARE_FIELD_NAMES = tuple(f.name for f in fields(UserConfiguration) if f.compare)
+
+
+def _hashable(value):
+    """
+    Convert list/dict configuration values into hashable equivalents.
+    """
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    return value
+
+
+def ensure_output_dir(path: Path) -> Path:
+    """
+    Create an output directory (and parents) if it does not exist.
+
+    Args:
+        path: Directory path, typically from ``UserConfiguration.output_dirs``
+
+    Returns:
+        The same path, guaranteed to exist
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _split_semicolon(value) -> tuple:
+    """
+    Split a semicolon-separated string into a tuple of stripped, non-empty items.
+
+    Lists and tuples (e.g. from YAML or ``with_overrides``) are taken item by item.
+    """
+    items = value if isinstance(value, (list, tuple)) else str(value).split(';')
+    return tuple(text for text in (str(item).strip() for item in items) if text)
+
+
+def _split_semicolon_ints(value) -> tuple:
+    """
+    Split a semicolon-separated string into a tuple of ints, skipping invalid items.
+    """
+    periods = []
+    for item in _split_semicolon(value):
+        try:
+            periods.append(int(item))
+        except ValueError:
+            continue
+    return tuple(periods)
+
 
 def _get_default_ticker_filenames() -> dict:
-    """Get the default ticker filenames mapping."""
-    return {
-        0: 'tradingview_universe.csv',
-        1: 'sp500_tickers.csv',
-        2: 'nasdaq100_tickers.csv',
-        3: 'nasdaq_all_tickers.csv',
-        4: 'iwm1000_tickers.csv',
-        5: 'indexes_tickers.csv',
-        6: 'portofolio_tickers.csv',
-        7: 'etf_tickers.csv',
-        8: 'test_tickers.csv'
-    }
+    """
+    Get a mutable copy of the default ticker filenames mapping.
+
+    Read-only callers should use ``DEFAULT_TICKER_FILENAMES`` directly.
+    """
+    return dict(DEFAULT_TICKER_FILENAMES)
+
+
+# "# N: Description,filename," -> (N, filename); the description may not contain commas.
+# Leading whitespace is matched here so lines need not be stripped first.
+_TICKER_GROUP_LINE = re.compile(r'\s*#[#\s]*(\d+)\s*:[^,]*,([^,]*)')
 
 
-def _read_ticker_filenames(file_path: str) -> dict:
+def _parse_ticker_filenames(lines: list[str]) -> dict:
     """
-    Parse ticker group filenames from comment lines in the CSV file.
+    Parse ticker group filenames from comment lines of the CSV file.
     
     Looks for lines in format: # N: Description,filename,
     where N is the group ID (0-8) and filename is the CSV filename.
+
+    Args:
+        lines: Lines of the configuration file
     
-    Returns dict mapping group_id -> filename
+    Returns dict mapping group_id -> filename (defaults if none are found)
     """
     ticker_filenames = {}
-    
-    try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('#') and ':' in line:
-                    # Parse lines like: # 5: Index tickers only,indexes_tickers.csv,
-                    parts = line.split(',')
-                    if len(parts) >= 2:
-                        # Extract the group ID from "# N: Description"
-                        prefix_part = parts[0]  # "# 5: Index tickers only"
-                        if ':' in prefix_part:
-                            try:
-                                # Split on ':' and get the part before it
-                                before_colon = prefix_part.split(':')[0]  # "# 5"
-                                # Extract the number
-                                group_id = int(before_colon.replace('#', '').strip())
-                                # Get the filename (second column)
-                                filename = parts[1].strip()
-                                if filename and 0 <= group_id <= 8:
-                                    ticker_filenames[group_id] = filename
-                            except (ValueError, IndexError):
-                                continue  # Skip invalid lines
-        
-        # If no filenames found, use defaults
-        if not ticker_filenames:
-            ticker_filenames = _get_default_ticker_filenames()
-            
-    except FileNotFoundError:
-        # Use defaults if file not found
-        ticker_filenames = _get_default_ticker_filenames()
-    
-    return ticker_filenames
+    for line in lines:
+        # Parse lines like: # 5: Index tickers only,indexes_tickers.csv,
+        match = _TICKER_GROUP_LINE.match(line)
+        if match:
+            group_id = int(match.group(1))
+            filename = match.group(2).strip()
+            if filename and 0 <= group_id <= 8:
+                ticker_filenames[group_id] = filename
+
+    # If no filenames found, use defaults
+    return ticker_filenames or _get_default_ticker_filenames()
+
+
+_TRUE_LOWER = frozenset({'true', '1', 'yes', 'y', 'on', 't', 'enable', 'enabled'})
+_FALSE_LOWER = frozenset({'false', '0', 'no', 'n', 'off', 'f', 'disable', 'disabled', ''})
+# Canonical spellings -> result; keys are strings only so that e.g. 1.0 keeps
+# going through the str() fallback below
+_BOOL_TABLE = {
+    **dict.fromkeys(('TRUE', 'True', 'true', '1', 'YES', 'Yes', 'yes', 'ON', 'On', 'on'), True),
+    **dict.fromkeys(('FALSE', 'False', 'false', '0', 'NO', 'No', 'no', 'OFF', 'Off', 'off', ''), False),
+}
 
 
 def parse_boolean(value: str) -> bool:
     """
     Parse string value to boolean.
-    Accepts: TRUE, FALSE, true, false, 1, 0, yes, no
+    Accepts (any case): true/false, 1/0, yes/no, y/n, on/off, t/f,
+    enable(d)/disable(d). Anything else is logged and treated as False.
     """
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
 
-    value_str = str(value).strip().lower()
-    return value_str in ['true', '1', 'yes', 'on']
+    # Canonical spellings are answered by one table lookup, no normalised copy
+    if type(value) is str:
+        result = _BOOL_TABLE.get(value)
+        return _text_is_true(value) if result is None else result
+
+    return _text_is_true(str(value))
+
 
+@lru_cache(maxsize=1024)
+def _text_is_true(text: str) -> bool:
+    """Normalise and test a non-canonical boolean string (memoised, so each is logged once)."""
+    normalised = text.strip().lower()
+    if normalised in _TRUE_LOWER:
+        return True
+    if normalised not in _FALSE_LOWER:
+        logger.warning(f"Unrecognised boolean value '{text}', treating as False")
+    return False
 
-def parse_comma_separated_ints(value: str) -> List[int]:
+
+def parse_comma_separated_ints(value: str) -> list[int]:
     """
-    Parse comma-separated integer string to List[int].
+    Parse comma-separated integer string to list[int].
 
     Examples:
         "3,5,8,10,12,25" → [3, 5, 8, 10, 12, 25]
@@ -947,893 +1417,19 @@ def parse_comma_separated_ints(value: str) -> List[int]:
     if not value or not isinstance(value, str):
         return []
     try:
-        # Remove quotes if present, strip whitespace, split by comma
-        cleaned = value.strip().strip('"\'')
-        return [int(x.strip()) for x in cleaned.split(',') if x.strip()]
+        # Fresh list per call so callers can mutate it without touching the cache
+        return list(_comma_separated_ints(value))
     except (ValueError, AttributeError) as e:
         logger.warning(f"Failed to parse comma-separated integers '{value}': {e}")
         return []
 
 
-def read_user_data(file_path: str = 'user_data.csv') -> UserConfiguration:
-    """
-    Reads user configuration from the restructured CSV file.
-    
-    The new format uses key-value pairs with format:
-    variable_name,value,description
-    
-    Returns UserConfiguration object with all settings.
-    """
-    try:
-        # First, read ticker group filenames from comment lines
-        ticker_filenames = _read_ticker_filenames(file_path)
-        
-        # Read CSV file, skipping comment lines that start with #
-        df = pd.read_csv(file_path, comment='#', header=None, 
-                        names=['variable', 'value', 'description'])
-        
-        # Remove rows where variable is NaN (empty lines, etc.)
-        df = df.dropna(subset=['variable'])
-        df['variable'] = df['variable'].str.strip()
-        df['value'] = df['value'].str.strip()
-        
-        # Create configuration object with defaults
-        config = UserConfiguration()
-        config.ticker_filenames = ticker_filenames
-        
-        # Parse each configuration variable
-        config_map = {
-            # Original data collection settings (now mostly disabled)
-            'WEB_tickers_down': ('web_tickers_down', parse_boolean),
-            'TW_tickers_down': ('tw_tickers_down', parse_boolean),
-            'TW_universe_file': ('tw_universe_file', str),
-            'YF_hist_data': ('yf_hist_data', parse_boolean),
-            'YF_daily_data': ('yf_daily_data', parse_boolean),
-            'YF_weekly_data': ('yf_weekly_data', parse_boolean),
-            'YF_monthly_data': ('yf_monthly_data', parse_boolean),
-            'TW_intraday_data': ('tw_intraday_data', parse_boolean),
-            'TW_intraday_file': ('tw_intraday_file', str),
-            'fin_data_enrich': ('fin_data_enrich', parse_boolean),
-            'YF_fin_data': ('yf_fin_data', parse_boolean),
-            'TW_fin_data': ('tw_fin_data', parse_boolean),
-            'Zacks_fin_data': ('zacks_fin_data', parse_boolean),
-            'write_info_file': ('write_info_file', parse_boolean),
-            'ticker_info_TW': ('ticker_info_TW', parse_boolean),
-            'ticker_info_TW_file': ('ticker_info_TW_file', str),
-            'ticker_info_YF': ('ticker_info_YF', parse_boolean),
-            'ticker_choice': ('ticker_choice', str),
-            'batch_size': ('batch_size', int),
-
-            # Global execution phase flags
-            'PRE_PROCESS': ('PRE_PROCESS', parse_boolean),
-            'PRE_PROCESS_file': ('PRE_PROCESS_file', str),
-            'BASIC': ('BASIC', parse_boolean),
-            'SCREENERS': ('SCREENERS', parse_boolean),
-            'POST_PROCESS': ('POST_PROCESS', parse_boolean),
-            'BACKTESTING': ('BACKTESTING', parse_boolean),
-
-            # POST-PROCESSING CONFIGURATION
-            # Input historical data sources (local data loading)
-            'YF_daily_data_files': ('yf_daily_data_files', str),
-            'YF_weekly_data_files': ('yf_weekly_data_files', str),
-            'YF_monthly_data_files': ('yf_monthly_data_files', str),
-            'TW_intraday_folder': ('tw_intraday_folder', str),
-
-            # Environment detection and paths
-            'auto_detect_environment': ('auto_detect_environment', parse_boolean),
-            'manual_environment_override': ('manual_environment_override', str),
-
-            # Local environment paths
-            'YF_daily_data_files_local': ('yf_daily_data_files_local', str),
-            'YF_weekly_data_files_local': ('yf_weekly_data_files_local', str),
-            'YF_monthly_data_files_local': ('yf_monthly_data_files_local', str),
-            'TW_intraday_folder_local': ('tw_intraday_folder_local', str),
-
-            # Colab environment paths
-            'YF_daily_data_files_colab': ('yf_daily_data_files_colab', str),
-            'YF_weekly_data_files_colab': ('yf_weekly_data_files_colab', str),
-            'YF_monthly_data_files_colab': ('yf_monthly_data_files_colab', str),
-            'TW_intraday_folder_colab': ('tw_intraday_folder_colab', str),
-            
-            # Overview files
-            'indexes_overview_file': ('indexes_overview_file', str),
-            
-            # Index Overview Configuration
-            'SP500_overview': ('sp500_overview', parse_boolean),
-            'NASDAQ100_overview': ('nasdaq100_overview', parse_boolean),
-            'DJIA_overview': ('djia_overview', parse_boolean),
-            
-            # Index Period Configurations
-            'index_daily_daily_periods': ('index_daily_daily_periods', str),
-            'index_daily_weekly_periods': ('index_daily_weekly_periods', str),
-            'index_daily_monthly_periods': ('index_daily_monthly_periods', str),
-            'index_daily_quarterly_periods': ('index_daily_quarterly_periods', str),
-            'index_daily_yearly_periods': ('index_daily_yearly_periods', str),
-            
-            # Output directory configuration
-            'BASIC_CALCULATION_output_dir': ('basic_calculation_output_dir', str),
-            'STAGE_ANALYSIS_output_dir': ('stage_analysis_output_dir', str),
-            'RS_output_dir': ('rs_output_dir', str),
-            'PER_output_dir': ('per_output_dir', str),
-            # Screener output directories
-            'PVB_TWmodel_output_dir': ('pvb_TWmodel_output_dir', str),
-            'ATR1_output_dir': ('atr1_output_dir', str),
-            'DRWISH_output_dir': ('drwish_output_dir', str),
-            'GIUSTI_output_dir': ('giusti_output_dir', str),
-            'MINERVINI_output_dir': ('minervini_output_dir', str),
-            'STOCKBEE_output_dir': ('stockbee_output_dir', str),
-            'QULLAMAGGIE_output_dir': ('qullamaggie_output_dir', str),
-            'ADL_SCREENER_output_dir': ('adl_screener_output_dir', str),
-            'GUPPY_SCREENER_output_dir': ('guppy_screener_output_dir', str),
-            'GOLD_LAUNCH_PAD_output_dir': ('gold_launch_pad_output_dir', str),
-            'RTI_output_dir': ('rti_output_dir', str),
-
-            # Basic calculations (legacy)
-            'Basic_calculation_file': ('basic_calculation_file', str),
-            'Basic_calc_daily_enable': ('basic_calc_daily_enable', parse_boolean),
-            'Basic_calc_weekly_enable': ('basic_calc_weekly_enable', parse_boolean),
-            'Basic_calc_monthly_enable': ('basic_calc_monthly_enable', parse_boolean),
-            # Daily period percent change configuration
-            'daily_daily_periods': ('daily_daily_periods', str),
-            'daily_weekly_periods': ('daily_weekly_periods', str),
-            'daily_monthly_periods': ('daily_monthly_periods', str),
-            'daily_quarterly_periods': ('daily_quarterly_periods', str),
-            'daily_yearly_periods': ('daily_yearly_periods', str),
-            # Weekly period percent change configuration
-            'weekly_weekly_periods': ('weekly_weekly_periods', str),
-            'weekly_monthly_periods': ('weekly_monthly_periods', str),
-            # Monthly period percent change configuration
-            'monthly_monthly_periods': ('monthly_monthly_periods', str),
-            # Monthly RS periods
-            'RS_monthly_periods': ('RS_monthly_periods', str),
-
-            # SUSTAINABILITY RATIOS (SR) CONFIGURATION
-            'SR_enable': ('sr_enable', parse_boolean),
-            'SR_output_dir': ('sr_output_dir', str),
-            # SUBMODULE CONTROL FLAGS
-            'SR_panels_enable': ('sr_panels_enable', parse_boolean),
-            'SR_overview_enable': ('sr_overview_enable', parse_boolean),
-            'SR_intermarket_enable': ('sr_intermarket_enable', parse_boolean),
-            'SR_breadth_enable': ('sr_breadth_enable', parse_boolean),
-            # PANEL SUBMODULE CONFIGURATION
-            'SR_panel_config_file': ('sr_panel_config_file', str),
-            'SR_timeframes': ('sr_timeframes', str),
-            # New granular timeframe controls
-            'SR_timeframe_daily': ('sr_timeframe_daily', parse_boolean),
-            'SR_timeframe_weekly': ('sr_timeframe_weekly', parse_boolean),
-            'SR_timeframe_monthly': ('sr_timeframe_monthly', parse_boolean),
-            # OVERVIEW SUBMODULE CONFIGURATION
-            'SR_overview_values_enable': ('sr_overview_values_enable', parse_boolean),
-            'SR_overview_charts_enable': ('sr_overview_charts_enable', parse_boolean),
-            'SR_overview_values_history': ('sr_overview_values_history', int),
-            'SR_overview_values_indexes': ('sr_overview_values_indexes', str),
-            'SR_overview_values_sectors': ('sr_overview_values_sectors', str),
-            'SR_overview_values_industries': ('sr_overview_values_industries', str),
-            'SR_overview_values_timeframe': ('sr_overview_values_timeframe', str),
-            'SR_overview_output_dir': ('sr_overview_output_dir', str),
-            'SR_overview_filename_prefix': ('sr_overview_filename_prefix', str),
-            'SR_overview_charts_tickers': ('sr_overview_charts_tickers', str),
-            'SR_overview_charts_display_panel': ('sr_overview_charts_display_panel', str),
-            'SR_overview_charts_display_history': ('sr_overview_charts_display_history', int),
-            # Chart display range control
-            'SR_chart_display': ('sr_chart_display', int),
-            'SR_chart_generation': ('sr_chart_generation', parse_boolean),
-            'SR_intermarket_ratios': ('sr_intermarket_ratios', parse_boolean),
-            'SR_market_breadth': ('sr_market_breadth', parse_boolean),
-            'SR_save_detailed_results': ('sr_save_detailed_results', parse_boolean),
-            'SR_dashboard_style': ('sr_dashboard_style', str),
-            'SR_lookback_days': ('sr_lookback_days', int),
-
-            # MMM SUBMODULE CONFIGURATION
-            'SR_mmm_enable': ('sr_mmm_enable', parse_boolean),
-            'SR_mmm_daily_enable': ('sr_mmm_daily_enable', parse_boolean),
-            'SR_mmm_weekly_enable': ('sr_mmm_weekly_enable', parse_boolean),
-            'SR_mmm_monthly_enable': ('sr_mmm_monthly_enable', parse_boolean),
-            'SR_mmm_gaps_values': ('sr_mmm_gaps_values', parse_boolean),
-            'SR_mmm_gaps_tickers': ('sr_mmm_gaps_tickers', str),
-            'SR_mmm_gaps_values_input_folder_daily': ('sr_mmm_gaps_values_input_folder_daily', str),
-            'SR_mmm_gaps_values_input_folder_weekly': ('sr_mmm_gaps_values_input_folder_weekly', str),
-            'SR_mmm_gaps_values_input_folder_monthly': ('sr_mmm_gaps_values_input_folder_monthly', str),
-            'SR_mmm_gaps_values_output_folder_daily': ('sr_mmm_gaps_values_output_folder_daily', str),
-            'SR_mmm_gaps_values_output_folder_weekly': ('sr_mmm_gaps_values_output_folder_weekly', str),
-            'SR_mmm_gaps_values_output_folder_monthly': ('sr_mmm_gaps_values_output_folder_monthly', str),
-            'SR_mmm_gaps_values_filename_suffix': ('sr_mmm_gaps_values_filename_suffix', str),
-            'SR_mmm_gaps_chart_enable': ('sr_mmm_gaps_chart_enable', parse_boolean),
-            'SR_mmm_gaps_charts_display_panel': ('sr_mmm_gaps_charts_display_panel', str),
-            'SR_mmm_gaps_charts_display_history': ('sr_mmm_gaps_charts_display_history', int),
-            'SR_mmm_output_dir': ('sr_mmm_output_dir', str),
-
-            # Screeners
-            'screener_output_file': ('screener_output_file', str),
-            'screener_criteria_file': ('screener_criteria_file', str),
-            
-            # Models
-            'models_output_file': ('models_output_file', str),
-            'models_config_file': ('models_config_file', str),
-            
-            # Database configuration removed
-            
-            # PDF reports configuration
-            'pdf_reports_enable': ('pdf_reports_enable', parse_boolean),
-            'pdf_reports_output_dir': ('pdf_reports_output_dir', str),
-            'pdf_reports_include_charts': ('pdf_reports_include_charts', parse_boolean),
-            
-            # Report generation configuration
-            'REPORT_enable': ('report_enable', parse_boolean),
-            'REPORT_template_type': ('report_template_type', str),
-            'REPORT_page_size': ('report_page_size', str),
-            'REPORT_output_dir': ('report_output_dir', str),
-            'REPORT_include_charts': ('report_include_charts', parse_boolean),
-            'REPORT_file_dates_auto': ('report_file_dates_auto', parse_boolean),
-            'REPORT_file_dates_manual': ('report_file_dates_manual', str),
-            'REPORT_sections_basic_stats': ('report_sections_basic_stats', parse_boolean),
-            'REPORT_sections_percentage_analysis': ('report_sections_percentage_analysis', parse_boolean),
-            'REPORT_sections_rs_analysis': ('report_sections_rs_analysis', parse_boolean),
-            'REPORT_sections_tornado_charts': ('report_sections_tornado_charts', parse_boolean),
-            'REPORT_sections_summary': ('report_sections_summary', parse_boolean),
-            'REPORT_max_tickers_display': ('report_max_tickers_display', int),
-            'REPORT_format': ('report_format', str),
-            'REPORT_include_metadata': ('report_include_metadata', parse_boolean),
-
-            # Market Breadth Report Configuration (Independent of global REPORT_ settings)
-            'MARKET_BREADTH_REPORT_enable': ('market_breadth_report_enable', parse_boolean),
-            'MARKET_BREADTH_REPORT_template_type': ('market_breadth_report_template_type', str),
-            'MARKET_BREADTH_force_file': ('market_breadth_force_file', parse_boolean),
-
-            # Market Pulse GMI/GMI2 Report Configuration
-            'MARKET_PULSE_GMIGMI2_REPORT_enable': ('market_pulse_gmigmi2_report_enable', parse_boolean),
-
-            # Technical Indicators Configuration
-            'daily_ema_periods': ('daily_ema_periods', str),
-            'daily_sma_periods': ('daily_sma_periods', str),
-            'weekly_ema_periods': ('weekly_ema_periods', str),
-            'weekly_sma_periods': ('weekly_sma_periods', str),
-            'monthly_ema_periods': ('monthly_ema_periods', str),
-            'monthly_sma_periods': ('monthly_sma_periods', str),
-            
-            # Percentage Movers Configuration
-            'enable_movers_analysis': ('enable_movers_analysis', parse_boolean),
-            'daily_pct_threshold': ('daily_pct_threshold', float),
-            'weekly_pct_threshold': ('weekly_pct_threshold', float),
-            'movers_output_dir': ('movers_output_dir', str),
-            'movers_min_volume': ('movers_min_volume', int),
-            'movers_top_n': ('movers_top_n', int),
-            
-            # ATR Configuration
-            'enable_atr_calculation': ('enable_atr_calculation', parse_boolean),
-            'atr_period': ('atr_period', int),
-            'atr_sma_period': ('atr_sma_period', int),
-            'enable_atr_percentile': ('enable_atr_percentile', parse_boolean),
-            'atr_percentile_period': ('atr_percentile_period', int),
-            
-            # ATR Screener Configuration
-            # ATR1 (TradingView-validated)
-            'ATR1_enable': ('atr1_enable', parse_boolean),
-            'ATR1_daily_length': ('atr1_daily_length', int),
-            'ATR1_daily_factor': ('atr1_daily_factor', float),
-            'ATR1_daily_length2': ('atr1_daily_length2', int),
-            'ATR1_daily_factor2': ('atr1_daily_factor2', float),
-            'ATR1_weekly_length': ('atr1_weekly_length', int),
-            'ATR1_weekly_factor': ('atr1_weekly_factor', float),
-            'ATR1_weekly_length2': ('atr1_weekly_length2', int),
-            'ATR1_weekly_factor2': ('atr1_weekly_factor2', float),
-            'ATR1_monthly_length': ('atr1_monthly_length', int),
-            'ATR1_monthly_factor': ('atr1_monthly_factor', float),
-            'ATR1_monthly_length2': ('atr1_monthly_length2', int),
-            'ATR1_monthly_factor2': ('atr1_monthly_factor2', float),
-            
-            # ATR2 (Volatility analysis)
-            'ATR2_enable': ('atr2_enable', parse_boolean),
-            'ATR2_daily_atr_period': ('atr2_daily_atr_period', int),
-            'ATR2_daily_sma_period': ('atr2_daily_sma_period', int),
-            'ATR2_daily_percentile_period': ('atr2_daily_percentile_period', int),
-            'ATR2_weekly_atr_period': ('atr2_weekly_atr_period', int),
-            'ATR2_weekly_sma_period': ('atr2_weekly_sma_period', int),
-            'ATR2_weekly_percentile_period': ('atr2_weekly_percentile_period', int),
-            'ATR2_monthly_atr_period': ('atr2_monthly_atr_period', int),
-            'ATR2_monthly_sma_period': ('atr2_monthly_sma_period', int),
-            'ATR2_monthly_percentile_period': ('atr2_monthly_percentile_period', int),
-            
-            # Stage Analysis Configuration - Global
-            'enable_stage_analysis': ('enable_stage_analysis', parse_boolean),
-
-            # Stage Analysis Configuration - Daily
-            'stage_analysis_daily_enabled': ('stage_analysis_daily_enabled', parse_boolean),
-            'stage_daily_ema_fast_period': ('stage_daily_ema_fast_period', int),
-            'stage_daily_sma_medium_period': ('stage_daily_sma_medium_period', int),
-            'stage_daily_sma_slow_period': ('stage_daily_sma_slow_period', int),
-            'stage_daily_atr_period': ('stage_daily_atr_period', int),
-            'stage_daily_atr_threshold_low': ('stage_daily_atr_threshold_low', float),
-            'stage_daily_atr_threshold_high': ('stage_daily_atr_threshold_high', float),
-            'stage_daily_ma_convergence_threshold': ('stage_daily_ma_convergence_threshold', float),
-            
-            # Stage Analysis Configuration - Weekly
-            'stage_analysis_weekly_enabled': ('stage_analysis_weekly_enabled', parse_boolean),
-            'stage_weekly_ema_fast_period': ('stage_weekly_ema_fast_period', int),
-            'stage_weekly_sma_medium_period': ('stage_weekly_sma_medium_period', int),
-            'stage_weekly_sma_slow_period': ('stage_weekly_sma_slow_period', int),
-            'stage_weekly_atr_period': ('stage_weekly_atr_period', int),
-            'stage_weekly_atr_threshold_low': ('stage_weekly_atr_threshold_low', float),
-            'stage_weekly_atr_threshold_high': ('stage_weekly_atr_threshold_high', float),
-            'stage_weekly_ma_convergence_threshold': ('stage_weekly_ma_convergence_threshold', float),
-            
-            # Stage Analysis Configuration - Monthly
-            'stage_analysis_monthly_enabled': ('stage_analysis_monthly_enabled', parse_boolean),
-            'stage_monthly_ema_fast_period': ('stage_monthly_ema_fast_period', int),
-            'stage_monthly_sma_medium_period': ('stage_monthly_sma_medium_period', int),
-            'stage_monthly_sma_slow_period': ('stage_monthly_sma_slow_period', int),
-            'stage_monthly_atr_period': ('stage_monthly_atr_period', int),
-            'stage_monthly_atr_threshold_low': ('stage_monthly_atr_threshold_low', float),
-            'stage_monthly_atr_threshold_high': ('stage_monthly_atr_threshold_high', float),
-            'stage_monthly_ma_convergence_threshold': ('stage_monthly_ma_convergence_threshold', float),
-            
-            # Legacy Stage Analysis Configuration (deprecated)
-            'stage_analysis_enabled': ('stage_analysis_enabled', parse_boolean),
-            'stage_analysis_min_price': ('stage_analysis_min_price', float),
-            'stage_analysis_min_vol': ('stage_analysis_min_vol', int),
-            'stage_analysis_report_enable': ('stage_analysis_report_enable', parse_boolean),
-            'stage_ema_fast_period': ('stage_ema_fast_period', int),
-            'stage_sma_medium_period': ('stage_sma_medium_period', int),
-            'stage_sma_slow_period': ('stage_sma_slow_period', int),
-            'stage_atr_period': ('stage_atr_period', int),
-            'stage_atr_threshold_low': ('stage_atr_threshold_low', float),
-            'stage_atr_threshold_high': ('stage_atr_threshold_high', float),
-            'stage_ma_convergence_threshold': ('stage_ma_convergence_threshold', float),
-            
-            # Relative Strength Configuration
-            'RS_enable_stocks': ('rs_enable_stocks', parse_boolean),
-            'RS_enable_sectors': ('rs_enable_sectors', parse_boolean),
-            'RS_enable_industries': ('rs_enable_industries', parse_boolean),
-            # Multi-benchmark configuration
-            'RS_benchmark_tickers': ('rs_benchmark_tickers', str),
-            # Legacy single benchmark
-            'RS_benchmark_ticker': ('rs_benchmark_ticker', str),
-            'RS_composite_method': ('rs_composite_method', str),
-            'RS_output_dir': ('rs_output_dir', str),
-            'RS_min_group_size': ('rs_min_group_size', int),
-            # Percentile universe configurations
-            'RS_percentile_universe_stocks': ('rs_percentile_universe_stocks', str),
-            'RS_percentile_universe_sectors': ('rs_percentile_universe_sectors', str),
-            'RS_percentile_universe_industries': ('rs_percentile_universe_industries', str),
-
-            # New mapping-based percentile configuration
-            'RS_percentile_mapping_stocks': ('rs_percentile_mapping_stocks', str),
-            'RS_percentile_mapping_sectors': ('rs_percentile_mapping_sectors', str),
-            'RS_percentile_mapping_industries': ('rs_percentile_mapping_industries', str),
-            # Daily timeframe parameters
-            'RS_daily_enable': ('rs_daily_enable', parse_boolean),
-            # Weekly timeframe parameters
-            'RS_weekly_enable': ('rs_weekly_enable', parse_boolean),
-            # Monthly timeframe parameters
-            'RS_monthly_enable': ('rs_monthly_enable', parse_boolean),
-
-            # Moving Average RS Configuration
-            'RS_ma_enable': ('rs_ma_enable', parse_boolean),
-            'RS_ma_method': ('rs_ma_method', str),
-            'RS_method_for_PER': ('rs_method_for_per', str),
-
-            # Technical Indicators Configuration
-            'INDICATORS_enable': ('indicators_enable', parse_boolean),
-            'INDICATORS_config_file': ('indicators_config_file', str),
-            'INDICATORS_output_dir': ('indicators_output_dir', str),
-            'INDICATORS_charts_dir': ('indicators_charts_dir', str),
-            
-            # Default Indicator Parameters
-            'INDICATORS_kurutoga_enable': ('indicators_kurutoga_enable', parse_boolean),
-            'INDICATORS_kurutoga_length': ('indicators_kurutoga_length', int),
-            'INDICATORS_kurutoga_source': ('indicators_kurutoga_source', str),
-            
-            'INDICATORS_tsi_enable': ('indicators_tsi_enable', parse_boolean),
-            'INDICATORS_tsi_fast': ('indicators_tsi_fast', int),
-            'INDICATORS_tsi_slow': ('indicators_tsi_slow', int),
-            'INDICATORS_tsi_signal': ('indicators_tsi_signal', int),
-            
-            'INDICATORS_macd_enable': ('indicators_macd_enable', parse_boolean),
-            'INDICATORS_macd_fast': ('indicators_macd_fast', int),
-            'INDICATORS_macd_slow': ('indicators_macd_slow', int),
-            'INDICATORS_macd_signal': ('indicators_macd_signal', int),
-            
-            'INDICATORS_mfi_enable': ('indicators_mfi_enable', parse_boolean),
-            'INDICATORS_mfi_length': ('indicators_mfi_length', int),
-            'INDICATORS_mfi_signal_enable': ('indicators_mfi_signal_enable', parse_boolean),
-            'INDICATORS_mfi_signal_period': ('indicators_mfi_signal_period', int),
-            
-            'INDICATORS_cog_enable': ('indicators_cog_enable', parse_boolean),
-            'INDICATORS_cog_length': ('indicators_cog_length', int),
-            'INDICATORS_cog_source': ('indicators_cog_source', str),
-            
-            'INDICATORS_momentum_enable': ('indicators_momentum_enable', parse_boolean),
-            'INDICATORS_momentum_length': ('indicators_momentum_length', int),
-            
-            'INDICATORS_rsi_enable': ('indicators_rsi_enable', parse_boolean),
-            'INDICATORS_rsi_length': ('indicators_rsi_length', int),
-            
-            'INDICATORS_ma_crosses_enable': ('indicators_ma_crosses_enable', parse_boolean),
-            'INDICATORS_ma_fast_period': ('indicators_ma_fast_period', int),
-            'INDICATORS_ma_slow_period': ('indicators_ma_slow_period', int),
-            
-            'INDICATORS_easy_trade_enable': ('indicators_easy_trade_enable', parse_boolean),
-            'INDICATORS_easy_trade_fast': ('indicators_easy_trade_fast', int),
-            'INDICATORS_easy_trade_slow': ('indicators_easy_trade_slow', int),
-            'INDICATORS_easy_trade_signal': ('indicators_easy_trade_signal', int),
-            
-            # Basic Screeners Configuration
-            'BASIC_momentum_enable': ('basic_momentum_enable', parse_boolean),
-            'BASIC_breakout_enable': ('basic_breakout_enable', parse_boolean),
-            'BASIC_value_momentum_enable': ('basic_value_momentum_enable', parse_boolean),
-            
-            # PVB (Price Volume Breakout) Configuration
-            'PVB_TWmodel_enable': ('pvb_TWmodel_enable', parse_boolean),
-            'PVB_TWmodel_daily_enable': ('pvb_TWmodel_daily_enable', parse_boolean),
-            'PVB_TWmodel_weekly_enable': ('pvb_TWmodel_weekly_enable', parse_boolean),
-            'PVB_TWmodel_monthly_enable': ('pvb_TWmodel_monthly_enable', parse_boolean),
-            # Daily timeframe PVB parameters
-            'PVB_TWmodel_daily_price_breakout_period': ('pvb_TWmodel_daily_price_breakout_period', int),
-            'PVB_TWmodel_daily_volume_breakout_period': ('pvb_TWmodel_daily_volume_breakout_period', int),
-            'PVB_TWmodel_daily_trendline_length': ('pvb_TWmodel_daily_trendline_length', int),
-            'PVB_TWmodel_daily_close_threshold': ('pvb_TWmodel_daily_close_threshold', int),
-            'PVB_TWmodel_daily_signal_max_age': ('pvb_TWmodel_daily_signal_max_age', int),
-            # Weekly timeframe PVB parameters
-            'PVB_TWmodel_weekly_price_breakout_period': ('pvb_TWmodel_weekly_price_breakout_period', int),
-            'PVB_TWmodel_weekly_volume_breakout_period': ('pvb_TWmodel_weekly_volume_breakout_period', int),
-            'PVB_TWmodel_weekly_trendline_length': ('pvb_TWmodel_weekly_trendline_length', int),
-            'PVB_TWmodel_weekly_close_threshold': ('pvb_TWmodel_weekly_close_threshold', int),
-            'PVB_TWmodel_weekly_signal_max_age': ('pvb_TWmodel_weekly_signal_max_age', int),
-            # Monthly timeframe PVB parameters
-            'PVB_TWmodel_monthly_price_breakout_period': ('pvb_TWmodel_monthly_price_breakout_period', int),
-            'PVB_TWmodel_monthly_volume_breakout_period': ('pvb_TWmodel_monthly_volume_breakout_period', int),
-            'PVB_TWmodel_monthly_trendline_length': ('pvb_TWmodel_monthly_trendline_length', int),
-            'PVB_TWmodel_monthly_close_threshold': ('pvb_TWmodel_monthly_close_threshold', int),
-            'PVB_TWmodel_monthly_signal_max_age': ('pvb_TWmodel_monthly_signal_max_age', int),
-            # Common PVB parameters
-            'PVB_TWmodel_order_direction': ('pvb_TWmodel_order_direction', str),
-            'PVB_TWmodel_min_volume': ('pvb_TWmodel_min_volume', int),
-            'PVB_TWmodel_min_price': ('pvb_TWmodel_min_price', float),
-            # TradingView Watchlist Export Configuration
-            'PVB_TWmodel_export_tradingview': ('pvb_TWmodel_export_tradingview', parse_boolean),
-            'PVB_TWmodel_watchlist_max_symbols': ('pvb_TWmodel_watchlist_max_symbols', int),
-            'PVB_TWmodel_watchlist_include_buy': ('pvb_TWmodel_watchlist_include_buy', parse_boolean),
-            'PVB_TWmodel_watchlist_include_sell': ('pvb_TWmodel_watchlist_include_sell', parse_boolean),
-
-            # Minervini Template Screener Configuration
-            'MINERVINI_enable': ('minervini_enable', parse_boolean),
-            'MINERVINI_rs_min_rating': ('minervini_rs_min_rating', float),
-            'MINERVINI_min_volume': ('minervini_min_volume', int),
-            'MINERVINI_min_price': ('minervini_min_price', float),
-            'MINERVINI_show_all_stocks': ('minervini_show_all_stocks', parse_boolean),
-            
-            # Giusti Momentum Screener Configuration
-            'GIUSTI_enable': ('giusti_enable', parse_boolean),
-            'GIUSTI_min_price': ('giusti_min_price', float),
-            'GIUSTI_min_volume': ('giusti_min_volume', int),
-            'GIUSTI_rolling_12m': ('giusti_rolling_12m', int),
-            'GIUSTI_rolling_6m': ('giusti_rolling_6m', int),
-            'GIUSTI_rolling_3m': ('giusti_rolling_3m', int),
-            'GIUSTI_top_12m_count': ('giusti_top_12m_count', int),
-            'GIUSTI_top_6m_count': ('giusti_top_6m_count', int),
-            'GIUSTI_top_3m_count': ('giusti_top_3m_count', int),
-            'GIUSTI_min_history_months': ('giusti_min_history_months', int),
-            'GIUSTI_show_all_stocks': ('giusti_show_all_stocks', parse_boolean),
-            
-            # Dr. Wish Suite Screener Configuration
-            'DRWISH_enable': ('drwish_enable', parse_boolean),
-            'DRWISH_min_price': ('drwish_min_price', float),
-            'DRWISH_min_volume': ('drwish_min_volume', int),
-            'DRWISH_pivot_strength': ('drwish_pivot_strength', int),
-            'DRWISH_lookback_period': ('drwish_lookback_period', str),
-            'DRWISH_confirmation_period': ('drwish_confirmation_period', str),
-            'DRWISH_require_confirmation': ('drwish_require_confirmation', parse_boolean),
-            'DRWISH_enable_glb': ('drwish_enable_glb', parse_boolean),
-            'DRWISH_enable_blue_dot': ('drwish_enable_blue_dot', parse_boolean),
-            'DRWISH_enable_black_dot': ('drwish_enable_black_dot', parse_boolean),
-            'DRWISH_blue_dot_stoch_period': ('drwish_blue_dot_stoch_period', int),
-            'DRWISH_blue_dot_stoch_threshold': ('drwish_blue_dot_stoch_threshold', float),
-            'DRWISH_blue_dot_sma_period': ('drwish_blue_dot_sma_period', int),
-            'DRWISH_black_dot_stoch_period': ('drwish_black_dot_stoch_period', int),
-            'DRWISH_black_dot_stoch_threshold': ('drwish_black_dot_stoch_threshold', float),
-            'DRWISH_black_dot_lookback': ('drwish_black_dot_lookback', int),
-            'DRWISH_black_dot_sma_period': ('drwish_black_dot_sma_period', int),
-            'DRWISH_black_dot_ema_period': ('drwish_black_dot_ema_period', int),
-            'DRWISH_show_all_stocks': ('drwish_show_all_stocks', parse_boolean),
-            'DRWISH_enable_charts': ('drwish_enable_charts', parse_boolean),
-            'DRWISH_chart_output_dir': ('drwish_chart_output_dir', str),
-            
-            # Volume Suite Configuration
-            'VOLUME_SUITE_enable': ('volume_suite_enable', parse_boolean),
-            'VOLUME_SUITE_daily_enable': ('volume_suite_daily_enable', parse_boolean),
-            'VOLUME_SUITE_weekly_enable': ('volume_suite_weekly_enable', parse_boolean),
-            'VOLUME_SUITE_monthly_enable': ('volume_suite_monthly_enable', parse_boolean),
-            'VOLUME_SUITE_hv_absolute': ('volume_suite_hv_absolute', parse_boolean),
-            'VOLUME_SUITE_hv_stdv': ('volume_suite_hv_stdv', parse_boolean),
-            'VOLUME_SUITE_enhanced_anomaly': ('volume_suite_enhanced_anomaly', parse_boolean),
-            'VOLUME_SUITE_volume_indicators': ('volume_suite_volume_indicators', parse_boolean),
-            'VOLUME_SUITE_pvb_Clmodel_integration': ('volume_suite_pvb_clmodel_integration', parse_boolean),
-            'VOLUME_SUITE_hv_month_cutoff': ('volume_suite_hv_month_cutoff', int),
-            'VOLUME_SUITE_hv_day_cutoff': ('volume_suite_hv_day_cutoff', int),
-            'VOLUME_SUITE_hv_std_cutoff': ('volume_suite_hv_std_cutoff', int),
-            'VOLUME_SUITE_hv_min_volume': ('volume_suite_hv_min_volume', int),
-            'VOLUME_SUITE_hv_min_price': ('volume_suite_hv_min_price', float),
-            'VOLUME_SUITE_stdv_cutoff': ('volume_suite_stdv_cutoff', int),
-            'VOLUME_SUITE_stdv_min_volume': ('volume_suite_stdv_min_volume', int),
-            'VOLUME_SUITE_vroc_threshold': ('volume_suite_vroc_threshold', int),
-            'VOLUME_SUITE_rvol_threshold': ('volume_suite_rvol_threshold', float),
-            'VOLUME_SUITE_rvol_extreme_threshold': ('volume_suite_rvol_extreme_threshold', float),
-            'VOLUME_SUITE_mfi_overbought': ('volume_suite_mfi_overbought', int),
-            'VOLUME_SUITE_mfi_oversold': ('volume_suite_mfi_oversold', int),
-            'VOLUME_SUITE_vpt_threshold': ('volume_suite_vpt_threshold', float),
-            'VOLUME_SUITE_adtv_3m_threshold': ('volume_suite_adtv_3m_threshold', float),
-            'VOLUME_SUITE_adtv_6m_threshold': ('volume_suite_adtv_6m_threshold', float),
-            'VOLUME_SUITE_adtv_1y_threshold': ('volume_suite_adtv_1y_threshold', float),
-            'VOLUME_SUITE_adtv_min_volume': ('volume_suite_adtv_min_volume', int),
-            'VOLUME_SUITE_output_dir': ('volume_suite_output_dir', str),
-            'VOLUME_SUITE_save_individual_files': ('volume_suite_save_individual_files', parse_boolean),
-            'VOLUME_SUITE_pvb_Clmodel_price_period': ('volume_suite_pvb_clmodel_price_period', int),
-            'VOLUME_SUITE_pvb_Clmodel_volume_period': ('volume_suite_pvb_clmodel_volume_period', int),
-            'VOLUME_SUITE_pvb_Clmodel_trend_length': ('volume_suite_pvb_clmodel_trend_length', int),
-            'VOLUME_SUITE_pvb_Clmodel_volume_multiplier': ('volume_suite_pvb_clmodel_volume_multiplier', float),
-            'VOLUME_SUITE_pvb_Clmodel_direction': ('volume_suite_pvb_clmodel_direction', str),
-            
-            # Stockbee Suite Configuration
-            'STOCKBEE_SUITE_enable': ('stockbee_suite_enable', parse_boolean),
-            'STOCKBEE_SUITE_daily_enable': ('stockbee_suite_daily_enable', parse_boolean),
-            'STOCKBEE_SUITE_weekly_enable': ('stockbee_suite_weekly_enable', parse_boolean),
-            'STOCKBEE_SUITE_monthly_enable': ('stockbee_suite_monthly_enable', parse_boolean),
-            'STOCKBEE_SUITE_9m_movers': ('stockbee_suite_9m_movers', parse_boolean),
-            'STOCKBEE_SUITE_weekly_movers': ('stockbee_suite_weekly_movers', parse_boolean),
-            'STOCKBEE_SUITE_daily_gainers': ('stockbee_suite_daily_gainers', parse_boolean),
-            'STOCKBEE_SUITE_industry_leaders': ('stockbee_suite_industry_leaders', parse_boolean),
-            'STOCKBEE_SUITE_min_market_cap': ('stockbee_suite_min_market_cap', int),
-            'STOCKBEE_SUITE_min_price': ('stockbee_suite_min_price', float),
-            'STOCKBEE_SUITE_exclude_funds': ('stockbee_suite_exclude_funds', parse_boolean),
-            'STOCKBEE_SUITE_9m_volume_threshold': ('stockbee_suite_9m_volume_threshold', int),
-            'STOCKBEE_SUITE_9m_rel_vol_threshold': ('stockbee_suite_9m_rel_vol_threshold', float),
-            'STOCKBEE_SUITE_weekly_gain_threshold': ('stockbee_suite_weekly_gain_threshold', float),
-            'STOCKBEE_SUITE_weekly_rel_vol_threshold': ('stockbee_suite_weekly_rel_vol_threshold', float),
-            'STOCKBEE_SUITE_weekly_min_avg_volume': ('stockbee_suite_weekly_min_avg_volume', int),
-            'STOCKBEE_SUITE_daily_gain_threshold': ('stockbee_suite_daily_gain_threshold', float),
-            'STOCKBEE_SUITE_daily_rel_vol_threshold': ('stockbee_suite_daily_rel_vol_threshold', float),
-            'STOCKBEE_SUITE_daily_min_volume': ('stockbee_suite_daily_min_volume', int),
-            'STOCKBEE_SUITE_industry_top_pct': ('stockbee_suite_industry_top_pct', float),
-            'STOCKBEE_SUITE_industry_top_stocks': ('stockbee_suite_industry_top_stocks', int),
-            'STOCKBEE_SUITE_industry_min_size': ('stockbee_suite_industry_min_size', int),
-            'STOCKBEE_SUITE_9m_relative_volume': ('stockbee_suite_9m_relative_volume', float),
-            'STOCKBEE_SUITE_weekly_min_volume': ('stockbee_suite_weekly_min_volume', int),
-            'STOCKBEE_SUITE_save_individual_files': ('stockbee_suite_save_individual_files', parse_boolean),
-
-            # Qullamaggie Suite Configuration
-            'QULLAMAGGIE_SUITE_enable': ('qullamaggie_suite_enable', parse_boolean),
-            'QULLAMAGGIE_SUITE_rs_threshold': ('qullamaggie_suite_rs_threshold', float),
-            'QULLAMAGGIE_SUITE_atr_rs_threshold': ('qullamaggie_suite_atr_rs_threshold', float),
-            'QULLAMAGGIE_SUITE_range_position_threshold': ('qullamaggie_suite_range_position_threshold', float),
-            'QULLAMAGGIE_SUITE_min_market_cap': ('qullamaggie_suite_min_market_cap', int),
-            'QULLAMAGGIE_SUITE_min_price': ('qullamaggie_suite_min_price', float),
-            'QULLAMAGGIE_SUITE_extension_warning': ('qullamaggie_suite_extension_warning', float),
-            'QULLAMAGGIE_SUITE_extension_danger': ('qullamaggie_suite_extension_danger', float),
-            'QULLAMAGGIE_SUITE_min_data_length': ('qullamaggie_suite_min_data_length', int),
-            
-            # ADL Screener Configuration
-            'ADL_SCREENER_enable': ('adl_screener_enable', parse_boolean),
-            'ADL_SCREENER_daily_enable': ('adl_screener_daily_enable', parse_boolean),
-            'ADL_SCREENER_weekly_enable': ('adl_screener_weekly_enable', parse_boolean),
-            'ADL_SCREENER_monthly_enable': ('adl_screener_monthly_enable', parse_boolean),
-
-            # Base ADL calculation parameters
-            'ADL_SCREENER_lookback_period': ('adl_screener_lookback_period', int),
-            'ADL_SCREENER_divergence_period': ('adl_screener_divergence_period', int),
-            'ADL_SCREENER_breakout_period': ('adl_screener_breakout_period', int),
-            'ADL_SCREENER_min_divergence_strength': ('adl_screener_min_divergence_strength', float),
-            'ADL_SCREENER_min_breakout_strength': ('adl_screener_min_breakout_strength', float),
-            'ADL_SCREENER_min_volume_avg': ('adl_screener_min_volume_avg', int),
-            'ADL_SCREENER_min_price': ('adl_screener_min_price', float),
-            'ADL_SCREENER_save_individual_files': ('adl_screener_save_individual_files', parse_boolean),
-
-            # Month-over-Month Analysis
-            'ADL_SCREENER_mom_analysis_enable': ('adl_screener_mom_analysis_enable', parse_boolean),
-            'ADL_SCREENER_mom_period': ('adl_screener_mom_period', int),
-            'ADL_SCREENER_mom_min_threshold_pct': ('adl_screener_mom_min_threshold_pct', float),
-            'ADL_SCREENER_mom_max_threshold_pct': ('adl_screener_mom_max_threshold_pct', float),
-            'ADL_SCREENER_mom_consecutive_months': ('adl_screener_mom_consecutive_months', int),
-            'ADL_SCREENER_mom_lookback_months': ('adl_screener_mom_lookback_months', int),
-            'ADL_SCREENER_mom_min_consistency_score': ('adl_screener_mom_min_consistency_score', float),
-
-            # Short-term Momentum Analysis
-            'ADL_SCREENER_short_term_enable': ('adl_screener_short_term_enable', parse_boolean),
-            'ADL_SCREENER_short_term_periods': ('adl_screener_short_term_periods', str),
-            'ADL_SCREENER_short_term_momentum_threshold': ('adl_screener_short_term_momentum_threshold', float),
-            'ADL_SCREENER_short_term_acceleration_detect': ('adl_screener_short_term_acceleration_detect', parse_boolean),
-            'ADL_SCREENER_short_term_min_score': ('adl_screener_short_term_min_score', float),
-
-            # Moving Average Analysis
-            'ADL_SCREENER_ma_enable': ('adl_screener_ma_enable', parse_boolean),
-            'ADL_SCREENER_ma_periods': ('adl_screener_ma_periods', str),
-            'ADL_SCREENER_ma_type': ('adl_screener_ma_type', str),
-            'ADL_SCREENER_ma_bullish_alignment_required': ('adl_screener_ma_bullish_alignment_required', parse_boolean),
-            'ADL_SCREENER_ma_crossover_detection': ('adl_screener_ma_crossover_detection', parse_boolean),
-            'ADL_SCREENER_ma_crossover_lookback': ('adl_screener_ma_crossover_lookback', int),
-            'ADL_SCREENER_ma_min_slope_threshold': ('adl_screener_ma_min_slope_threshold', float),
-            'ADL_SCREENER_ma_min_alignment_score': ('adl_screener_ma_min_alignment_score', float),
-
-            # Composite Scoring and Ranking
-            'ADL_SCREENER_composite_scoring_enable': ('adl_screener_composite_scoring_enable', parse_boolean),
-            'ADL_SCREENER_composite_weight_longterm': ('adl_screener_composite_weight_longterm', float),
-            'ADL_SCREENER_composite_weight_shortterm': ('adl_screener_composite_weight_shortterm', float),
-            'ADL_SCREENER_composite_weight_ma_align': ('adl_screener_composite_weight_ma_align', float),
-            'ADL_SCREENER_composite_min_score': ('adl_screener_composite_min_score', float),
-            'ADL_SCREENER_ranking_method': ('adl_screener_ranking_method', str),
-            'ADL_SCREENER_output_ranking_file': ('adl_screener_output_ranking_file', parse_boolean),
-            'ADL_SCREENER_top_candidates_count': ('adl_screener_top_candidates_count', int),
-
-            # Output Configuration
-            'ADL_SCREENER_output_separate_signals': ('adl_screener_output_separate_signals', parse_boolean),
-            'ADL_SCREENER_output_include_charts': ('adl_screener_output_include_charts', parse_boolean),
-            'ADL_SCREENER_output_summary_stats': ('adl_screener_output_summary_stats', parse_boolean),
-            
-            # Guppy GMMA Screener Configuration
-            'GUPPY_SCREENER_enable': ('guppy_screener_enable', parse_boolean),
-            'GUPPY_SCREENER_daily_enable': ('guppy_screener_daily_enable', parse_boolean),
-            'GUPPY_SCREENER_weekly_enable': ('guppy_screener_weekly_enable', parse_boolean),
-            'GUPPY_SCREENER_monthly_enable': ('guppy_screener_monthly_enable', parse_boolean),
-            'GUPPY_SCREENER_ma_type': ('guppy_screener_ma_type', str),
-            'GUPPY_SCREENER_short_term_group_daily': ('guppy_screener_short_term_emas', parse_comma_separated_ints),
-            'GUPPY_SCREENER_long_term_group_daily': ('guppy_screener_long_term_emas', parse_comma_separated_ints),
-            'GUPPY_SCREENER_min_compression_ratio': ('guppy_screener_min_compression_ratio', float),
-            'GUPPY_SCREENER_min_expansion_ratio': ('guppy_screener_min_expansion_ratio', float),
-            'GUPPY_SCREENER_crossover_confirmation_days': ('guppy_screener_crossover_confirmation_days', int),
-            'GUPPY_SCREENER_volume_confirmation_threshold': ('guppy_screener_volume_confirmation_threshold', float),
-            'GUPPY_SCREENER_min_price': ('guppy_screener_min_price', float),
-            'GUPPY_SCREENER_min_volume_avg': ('guppy_screener_min_volume_avg', int),
-            'GUPPY_SCREENER_min_data_length': ('guppy_screener_min_data_length', int),
-            'GUPPY_SCREENER_save_individual_files': ('guppy_screener_save_individual_files', parse_boolean),
-            
-            # Gold Launch Pad CSV mappings
-            'GOLD_LAUNCH_PAD_enable': ('gold_launch_pad_enable', parse_boolean),
-            'GOLD_LAUNCH_PAD_daily_enable': ('gold_launch_pad_daily_enable', parse_boolean),
-            'GOLD_LAUNCH_PAD_weekly_enable': ('gold_launch_pad_weekly_enable', parse_boolean),
-            'GOLD_LAUNCH_PAD_monthly_enable': ('gold_launch_pad_monthly_enable', parse_boolean),
-            'GOLD_LAUNCH_PAD_ma_periods': ('gold_launch_pad_ma_periods', _parse_period_string),
-            'GOLD_LAUNCH_PAD_ma_type': ('gold_launch_pad_ma_type', str),
-            'GOLD_LAUNCH_PAD_zscore_window': ('gold_launch_pad_zscore_window', int),
-            'GOLD_LAUNCH_PAD_max_spread_threshold': ('gold_launch_pad_max_spread_threshold', float),
-            'GOLD_LAUNCH_PAD_slope_lookback_pct': ('gold_launch_pad_slope_lookback_pct', float),
-            'GOLD_LAUNCH_PAD_min_slope_threshold': ('gold_launch_pad_min_slope_threshold', float),
-            'GOLD_LAUNCH_PAD_price_proximity_stdv': ('gold_launch_pad_price_proximity_stdv', float),
-            'GOLD_LAUNCH_PAD_proximity_window': ('gold_launch_pad_proximity_window', int),
-            'GOLD_LAUNCH_PAD_min_price': ('gold_launch_pad_min_price', float),
-            'GOLD_LAUNCH_PAD_min_volume': ('gold_launch_pad_min_volume', int),
-            'GOLD_LAUNCH_PAD_save_individual_files': ('gold_launch_pad_save_individual_files', parse_boolean),
-            
-            # RTI CSV mappings
-            'RTI_enable': ('rti_enable', parse_boolean),
-            'RTI_daily_enable': ('rti_daily_enable', parse_boolean),
-            'RTI_weekly_enable': ('rti_weekly_enable', parse_boolean),
-            'RTI_monthly_enable': ('rti_monthly_enable', parse_boolean),
-            'RTI_period': ('rti_period', int),
-            'RTI_short_period': ('rti_short_period', int),
-            'RTI_swing_period': ('rti_swing_period', int),
-            'RTI_zone1_threshold': ('rti_zone1_threshold', float),
-            'RTI_zone2_threshold': ('rti_zone2_threshold', float),
-            'RTI_zone3_threshold': ('rti_zone3_threshold', float),
-            'RTI_low_volatility_threshold': ('rti_low_volatility_threshold', float),
-            'RTI_expansion_multiplier': ('rti_expansion_multiplier', float),
-            'RTI_consecutive_low_vol_bars': ('rti_consecutive_low_vol_bars', int),
-            'RTI_min_consolidation_period': ('rti_min_consolidation_period', int),
-            'RTI_breakout_confirmation_period': ('rti_breakout_confirmation_period', int),
-            'RTI_min_price': ('rti_min_price', float),
-            'RTI_min_volume': ('rti_min_volume', int),
-            'RTI_save_individual_files': ('rti_save_individual_files', parse_boolean),
-
-            'VOLUME_SUITE_pvb_TWmodel_integration': ('volume_suite_pvb_clmodel_integration', parse_boolean),
-            'VOLUME_SUITE_hv_month_cutoff': ('volume_suite_hv_month_cutoff', int),
-            'VOLUME_SUITE_hv_day_cutoff': ('volume_suite_hv_day_cutoff', int),
-            'VOLUME_SUITE_hv_std_cutoff': ('volume_suite_hv_std_cutoff', int),
-            'VOLUME_SUITE_hv_min_volume': ('volume_suite_hv_min_volume', int),
-            'VOLUME_SUITE_hv_min_price': ('volume_suite_hv_min_price', float),
-            'VOLUME_SUITE_stdv_cutoff': ('volume_suite_stdv_cutoff', int),
-            'VOLUME_SUITE_stdv_min_volume': ('volume_suite_stdv_min_volume', int),
-            'VOLUME_SUITE_vroc_threshold': ('volume_suite_vroc_threshold', float),
-            'VOLUME_SUITE_rvol_threshold': ('volume_suite_rvol_threshold', float),
-            'VOLUME_SUITE_rvol_extreme_threshold': ('volume_suite_rvol_extreme_threshold', float),
-            'VOLUME_SUITE_mfi_overbought': ('volume_suite_mfi_overbought', int),
-            'VOLUME_SUITE_mfi_oversold': ('volume_suite_mfi_oversold', int),
-            'VOLUME_SUITE_vpt_threshold': ('volume_suite_vpt_threshold', float),
-            'VOLUME_SUITE_output_dir': ('volume_suite_output_dir', str),
-            
-            # Performance optimization
-            'cap_history_data': ('cap_history_data', int),
-            
-            # Market Pulse Configuration
-            'MARKET_PULSE_enable': ('market_pulse_enable', parse_boolean),
-            'MARKET_PULSE_gmi_enable': ('market_pulse_gmi_enable', parse_boolean),
-            'MARKET_PULSE_gmi_threshold': ('market_pulse_gmi_threshold', int),
-            'MARKET_PULSE_gmi_confirmation_days': ('market_pulse_gmi_confirmation_days', int),
-            'MARKET_PULSE_gmi_short_term_sma': ('market_pulse_gmi_short_term_sma', int),
-            'MARKET_PULSE_gmi_long_term_sma': ('market_pulse_gmi_long_term_sma', int),
-            'MARKET_PULSE_gmi_MF_index': ('market_pulse_gmi_mf_index', str),
-            'MARKET_PULSE_gmi_index1': ('market_pulse_gmi_index1', str),
-            'MARKET_PULSE_gmi_index2': ('market_pulse_gmi_index2', str),
-            'MARKET_PULSE_gmi_MF_ma_period': ('market_pulse_gmi_mf_ma_period', int),
-            'MARKET_PULSE_gmi_breath_file_suffix': ('market_pulse_gmi_breath_file_suffix', str),
-
-            # GMI2 Configuration mappings
-            'MARKET_PULSE_gmi2_enable': ('market_pulse_gmi2_enable', parse_boolean),
-            'MARKET_PULSE_gmi2_index': ('market_pulse_gmi2_index', str),
-            'MARKET_PULSE_gmi2_sma': ('market_pulse_gmi2_sma', str),
-            'MARKET_PULSE_gmi2_index_stochastic_threshold': ('market_pulse_gmi2_index_stochastic_threshold', int),
-            'MARKET_PULSE_gmi2_threshold': ('market_pulse_gmi2_threshold', int),
-            'MARKET_PULSE_gmi2_confirmation_days': ('market_pulse_gmi2_confirmation_days', int),
-            
-            'MARKET_PULSE_ftd_dd_enable': ('market_pulse_ftd_dd_enable', parse_boolean),
-            'MARKET_PULSE_ftd_dd_report_enable': ('market_pulse_ftd_dd_report_enable', parse_boolean),
-            'MARKET_PULSE_comprehensive_report_enable': ('market_pulse_comprehensive_report_enable', parse_boolean),
-            'MARKET_PULSE_dd_threshold': ('market_pulse_dd_threshold', float),
-            'MARKET_PULSE_ftd_threshold': ('market_pulse_ftd_threshold', float),
-            'MARKET_PULSE_ftd_optimal_days_min': ('market_pulse_ftd_optimal_days_min', int),
-            'MARKET_PULSE_ftd_optimal_days_max': ('market_pulse_ftd_optimal_days_max', int),
-            'MARKET_PULSE_dd_lookback_period': ('market_pulse_dd_lookback_period', int),
-            'MARKET_PULSE_net_highs_lows_enable': ('market_pulse_net_highs_lows_enable', parse_boolean),
-            'MARKET_PULSE_breadth_threshold_healthy': ('market_pulse_breadth_threshold_healthy', float),
-            'MARKET_PULSE_breadth_threshold_unhealthy': ('market_pulse_breadth_threshold_unhealthy', float),
-            'MARKET_PULSE_chillax_ma_enable': ('market_pulse_chillax_ma_enable', parse_boolean),
-            'MARKET_PULSE_chillax_ma_fast_period': ('market_pulse_chillax_ma_fast_period', int),
-            'MARKET_PULSE_chillax_ma_slow_period': ('market_pulse_chillax_ma_slow_period', int),
-            'MARKET_PULSE_chillax_trend_days': ('market_pulse_chillax_trend_days', int),
-
-            # Chillax MAs Enhanced Configuration
-            'MARKET_PULSE_chillax_mas_indexes': ('market_pulse_chillax_mas_indexes', str),
-            'MARKET_PULSE_chillax_mas_sma': ('market_pulse_chillax_mas_sma', str),
-            'MARKET_PULSE_chillax_mas_charts': ('market_pulse_chillax_mas_charts', str),
-            'MARKET_PULSE_chillax_mas_charts_timeframe': ('market_pulse_chillax_mas_charts_timeframe', int),
-            'MARKET_PULSE_chillax_display_sma': ('market_pulse_chillax_display_sma', str),
-            'MARKET_PULSE_ma_cycles_enable': ('market_pulse_ma_cycles_enable', parse_boolean),
-
-            # MA Cycles Enhanced Configuration
-            'MARKET_PULSE_ma_cycles_indexes': ('market_pulse_ma_cycles_indexes', str),
-            'MARKET_PULSE_ma_cycles_ma_period': ('market_pulse_ma_cycles_ma_period', str),
-            'MARKET_PULSE_ma_cycles_charts': ('market_pulse_ma_cycles_charts', str),
-            'MARKET_PULSE_ma_cycles_charts_timeframe': ('market_pulse_ma_cycles_charts_timeframe', int),
-            'MARKET_PULSE_ma_cycles_cycle_mode': ('market_pulse_ma_cycles_cycle_mode', str),
-            'MARKET_PULSE_ma_cycles_smoothed_candles': ('market_pulse_ma_cycles_smoothed_candles', int),
-
-            # Legacy MA Cycles Configuration
-            'MARKET_PULSE_ma_cycles_reference_period': ('market_pulse_ma_cycles_reference_period', int),
-            'MARKET_PULSE_ma_cycles_min_cycle_length': ('market_pulse_ma_cycles_min_cycle_length', int),
-            'MARKET_PULSE_output_dir': ('market_pulse_output_dir', str),
-            'MARKET_PULSE_save_detailed_results': ('market_pulse_save_detailed_results', parse_boolean),
-            'MARKET_PULSE_generate_alerts': ('market_pulse_generate_alerts', parse_boolean),
-            
-            # Market Breadth Analysis Configuration
-            'MARKET_BREADTH_enable': ('market_breadth_enable', parse_boolean),
-            'MARKET_BREADTH_daily_enable': ('market_breadth_daily_enable', parse_boolean),
-            'MARKET_BREADTH_weekly_enable': ('market_breadth_weekly_enable', parse_boolean),
-            'MARKET_BREADTH_monthly_enable': ('market_breadth_monthly_enable', parse_boolean),
-            # Timeframe configuration
-            'MARKET_BREADTH_daily_ma_periods': ('market_breadth_daily_ma_periods', _parse_period_string),
-            'MARKET_BREADTH_daily_new_high_lows_periods': ('market_breadth_daily_new_high_lows_periods', _parse_period_string),
-            'MARKET_BREADTH_weekly_ma_periods': ('market_breadth_weekly_ma_periods', _parse_period_string),
-            'MARKET_BREADTH_weekly_new_high_lows_periods': ('market_breadth_weekly_new_high_lows_periods', _parse_period_string),
-            'MARKET_BREADTH_monthly_ma_periods': ('market_breadth_monthly_ma_periods', _parse_period_string),
-            'MARKET_BREADTH_monthly_new_high_lows_periods': ('market_breadth_monthly_new_high_lows_periods', _parse_period_string),
-            'MARKET_BREADTH_universe': ('market_breadth_universe', _parse_market_breadth_universe),
-            # Generic threshold configuration
-            'MARKET_BREADTH_new_highs_threshold_long': ('market_breadth_new_highs_threshold_long', int),
-            'MARKET_BREADTH_new_highs_threshold_medium': ('market_breadth_new_highs_threshold_medium', int),
-            'MARKET_BREADTH_new_highs_threshold_short': ('market_breadth_new_highs_threshold_short', int),
-            'MARKET_BREADTH_success_window_pct_long': ('market_breadth_success_window_pct_long', int),
-            'MARKET_BREADTH_success_window_pct_medium': ('market_breadth_success_window_pct_medium', int),
-            'MARKET_BREADTH_success_window_pct_short': ('market_breadth_success_window_pct_short', int),
-            'MARKET_BREADTH_success_threshold_pct_long': ('market_breadth_success_threshold_pct_long', int),
-            'MARKET_BREADTH_success_threshold_pct_medium': ('market_breadth_success_threshold_pct_medium', int),
-            'MARKET_BREADTH_success_threshold_pct_short': ('market_breadth_success_threshold_pct_short', int),
-            # Legacy configuration (deprecated)
-            'MARKET_BREADTH_lookback_days': ('market_breadth_lookback_days', int),
-            'MARKET_BREADTH_ma_periods': ('market_breadth_ma_periods', _parse_period_string),
-            # 252-day threshold configuration
-            'MARKET_BREADTH_daily_252day_new_highs_threshold': ('market_breadth_daily_252day_new_highs_threshold', int),
-            'MARKET_BREADTH_ten_day_success_threshold': ('market_breadth_ten_day_success_threshold', int),
-            # 20-day threshold configuration
-            'MARKET_BREADTH_daily_20day_new_highs_threshold': ('market_breadth_daily_20day_new_highs_threshold', int),
-            'MARKET_BREADTH_twenty_day_success_threshold': ('market_breadth_twenty_day_success_threshold', int),
-            # 63-day threshold configuration
-            'MARKET_BREADTH_daily_63day_new_highs_threshold': ('market_breadth_daily_63day_new_highs_threshold', int),
-            'MARKET_BREADTH_sixty_three_day_success_threshold': ('market_breadth_sixty_three_day_success_threshold', int),
-            # Advance/decline thresholds
-            'MARKET_BREADTH_strong_ad_ratio_threshold': ('market_breadth_strong_ad_ratio_threshold', float),
-            'MARKET_BREADTH_weak_ad_ratio_threshold': ('market_breadth_weak_ad_ratio_threshold', float),
-            'MARKET_BREADTH_strong_advance_threshold': ('market_breadth_strong_advance_threshold', float),
-            'MARKET_BREADTH_weak_advance_threshold': ('market_breadth_weak_advance_threshold', float),
-            # Moving average breadth thresholds
-            'MARKET_BREADTH_strong_ma_breadth_threshold': ('market_breadth_strong_ma_breadth_threshold', float),
-            'MARKET_BREADTH_weak_ma_breadth_threshold': ('market_breadth_weak_ma_breadth_threshold', float),
-            # Chart history display configuration
-            'MARKET_BREADTH_chart_history_days': ('market_breadth_chart_history_days', int),
-            'MARKET_BREADTH_chart_history_weeks': ('market_breadth_chart_history_weeks', int),
-            'MARKET_BREADTH_chart_history_months': ('market_breadth_chart_history_months', int),
-            # Output configuration
-            'MARKET_BREADTH_save_detailed_results': ('market_breadth_save_detailed_results', parse_boolean),
-            'MARKET_BREADTH_output_dir': ('market_breadth_output_dir', str),
-            'MARKET_BREADTH_tornado_chart': ('market_breadth_tornado_chart', parse_boolean),
-            'MARKET_BREADTH_tornado_chart_display_units_time': ('market_breadth_tornado_chart_display_units_time', int),
-            
-            # Dashboard Configuration
-            'DASHBOARD_enable': ('dashboard_enable', parse_boolean),
-            'DASHBOARD_output_dir': ('dashboard_output_dir', str),
-            'DASHBOARD_auto_refresh': ('dashboard_auto_refresh', parse_boolean),
-            'DASHBOARD_include_charts': ('dashboard_include_charts', parse_boolean),
-            'DASHBOARD_max_opportunities': ('dashboard_max_opportunities', int),
-            'DASHBOARD_max_alerts': ('dashboard_max_alerts', int),
-            'DASHBOARD_save_historical': ('dashboard_save_historical', parse_boolean),
-
-            # HVE (Highest Volume Ever) Configuration
-            'HVE_enable': ('hve_enable', parse_boolean),
-            'HVE_output_dir': ('hve_output_dir', str),
-            'HVE_limit_years': ('hve_limit_years', int),
-            'HVE_min_volume': ('hve_min_volume', int),
-            'HVE_min_price': ('hve_min_price', float),
-            'HVE_date_range_mode': ('hve_date_range_mode', str),
-            'HVE_start_date': ('hve_start_date', str),
-            'HVE_end_date': ('hve_end_date', str),
-            'HVE_historical_max_events': ('hve_historical_max_events', int),
-            'HVE_historical_export': ('hve_historical_export', parse_boolean),
-            'HVD_historical_export': ('hvd_historical_export', parse_boolean),
-            'HVD_historical_max_days': ('hvd_historical_max_days', int),
-
-            # HV1Y (Highest Volume in 1 Year) Configuration
-            'HV1Y_enable': ('hv1y_enable', parse_boolean),
-            'HV1Y_window_days': ('hv1y_window_days', int)
-        }
-        
-        # Process each row in the dataframe
-        for _, row in df.iterrows():
-            variable = row['variable']
-            value = row['value']
-            
-            if variable in config_map:
-                attr_name, converter = config_map[variable]
-                try:
-                    converted_value = converter(value)
-                    setattr(config, attr_name, converted_value)
-                except (ValueError, TypeError) as e:
-                    print(f"Warning: Invalid value '{value}' for {variable}. Using default. Error: {e}")
-        
-        # Validation for ticker_choice
-        try:
-            # Parse ticker choice to validate format - handle dash separator
-            choice_str = str(config.ticker_choice)
-            group_ids = [int(id_str.strip()) for id_str in choice_str.split('-')]
-            
-            # Validate all group IDs are in range 0-8
-            for group_id in group_ids:
-                if not (0 <= group_id <= 8):
-                    raise ValueError(f"Group ID {group_id} not in valid range 0-8")
-                    
-        except (ValueError, AttributeError):
-            print(f"Warning: ticker_choice '{config.ticker_choice}' is invalid. Using default ('2').")
-            config.ticker_choice = "2"
-        
-        # Parse RS period strings into lists of integers
-        # Parse RS periods based on the new configuration structure
-        # Note: RS periods now use the same period configuration as basic calculations
-        # This ensures consistency between RS and basic calculation period definitions
-            
-        return config
-
-    except FileNotFoundError:
-        print(f"Error: {file_path} not found. Using default configuration.")
-        return UserConfiguration()
-
-    except Exception as e:
-        print(f"Error reading user data: {e}. Using default configuration.")
-        return UserConfiguration()
-
-
-def read_user_data_legacy() -> tuple:
-    """
-    Legacy function for backward compatibility.
-    Returns (ticker_choice, write_info_file) tuple as expected by existing code.
-    """
-    config = read_user_data()
-    return config.ticker_choice, config.write_info_file
-
+@lru_cache(maxsize=1024)
+def _comma_separated_ints(value: str) -> tuple:
+    """Parse a comma-separated integer string into a tuple (memoised; errors propagate)."""
+    # Remove quotes if present, strip whitespace, split by comma
+    cleaned = value.strip().strip('"\'')
+    return tuple(int(x.strip()) for x in cleaned.split(',') if x.strip())
 
 
 def _parse_market_breadth_universe(value: str) -> dict:
@@ -1849,30 +1445,10 @@ def _parse_market_breadth_universe(value: str) -> dict:
         dict: Configuration object with type and universe information
     """
     value = value.strip()
-    
-    if ';' in value:
-        # Separate universe processing: SP500;NASDAQ100;Russell1000
-        universes = [u.strip() for u in value.split(';') if u.strip()]
-        return {
-            'type': 'separate',
-            'universes': universes,
-            'display_name': None,  # Individual names used
-            'file_count': len(universes),  # Multiple files
-            'raw_config': value
-        }
-        
-    elif '+' in value:
-        # Combined universe processing: SP500+NASDAQ100+Russell1000
-        universes = [u.strip() for u in value.split('+') if u.strip()]
-        return {
-            'type': 'combined',
-            'universes': universes,
-            'display_name': value,  # Full combined name
-            'file_count': 1,  # Single file
-            'raw_config': value
-        }
-        
-    else:
+
+    # ';' takes precedence over '+', as the separator is checked in that order
+    separator = ';' if ';' in value else '+' if '+' in value else None
+    if separator is None:
         # Single universe (backwards compatible): SP500
         return {
             'type': 'single',
@@ -1882,6 +1458,31 @@ def _parse_market_breadth_universe(value: str) -> dict:
             'raw_config': value
         }
 
+    # Strip each part once while splitting
+    universes = [name for name in (part.strip() for part in value.split(separator)) if name]
+    if separator == ';':
+        # Separate universe processing: SP500;NASDAQ100;Russell1000
+        return {
+            'type': 'separate',
+            'universes': universes,
+            'display_name': None,  # Individual names used
+            'file_count': len(universes),  # Multiple files
+            'raw_config': value
+        }
+
+    # Combined universe processing: SP500+NASDAQ100+Russell1000
+    return {
+        'type': 'combined',
+        'universes': universes,
+        'display_name': value,  # Full combined name
+        'file_count': 1,  # Single file
+        'raw_config': value
+    }
+
+
+# Fallback for unparsable period strings
+_DEFAULT_PERIODS = (1, 3, 5)
+
 
 def _parse_period_string(period_str: str) -> list:
     """
@@ -1893,12 +1494,1123 @@ def _parse_period_string(period_str: str) -> list:
     Returns:
         List of integers [1, 3, 5, 10, 15]
     """
+    return list(_parse_period_tuple(period_str))
+
+
+@lru_cache(maxsize=256)
+def _cached_period_tuple(period_str: str) -> tuple:
+    """Parse a period string into a tuple (memoised)."""
     try:
-        return [int(p.strip()) for p in period_str.split(';') if p.strip()]
-    except (ValueError, AttributeError):
-        return [1, 3, 5]  # Default fallback
+        return tuple(int(p.strip()) for p in period_str.split(';') if p.strip())
+    except ValueError:
+        return _DEFAULT_PERIODS  # Default fallback
+
+
+def _parse_int_tuple(value: str) -> tuple:
+    """Comma-separated integers as a tuple, for immutable configuration fields."""
+    return tuple(parse_comma_separated_ints(value))
+
+
+def _parse_period_tuple(value: str) -> tuple:
+    """Semicolon-separated periods as a tuple, for immutable configuration fields."""
+    if not isinstance(value, str):
+        return _DEFAULT_PERIODS
+    return _cached_period_tuple(value)
+
+
+# CSV variable name -> (UserConfiguration field, converter); turned into
+# ConfigField records once at import, below
+CONFIG_MAP = {
+    # Original data collection settings (now mostly disabled)
+    'WEB_tickers_down': ('web_tickers_down', parse_boolean),
+    'TW_tickers_down': ('tw_tickers_down', parse_boolean),
+    'TW_universe_file': ('tw_universe_file', str),
+    'YF_hist_data': ('yf_hist_data', parse_boolean),
+    'YF_daily_data': ('yf_daily_data', parse_boolean),
+    'YF_weekly_data': ('yf_weekly_data', parse_boolean),
+    'YF_monthly_data': ('yf_monthly_data', parse_boolean),
+    'TW_intraday_data': ('tw_intraday_data', parse_boolean),
+    'TW_intraday_file': ('tw_intraday_file', str),
+    'fin_data_enrich': ('fin_data_enrich', parse_boolean),
+    'YF_fin_data': ('yf_fin_data', parse_boolean),
+    'TW_fin_data': ('tw_fin_data', parse_boolean),
+    'Zacks_fin_data': ('zacks_fin_data', parse_boolean),
+    'write_info_file': ('write_info_file', parse_boolean),
+    'ticker_info_TW': ('ticker_info_TW', parse_boolean),
+    'ticker_info_TW_file': ('ticker_info_TW_file', str),
+    'ticker_info_YF': ('ticker_info_YF', parse_boolean),
+    'ticker_choice': ('ticker_choice', str),
+    'batch_size': ('batch_size', int),
+
+    # Global execution phase flags
+    'PRE_PROCESS': ('PRE_PROCESS', parse_boolean),
+    'PRE_PROCESS_file': ('PRE_PROCESS_file', str),
+    'BASIC': ('BASIC', parse_boolean),
+    'SCREENERS': ('SCREENERS', parse_boolean),
+    'POST_PROCESS': ('POST_PROCESS', parse_boolean),
+    'BACKTESTING': ('BACKTESTING', parse_boolean),
 
+    # POST-PROCESSING CONFIGURATION
+    # Input historical data sources (local data loading)
+    'YF_daily_data_files': ('yf_daily_data_files', str),
+    'YF_weekly_data_files': ('yf_weekly_data_files', str),
+    'YF_monthly_data_files': ('yf_monthly_data_files', str),
+    'TW_intraday_folder': ('tw_intraday_folder', str),
+
+    # Environment detection and paths
+    'auto_detect_environment': ('auto_detect_environment', parse_boolean),
+    'manual_environment_override': ('manual_environment_override', str),
 
+    # Local environment paths
+    'YF_daily_data_files_local': ('yf_daily_data_files_local', str),
+    'YF_weekly_data_files_local': ('yf_weekly_data_files_local', str),
+    'YF_monthly_data_files_local': ('yf_monthly_data_files_local', str),
+    'TW_intraday_folder_local': ('tw_intraday_folder_local', str),
+
+    # Colab environment paths
+    'YF_daily_data_files_colab': ('yf_daily_data_files_colab', str),
+    'YF_weekly_data_files_colab': ('yf_weekly_data_files_colab', str),
+    'YF_monthly_data_files_colab': ('yf_monthly_data_files_colab', str),
+    'TW_intraday_folder_colab': ('tw_intraday_folder_colab', str),
+    
+    # Overview files
+    'indexes_overview_file': ('indexes_overview_file', str),
+    
+    # Index Overview Configuration
+    'SP500_overview': ('sp500_overview', parse_boolean),
+    'NASDAQ100_overview': ('nasdaq100_overview', parse_boolean),
+    'DJIA_overview': ('djia_overview', parse_boolean),
+    
+    # Index Period Configurations
+    'index_daily_daily_periods': ('index_daily_daily_periods', _split_semicolon_ints),
+    'index_daily_weekly_periods': ('index_daily_weekly_periods', _split_semicolon_ints),
+    'index_daily_monthly_periods': ('index_daily_monthly_periods', _split_semicolon_ints),
+    'index_daily_quarterly_periods': ('index_daily_quarterly_periods', _split_semicolon_ints),
+    'index_daily_yearly_periods': ('index_daily_yearly_periods', _split_semicolon_ints),
+    
+    # Output directory configuration
+    'BASIC_CALCULATION_output_dir': ('basic_calculation_output_dir', str),
+    'STAGE_ANALYSIS_output_dir': ('stage_analysis_output_dir', str),
+    'RS_output_dir': ('rs_output_dir', str),
+    'PER_output_dir': ('per_output_dir', str),
+    # Screener output directories
+    'PVB_TWmodel_output_dir': ('pvb_TWmodel_output_dir', str),
+    'ATR1_output_dir': ('atr1_output_dir', str),
+    'DRWISH_output_dir': ('drwish_output_dir', str),
+    'GIUSTI_output_dir': ('giusti_output_dir', str),
+    'MINERVINI_output_dir': ('minervini_output_dir', str),
+    'STOCKBEE_output_dir': ('stockbee_output_dir', str),
+    'QULLAMAGGIE_output_dir': ('qullamaggie_output_dir', str),
+    'ADL_SCREENER_output_dir': ('adl_screener_output_dir', str),
+    'GUPPY_SCREENER_output_dir': ('guppy_screener_output_dir', str),
+    'GOLD_LAUNCH_PAD_output_dir': ('gold_launch_pad_output_dir', str),
+    'RTI_output_dir': ('rti_output_dir', str),
+
+    # Basic calculations (legacy)
+    'Basic_calculation_file': ('basic_calculation_file', str),
+    'Basic_calc_daily_enable': ('basic_calc_daily_enable', parse_boolean),
+    'Basic_calc_weekly_enable': ('basic_calc_weekly_enable', parse_boolean),
+    'Basic_calc_monthly_enable': ('basic_calc_monthly_enable', parse_boolean),
+    # Daily period percent change configuration
+    'daily_daily_periods': ('daily_daily_periods', _split_semicolon_ints),
+    'daily_weekly_periods': ('daily_weekly_periods', _split_semicolon_ints),
+    'daily_monthly_periods': ('daily_monthly_periods', _split_semicolon_ints),
+    'daily_quarterly_periods': ('daily_quarterly_periods', _split_semicolon_ints),
+    'daily_yearly_periods': ('daily_yearly_periods', _split_semicolon_ints),
+    # Weekly period percent change configuration
+    'weekly_weekly_periods': ('weekly_weekly_periods', _split_semicolon_ints),
+    'weekly_monthly_periods': ('weekly_monthly_periods', _split_semicolon_ints),
+    # Monthly period percent change configuration
+    'monthly_monthly_periods': ('monthly_monthly_periods', _split_semicolon_ints),
+    # Monthly RS periods
+    'RS_monthly_periods': ('RS_monthly_periods', _split_semicolon_ints),
+
+    # SUSTAINABILITY RATIOS (SR) CONFIGURATION
+    'SR_enable': ('sr_enable', parse_boolean),
+    'SR_output_dir': ('sr_output_dir', str),
+    # SUBMODULE CONTROL FLAGS
+    'SR_panels_enable': ('sr_panels_enable', parse_boolean),
+    'SR_overview_enable': ('sr_overview_enable', parse_boolean),
+    'SR_intermarket_enable': ('sr_intermarket_enable', parse_boolean),
+    'SR_breadth_enable': ('sr_breadth_enable', parse_boolean),
+    # PANEL SUBMODULE CONFIGURATION
+    'SR_panel_config_file': ('sr_panel_config_file', str),
+    'SR_timeframes': ('sr_timeframes', str),
+    # New granular timeframe controls
+    'SR_timeframe_daily': ('sr_timeframe_daily', parse_boolean),
+    'SR_timeframe_weekly': ('sr_timeframe_weekly', parse_boolean),
+    'SR_timeframe_monthly': ('sr_timeframe_monthly', parse_boolean),
+    # OVERVIEW SUBMODULE CONFIGURATION
+    'SR_overview_values_enable': ('sr_overview_values_enable', parse_boolean),
+    'SR_overview_charts_enable': ('sr_overview_charts_enable', parse_boolean),
+    'SR_overview_values_history': ('sr_overview_values_history', int),
+    'SR_overview_values_indexes': ('sr_overview_values_indexes', _split_semicolon),
+    'SR_overview_values_sectors': ('sr_overview_values_sectors', _split_semicolon),
+    'SR_overview_values_industries': ('sr_overview_values_industries', str),
+    'SR_overview_values_timeframe': ('sr_overview_values_timeframe', str),
+    'SR_overview_output_dir': ('sr_overview_output_dir', str),
+    'SR_overview_filename_prefix': ('sr_overview_filename_prefix', str),
+    'SR_overview_charts_tickers': ('sr_overview_charts_tickers', _split_semicolon),
+    'SR_overview_charts_display_panel': ('sr_overview_charts_display_panel', str),
+    'SR_overview_charts_display_history': ('sr_overview_charts_display_history', int),
+    # Chart display range control
+    'SR_chart_display': ('sr_chart_display', int),
+    'SR_chart_generation': ('sr_chart_generation', parse_boolean),
+    'SR_intermarket_ratios': ('sr_intermarket_ratios', parse_boolean),
+    'SR_market_breadth': ('sr_market_breadth', parse_boolean),
+    'SR_save_detailed_results': ('sr_save_detailed_results', parse_boolean),
+    'SR_dashboard_style': ('sr_dashboard_style', str),
+    'SR_lookback_days': ('sr_lookback_days', int),
+
+    # MMM SUBMODULE CONFIGURATION
+    'SR_mmm_enable': ('sr_mmm_enable', parse_boolean),
+    'SR_mmm_daily_enable': ('sr_mmm_daily_enable', parse_boolean),
+    'SR_mmm_weekly_enable': ('sr_mmm_weekly_enable', parse_boolean),
+    'SR_mmm_monthly_enable': ('sr_mmm_monthly_enable', parse_boolean),
+    'SR_mmm_gaps_values': ('sr_mmm_gaps_values', parse_boolean),
+    'SR_mmm_gaps_tickers': ('sr_mmm_gaps_tickers', _split_semicolon),
+    'SR_mmm_gaps_values_input_folder_daily': ('sr_mmm_gaps_values_input_folder_daily', str),
+    'SR_mmm_gaps_values_input_folder_weekly': ('sr_mmm_gaps_values_input_folder_weekly', str),
+    'SR_mmm_gaps_values_input_folder_monthly': ('sr_mmm_gaps_values_input_folder_monthly', str),
+    'SR_mmm_gaps_values_output_folder_daily': ('sr_mmm_gaps_values_output_folder_daily', str),
+    'SR_mmm_gaps_values_output_folder_weekly': ('sr_mmm_gaps_values_output_folder_weekly', str),
+    'SR_mmm_gaps_values_output_folder_monthly': ('sr_mmm_gaps_values_output_folder_monthly', str),
+    'SR_mmm_gaps_values_filename_suffix': ('sr_mmm_gaps_values_filename_suffix', str),
+    'SR_mmm_gaps_chart_enable': ('sr_mmm_gaps_chart_enable', parse_boolean),
+    'SR_mmm_gaps_charts_display_panel': ('sr_mmm_gaps_charts_display_panel', str),
+    'SR_mmm_gaps_charts_display_history': ('sr_mmm_gaps_charts_display_history', int),
+    'SR_mmm_output_dir': ('sr_mmm_output_dir', str),
+
+    # Screeners
+    'screener_output_file': ('screener_output_file', str),
+    'screener_criteria_file': ('screener_criteria_file', str),
+    
+    # Models
+    'models_output_file': ('models_output_file', str),
+    'models_config_file': ('models_config_file', str),
+    
+    # Database configuration removed
+    
+    # PDF reports configuration
+    'pdf_reports_enable': ('pdf_reports_enable', parse_boolean),
+    'pdf_reports_output_dir': ('pdf_reports_output_dir', str),
+    'pdf_reports_include_charts': ('pdf_reports_include_charts', parse_boolean),
+    
+    # Report generation configuration
+    'REPORT_enable': ('report_enable', parse_boolean),
+    'REPORT_template_type': ('report_template_type', str),
+    'REPORT_page_size': ('report_page_size', str),
+    'REPORT_output_dir': ('report_output_dir', str),
+    'REPORT_include_charts': ('report_include_charts', parse_boolean),
+    'REPORT_file_dates_auto': ('report_file_dates_auto', parse_boolean),
+    'REPORT_file_dates_manual': ('report_file_dates_manual', str),
+    'REPORT_sections_basic_stats': ('report_sections_basic_stats', parse_boolean),
+    'REPORT_sections_percentage_analysis': ('report_sections_percentage_analysis', parse_boolean),
+    'REPORT_sections_rs_analysis': ('report_sections_rs_analysis', parse_boolean),
+    'REPORT_sections_tornado_charts': ('report_sections_tornado_charts', parse_boolean),
+    'REPORT_sections_summary': ('report_sections_summary', parse_boolean),
+    'REPORT_max_tickers_display': ('report_max_tickers_display', int),
+    'REPORT_format': ('report_format', str),
+    'REPORT_include_metadata': ('report_include_metadata', parse_boolean),
+
+    # Market Breadth Report Configuration (Independent of global REPORT_ settings)
+    'MARKET_BREADTH_REPORT_enable': ('market_breadth_report_enable', parse_boolean),
+    'MARKET_BREADTH_REPORT_template_type': ('market_breadth_report_template_type', str),
+    'MARKET_BREADTH_force_file': ('market_breadth_force_file', parse_boolean),
+
+    # Market Pulse GMI/GMI2 Report Configuration
+    'MARKET_PULSE_GMIGMI2_REPORT_enable': ('market_pulse_gmigmi2_report_enable', parse_boolean),
+
+    # Technical Indicators Configuration
+    'daily_ema_periods': ('daily_ema_periods', _split_semicolon_ints),
+    'daily_sma_periods': ('daily_sma_periods', _split_semicolon_ints),
+    'weekly_ema_periods': ('weekly_ema_periods', _split_semicolon_ints),
+    'weekly_sma_periods': ('weekly_sma_periods', _split_semicolon_ints),
+    'monthly_ema_periods': ('monthly_ema_periods', _split_semicolon_ints),
+    'monthly_sma_periods': ('monthly_sma_periods', _split_semicolon_ints),
+    
+    # Percentage Movers Configuration
+    'enable_movers_analysis': ('enable_movers_analysis', parse_boolean),
+    'daily_pct_threshold': ('daily_pct_threshold', float),
+    'weekly_pct_threshold': ('weekly_pct_threshold', float),
+    'movers_output_dir': ('movers_output_dir', str),
+    'movers_min_volume': ('movers_min_volume', int),
+    'movers_top_n': ('movers_top_n', int),
+    
+    # ATR Configuration
+    'enable_atr_calculation': ('enable_atr_calculation', parse_boolean),
+    'atr_period': ('atr_period', int),
+    'atr_sma_period': ('atr_sma_period', int),
+    'enable_atr_percentile': ('enable_atr_percentile', parse_boolean),
+    'atr_percentile_period': ('atr_percentile_period', int),
+    
+    # ATR Screener Configuration
+    # ATR1 (TradingView-validated)
+    'ATR1_enable': ('atr1_enable', parse_boolean),
+    'ATR1_daily_length': ('atr1_daily_length', int),
+    'ATR1_daily_factor': ('atr1_daily_factor', float),
+    'ATR1_daily_length2': ('atr1_daily_length2', int),
+    'ATR1_daily_factor2': ('atr1_daily_factor2', float),
+    'ATR1_weekly_length': ('atr1_weekly_length', int),
+    'ATR1_weekly_factor': ('atr1_weekly_factor', float),
+    'ATR1_weekly_length2': ('atr1_weekly_length2', int),
+    'ATR1_weekly_factor2': ('atr1_weekly_factor2', float),
+    'ATR1_monthly_length': ('atr1_monthly_length', int),
+    'ATR1_monthly_factor': ('atr1_monthly_factor', float),
+    'ATR1_monthly_length2': ('atr1_monthly_length2', int),
+    'ATR1_monthly_factor2': ('atr1_monthly_factor2', float),
+    
+    # ATR2 (Volatility analysis)
+    'ATR2_enable': ('atr2_enable', parse_boolean),
+    'ATR2_daily_atr_period': ('atr2_daily_atr_period', int),
+    'ATR2_daily_sma_period': ('atr2_daily_sma_period', int),
+    'ATR2_daily_percentile_period': ('atr2_daily_percentile_period', int),
+    'ATR2_weekly_atr_period': ('atr2_weekly_atr_period', int),
+    'ATR2_weekly_sma_period': ('atr2_weekly_sma_period', int),
+    'ATR2_weekly_percentile_period': ('atr2_weekly_percentile_period', int),
+    'ATR2_monthly_atr_period': ('atr2_monthly_atr_period', int),
+    'ATR2_monthly_sma_period': ('atr2_monthly_sma_period', int),
+    'ATR2_monthly_percentile_period': ('atr2_monthly_percentile_period', int),
+    
+    # Stage Analysis Configuration - Global
+    'enable_stage_analysis': ('enable_stage_analysis', parse_boolean),
+
+    # Stage Analysis Configuration - Daily
+    'stage_analysis_daily_enabled': ('stage_analysis_daily_enabled', parse_boolean),
+    'stage_daily_ema_fast_period': ('stage_daily_ema_fast_period', int),
+    'stage_daily_sma_medium_period': ('stage_daily_sma_medium_period', int),
+    'stage_daily_sma_slow_period': ('stage_daily_sma_slow_period', int),
+    'stage_daily_atr_period': ('stage_daily_atr_period', int),
+    'stage_daily_atr_threshold_low': ('stage_daily_atr_threshold_low', float),
+    'stage_daily_atr_threshold_high': ('stage_daily_atr_threshold_high', float),
+    'stage_daily_ma_convergence_threshold': ('stage_daily_ma_convergence_threshold', float),
+    
+    # Stage Analysis Configuration - Weekly
+    'stage_analysis_weekly_enabled': ('stage_analysis_weekly_enabled', parse_boolean),
+    'stage_weekly_ema_fast_period': ('stage_weekly_ema_fast_period', int),
+    'stage_weekly_sma_medium_period': ('stage_weekly_sma_medium_period', int),
+    'stage_weekly_sma_slow_period': ('stage_weekly_sma_slow_period', int),
+    'stage_weekly_atr_period': ('stage_weekly_atr_period', int),
+    'stage_weekly_atr_threshold_low': ('stage_weekly_atr_threshold_low', float),
+    'stage_weekly_atr_threshold_high': ('stage_weekly_atr_threshold_high', float),
+    'stage_weekly_ma_convergence_threshold': ('stage_weekly_ma_convergence_threshold', float),
+    
+    # Stage Analysis Configuration - Monthly
+    'stage_analysis_monthly_enabled': ('stage_analysis_monthly_enabled', parse_boolean),
+    'stage_monthly_ema_fast_period': ('stage_monthly_ema_fast_period', int),
+    'stage_monthly_sma_medium_period': ('stage_monthly_sma_medium_period', int),
+    'stage_monthly_sma_slow_period': ('stage_monthly_sma_slow_period', int),
+    'stage_monthly_atr_period': ('stage_monthly_atr_period', int),
+    'stage_monthly_atr_threshold_low': ('stage_monthly_atr_threshold_low', float),
+    'stage_monthly_atr_threshold_high': ('stage_monthly_atr_threshold_high', float),
+    'stage_monthly_ma_convergence_threshold': ('stage_monthly_ma_convergence_threshold', float),
+    
+    # Legacy Stage Analysis Configuration (deprecated)
+    'stage_analysis_enabled': ('stage_analysis_enabled', parse_boolean),
+    'stage_analysis_min_price': ('stage_analysis_min_price', float),
+    'stage_analysis_min_vol': ('stage_analysis_min_vol', int),
+    'stage_analysis_report_enable': ('stage_analysis_report_enable', parse_boolean),
+    'stage_ema_fast_period': ('stage_ema_fast_period', int),
+    'stage_sma_medium_period': ('stage_sma_medium_period', int),
+    'stage_sma_slow_period': ('stage_sma_slow_period', int),
+    'stage_atr_period': ('stage_atr_period', int),
+    'stage_atr_threshold_low': ('stage_atr_threshold_low', float),
+    'stage_atr_threshold_high': ('stage_atr_threshold_high', float),
+    'stage_ma_convergence_threshold': ('stage_ma_convergence_threshold', float),
+    
+    # Relative Strength Configuration
+    'RS_enable_stocks': ('rs_enable_stocks', parse_boolean),
+    'RS_enable_sectors': ('rs_enable_sectors', parse_boolean),
+    'RS_enable_industries': ('rs_enable_industries', parse_boolean),
+    # Multi-benchmark configuration
+    'RS_benchmark_tickers': ('rs_benchmark_tickers', _split_semicolon),
+    # Legacy single benchmark
+    'RS_benchmark_ticker': ('rs_benchmark_ticker', str),
+    'RS_composite_method': ('rs_composite_method', str),
+    'RS_min_group_size': ('rs_min_group_size', int),
+    # Percentile universe configurations
+    'RS_percentile_universe_stocks': ('rs_percentile_universe_stocks', str),
+    'RS_percentile_universe_sectors': ('rs_percentile_universe_sectors', str),
+    'RS_percentile_universe_industries': ('rs_percentile_universe_industries', str),
+
+    # New mapping-based percentile configuration
+    'RS_percentile_mapping_stocks': ('rs_percentile_mapping_stocks', str),
+    'RS_percentile_mapping_sectors': ('rs_percentile_mapping_sectors', str),
+    'RS_percentile_mapping_industries': ('rs_percentile_mapping_industries', str),
+    # Daily timeframe parameters
+    'RS_daily_enable': ('rs_daily_enable', parse_boolean),
+    # Weekly timeframe parameters
+    'RS_weekly_enable': ('rs_weekly_enable', parse_boolean),
+    # Monthly timeframe parameters
+    'RS_monthly_enable': ('rs_monthly_enable', parse_boolean),
+
+    # Moving Average RS Configuration
+    'RS_ma_enable': ('rs_ma_enable', parse_boolean),
+    'RS_ma_method': ('rs_ma_method', _split_semicolon_ints),
+    'RS_method_for_PER': ('rs_method_for_per', str),
+
+    # Technical Indicators Configuration
+    'INDICATORS_enable': ('indicators_enable', parse_boolean),
+    'INDICATORS_config_file': ('indicators_config_file', str),
+    'INDICATORS_output_dir': ('indicators_output_dir', str),
+    'INDICATORS_charts_dir': ('indicators_charts_dir', str),
+    
+    # Default Indicator Parameters
+    'INDICATORS_kurutoga_enable': ('indicators_kurutoga_enable', parse_boolean),
+    'INDICATORS_kurutoga_length': ('indicators_kurutoga_length', int),
+    'INDICATORS_kurutoga_source': ('indicators_kurutoga_source', str),
+    
+    'INDICATORS_tsi_enable': ('indicators_tsi_enable', parse_boolean),
+    'INDICATORS_tsi_fast': ('indicators_tsi_fast', int),
+    'INDICATORS_tsi_slow': ('indicators_tsi_slow', int),
+    'INDICATORS_tsi_signal': ('indicators_tsi_signal', int),
+    
+    'INDICATORS_macd_enable': ('indicators_macd_enable', parse_boolean),
+    'INDICATORS_macd_fast': ('indicators_macd_fast', int),
+    'INDICATORS_macd_slow': ('indicators_macd_slow', int),
+    'INDICATORS_macd_signal': ('indicators_macd_signal', int),
+    
+    'INDICATORS_mfi_enable': ('indicators_mfi_enable', parse_boolean),
+    'INDICATORS_mfi_length': ('indicators_mfi_length', int),
+    'INDICATORS_mfi_signal_enable': ('indicators_mfi_signal_enable', parse_boolean),
+    'INDICATORS_mfi_signal_period': ('indicators_mfi_signal_period', int),
+    
+    'INDICATORS_cog_enable': ('indicators_cog_enable', parse_boolean),
+    'INDICATORS_cog_length': ('indicators_cog_length', int),
+    'INDICATORS_cog_source': ('indicators_cog_source', str),
+    
+    'INDICATORS_momentum_enable': ('indicators_momentum_enable', parse_boolean),
+    'INDICATORS_momentum_length': ('indicators_momentum_length', int),
+    
+    'INDICATORS_rsi_enable': ('indicators_rsi_enable', parse_boolean),
+    'INDICATORS_rsi_length': ('indicators_rsi_length', int),
+    
+    'INDICATORS_ma_crosses_enable': ('indicators_ma_crosses_enable', parse_boolean),
+    'INDICATORS_ma_fast_period': ('indicators_ma_fast_period', int),
+    'INDICATORS_ma_slow_period': ('indicators_ma_slow_period', int),
+    
+    'INDICATORS_easy_trade_enable': ('indicators_easy_trade_enable', parse_boolean),
+    'INDICATORS_easy_trade_fast': ('indicators_easy_trade_fast', int),
+    'INDICATORS_easy_trade_slow': ('indicators_easy_trade_slow', int),
+    'INDICATORS_easy_trade_signal': ('indicators_easy_trade_signal', int),
+    
+    # Basic Screeners Configuration
+    'BASIC_momentum_enable': ('basic_momentum_enable', parse_boolean),
+    'BASIC_breakout_enable': ('basic_breakout_enable', parse_boolean),
+    'BASIC_value_momentum_enable': ('basic_value_momentum_enable', parse_boolean),
+    
+    # PVB (Price Volume Breakout) Configuration
+    'PVB_TWmodel_enable': ('pvb_TWmodel_enable', parse_boolean),
+    'PVB_TWmodel_daily_enable': ('pvb_TWmodel_daily_enable', parse_boolean),
+    'PVB_TWmodel_weekly_enable': ('pvb_TWmodel_weekly_enable', parse_boolean),
+    'PVB_TWmodel_monthly_enable': ('pvb_TWmodel_monthly_enable', parse_boolean),
+    # Daily timeframe PVB parameters
+    'PVB_TWmodel_daily_price_breakout_period': ('pvb_TWmodel_daily_price_breakout_period', int),
+    'PVB_TWmodel_daily_volume_breakout_period': ('pvb_TWmodel_daily_volume_breakout_period', int),
+    'PVB_TWmodel_daily_trendline_length': ('pvb_TWmodel_daily_trendline_length', int),
+    'PVB_TWmodel_daily_close_threshold': ('pvb_TWmodel_daily_close_threshold', int),
+    'PVB_TWmodel_daily_signal_max_age': ('pvb_TWmodel_daily_signal_max_age', int),
+    # Weekly timeframe PVB parameters
+    'PVB_TWmodel_weekly_price_breakout_period': ('pvb_TWmodel_weekly_price_breakout_period', int),
+    'PVB_TWmodel_weekly_volume_breakout_period': ('pvb_TWmodel_weekly_volume_breakout_period', int),
+    'PVB_TWmodel_weekly_trendline_length': ('pvb_TWmodel_weekly_trendline_length', int),
+    'PVB_TWmodel_weekly_close_threshold': ('pvb_TWmodel_weekly_close_threshold', int),
+    'PVB_TWmodel_weekly_signal_max_age': ('pvb_TWmodel_weekly_signal_max_age', int),
+    # Monthly timeframe PVB parameters
+    'PVB_TWmodel_monthly_price_breakout_period': ('pvb_TWmodel_monthly_price_breakout_period', int),
+    'PVB_TWmodel_monthly_volume_breakout_period': ('pvb_TWmodel_monthly_volume_breakout_period', int),
+    'PVB_TWmodel_monthly_trendline_length': ('pvb_TWmodel_monthly_trendline_length', int),
+    'PVB_TWmodel_monthly_close_threshold': ('pvb_TWmodel_monthly_close_threshold', int),
+    'PVB_TWmodel_monthly_signal_max_age': ('pvb_TWmodel_monthly_signal_max_age', int),
+    # Common PVB parameters
+    'PVB_TWmodel_order_direction': ('pvb_TWmodel_order_direction', str),
+    'PVB_TWmodel_min_volume': ('pvb_TWmodel_min_volume', int),
+    'PVB_TWmodel_min_price': ('pvb_TWmodel_min_price', float),
+    # TradingView Watchlist Export Configuration
+    'PVB_TWmodel_export_tradingview': ('pvb_TWmodel_export_tradingview', parse_boolean),
+    'PVB_TWmodel_watchlist_max_symbols': ('pvb_TWmodel_watchlist_max_symbols', int),
+    'PVB_TWmodel_watchlist_include_buy': ('pvb_TWmodel_watchlist_include_buy', parse_boolean),
+    'PVB_TWmodel_watchlist_include_sell': ('pvb_TWmodel_watchlist_include_sell', parse_boolean),
+
+    # Minervini Template Screener Configuration
+    'MINERVINI_enable': ('minervini_enable', parse_boolean),
+    'MINERVINI_rs_min_rating': ('minervini_rs_min_rating', float),
+    'MINERVINI_min_volume': ('minervini_min_volume', int),
+    'MINERVINI_min_price': ('minervini_min_price', float),
+    'MINERVINI_show_all_stocks': ('minervini_show_all_stocks', parse_boolean),
+    
+    # Giusti Momentum Screener Configuration
+    'GIUSTI_enable': ('giusti_enable', parse_boolean),
+    'GIUSTI_min_price': ('giusti_min_price', float),
+    'GIUSTI_min_volume': ('giusti_min_volume', int),
+    'GIUSTI_rolling_12m': ('giusti_rolling_12m', int),
+    'GIUSTI_rolling_6m': ('giusti_rolling_6m', int),
+    'GIUSTI_rolling_3m': ('giusti_rolling_3m', int),
+    'GIUSTI_top_12m_count': ('giusti_top_12m_count', int),
+    'GIUSTI_top_6m_count': ('giusti_top_6m_count', int),
+    'GIUSTI_top_3m_count': ('giusti_top_3m_count', int),
+    'GIUSTI_min_history_months': ('giusti_min_history_months', int),
+    'GIUSTI_show_all_stocks': ('giusti_show_all_stocks', parse_boolean),
+    
+    # Dr. Wish Suite Screener Configuration
+    'DRWISH_enable': ('drwish_enable', parse_boolean),
+    'DRWISH_min_price': ('drwish_min_price', float),
+    'DRWISH_min_volume': ('drwish_min_volume', int),
+    'DRWISH_pivot_strength': ('drwish_pivot_strength', int),
+    'DRWISH_lookback_period': ('drwish_lookback_period', _split_semicolon),
+    'DRWISH_confirmation_period': ('drwish_confirmation_period', _split_semicolon),
+    'DRWISH_require_confirmation': ('drwish_require_confirmation', parse_boolean),
+    'DRWISH_enable_glb': ('drwish_enable_glb', parse_boolean),
+    'DRWISH_enable_blue_dot': ('drwish_enable_blue_dot', parse_boolean),
+    'DRWISH_enable_black_dot': ('drwish_enable_black_dot', parse_boolean),
+    'DRWISH_blue_dot_stoch_period': ('drwish_blue_dot_stoch_period', int),
+    'DRWISH_blue_dot_stoch_threshold': ('drwish_blue_dot_stoch_threshold', float),
+    'DRWISH_blue_dot_sma_period': ('drwish_blue_dot_sma_period', int),
+    'DRWISH_black_dot_stoch_period': ('drwish_black_dot_stoch_period', int),
+    'DRWISH_black_dot_stoch_threshold': ('drwish_black_dot_stoch_threshold', float),
+    'DRWISH_black_dot_lookback': ('drwish_black_dot_lookback', int),
+    'DRWISH_black_dot_sma_period': ('drwish_black_dot_sma_period', int),
+    'DRWISH_black_dot_ema_period': ('drwish_black_dot_ema_period', int),
+    'DRWISH_show_all_stocks': ('drwish_show_all_stocks', parse_boolean),
+    'DRWISH_enable_charts': ('drwish_enable_charts', parse_boolean),
+    'DRWISH_chart_output_dir': ('drwish_chart_output_dir', str),
+    
+    # Volume Suite Configuration
+    'VOLUME_SUITE_enable': ('volume_suite_enable', parse_boolean),
+    'VOLUME_SUITE_daily_enable': ('volume_suite_daily_enable', parse_boolean),
+    'VOLUME_SUITE_weekly_enable': ('volume_suite_weekly_enable', parse_boolean),
+    'VOLUME_SUITE_monthly_enable': ('volume_suite_monthly_enable', parse_boolean),
+    'VOLUME_SUITE_hv_absolute': ('volume_suite_hv_absolute', parse_boolean),
+    'VOLUME_SUITE_hv_stdv': ('volume_suite_hv_stdv', parse_boolean),
+    'VOLUME_SUITE_enhanced_anomaly': ('volume_suite_enhanced_anomaly', parse_boolean),
+    'VOLUME_SUITE_volume_indicators': ('volume_suite_volume_indicators', parse_boolean),
+    'VOLUME_SUITE_pvb_Clmodel_integration': ('volume_suite_pvb_clmodel_integration', parse_boolean),
+    # Older name of the same setting
+    'VOLUME_SUITE_pvb_TWmodel_integration': ('volume_suite_pvb_clmodel_integration', parse_boolean),
+    'VOLUME_SUITE_hv_month_cutoff': ('volume_suite_hv_month_cutoff', int),
+    'VOLUME_SUITE_hv_day_cutoff': ('volume_suite_hv_day_cutoff', int),
+    'VOLUME_SUITE_hv_std_cutoff': ('volume_suite_hv_std_cutoff', int),
+    'VOLUME_SUITE_hv_min_volume': ('volume_suite_hv_min_volume', int),
+    'VOLUME_SUITE_hv_min_price': ('volume_suite_hv_min_price', float),
+    'VOLUME_SUITE_stdv_cutoff': ('volume_suite_stdv_cutoff', int),
+    'VOLUME_SUITE_stdv_min_volume': ('volume_suite_stdv_min_volume', int),
+    'VOLUME_SUITE_vroc_threshold': ('volume_suite_vroc_threshold', float),
+    'VOLUME_SUITE_rvol_threshold': ('volume_suite_rvol_threshold', float),
+    'VOLUME_SUITE_rvol_extreme_threshold': ('volume_suite_rvol_extreme_threshold', float),
+    'VOLUME_SUITE_mfi_overbought': ('volume_suite_mfi_overbought', int),
+    'VOLUME_SUITE_mfi_oversold': ('volume_suite_mfi_oversold', int),
+    'VOLUME_SUITE_vpt_threshold': ('volume_suite_vpt_threshold', float),
+    'VOLUME_SUITE_adtv_3m_threshold': ('volume_suite_adtv_3m_threshold', float),
+    'VOLUME_SUITE_adtv_6m_threshold': ('volume_suite_adtv_6m_threshold', float),
+    'VOLUME_SUITE_adtv_1y_threshold': ('volume_suite_adtv_1y_threshold', float),
+    'VOLUME_SUITE_adtv_min_volume': ('volume_suite_adtv_min_volume', int),
+    'VOLUME_SUITE_output_dir': ('volume_suite_output_dir', str),
+    'VOLUME_SUITE_save_individual_files': ('volume_suite_save_individual_files', parse_boolean),
+    'VOLUME_SUITE_pvb_Clmodel_price_period': ('volume_suite_pvb_clmodel_price_period', int),
+    'VOLUME_SUITE_pvb_Clmodel_volume_period': ('volume_suite_pvb_clmodel_volume_period', int),
+    'VOLUME_SUITE_pvb_Clmodel_trend_length': ('volume_suite_pvb_clmodel_trend_length', int),
+    'VOLUME_SUITE_pvb_Clmodel_volume_multiplier': ('volume_suite_pvb_clmodel_volume_multiplier', float),
+    'VOLUME_SUITE_pvb_Clmodel_direction': ('volume_suite_pvb_clmodel_direction', str),
+    
+    # Stockbee Suite Configuration
+    'STOCKBEE_SUITE_enable': ('stockbee_suite_enable', parse_boolean),
+    'STOCKBEE_SUITE_daily_enable': ('stockbee_suite_daily_enable', parse_boolean),
+    'STOCKBEE_SUITE_weekly_enable': ('stockbee_suite_weekly_enable', parse_boolean),
+    'STOCKBEE_SUITE_monthly_enable': ('stockbee_suite_monthly_enable', parse_boolean),
+    'STOCKBEE_SUITE_9m_movers': ('stockbee_suite_9m_movers', parse_boolean),
+    'STOCKBEE_SUITE_weekly_movers': ('stockbee_suite_weekly_movers', parse_boolean),
+    'STOCKBEE_SUITE_daily_gainers': ('stockbee_suite_daily_gainers', parse_boolean),
+    'STOCKBEE_SUITE_industry_leaders': ('stockbee_suite_industry_leaders', parse_boolean),
+    'STOCKBEE_SUITE_min_market_cap': ('stockbee_suite_min_market_cap', int),
+    'STOCKBEE_SUITE_min_price': ('stockbee_suite_min_price', float),
+    'STOCKBEE_SUITE_exclude_funds': ('stockbee_suite_exclude_funds', parse_boolean),
+    'STOCKBEE_SUITE_9m_volume_threshold': ('stockbee_suite_9m_volume_threshold', int),
+    'STOCKBEE_SUITE_9m_rel_vol_threshold': ('stockbee_suite_9m_rel_vol_threshold', float),
+    'STOCKBEE_SUITE_weekly_gain_threshold': ('stockbee_suite_weekly_gain_threshold', float),
+    'STOCKBEE_SUITE_weekly_rel_vol_threshold': ('stockbee_suite_weekly_rel_vol_threshold', float),
+    'STOCKBEE_SUITE_weekly_min_avg_volume': ('stockbee_suite_weekly_min_avg_volume', int),
+    'STOCKBEE_SUITE_daily_gain_threshold': ('stockbee_suite_daily_gain_threshold', float),
+    'STOCKBEE_SUITE_daily_rel_vol_threshold': ('stockbee_suite_daily_rel_vol_threshold', float),
+    'STOCKBEE_SUITE_daily_min_volume': ('stockbee_suite_daily_min_volume', int),
+    'STOCKBEE_SUITE_industry_top_pct': ('stockbee_suite_industry_top_pct', float),
+    'STOCKBEE_SUITE_industry_top_stocks': ('stockbee_suite_industry_top_stocks', int),
+    'STOCKBEE_SUITE_industry_min_size': ('stockbee_suite_industry_min_size', int),
+    'STOCKBEE_SUITE_9m_relative_volume': ('stockbee_suite_9m_relative_volume', float),
+    'STOCKBEE_SUITE_weekly_min_volume': ('stockbee_suite_weekly_min_volume', int),
+    'STOCKBEE_SUITE_save_individual_files': ('stockbee_suite_save_individual_files', parse_boolean),
+
+    # Qullamaggie Suite Configuration
+    'QULLAMAGGIE_SUITE_enable': ('qullamaggie_suite_enable', parse_boolean),
+    'QULLAMAGGIE_SUITE_rs_threshold': ('qullamaggie_suite_rs_threshold', float),
+    'QULLAMAGGIE_SUITE_atr_rs_threshold': ('qullamaggie_suite_atr_rs_threshold', float),
+    'QULLAMAGGIE_SUITE_range_position_threshold': ('qullamaggie_suite_range_position_threshold', float),
+    'QULLAMAGGIE_SUITE_min_market_cap': ('qullamaggie_suite_min_market_cap', int),
+    'QULLAMAGGIE_SUITE_min_price': ('qullamaggie_suite_min_price', float),
+    'QULLAMAGGIE_SUITE_extension_warning': ('qullamaggie_suite_extension_warning', float),
+    'QULLAMAGGIE_SUITE_extension_danger': ('qullamaggie_suite_extension_danger', float),
+    'QULLAMAGGIE_SUITE_min_data_length': ('qullamaggie_suite_min_data_length', int),
+    
+    # ADL Screener Configuration
+    'ADL_SCREENER_enable': ('adl_screener_enable', parse_boolean),
+    'ADL_SCREENER_daily_enable': ('adl_screener_daily_enable', parse_boolean),
+    'ADL_SCREENER_weekly_enable': ('adl_screener_weekly_enable', parse_boolean),
+    'ADL_SCREENER_monthly_enable': ('adl_screener_monthly_enable', parse_boolean),
+
+    # Base ADL calculation parameters
+    'ADL_SCREENER_lookback_period': ('adl_screener_lookback_period', int),
+    'ADL_SCREENER_divergence_period': ('adl_screener_divergence_period', int),
+    'ADL_SCREENER_breakout_period': ('adl_screener_breakout_period', int),
+    'ADL_SCREENER_min_divergence_strength': ('adl_screener_min_divergence_strength', float),
+    'ADL_SCREENER_min_breakout_strength': ('adl_screener_min_breakout_strength', float),
+    'ADL_SCREENER_min_volume_avg': ('adl_screener_min_volume_avg', int),
+    'ADL_SCREENER_min_price': ('adl_screener_min_price', float),
+    'ADL_SCREENER_save_individual_files': ('adl_screener_save_individual_files', parse_boolean),
+
+    # Month-over-Month Analysis
+    'ADL_SCREENER_mom_analysis_enable': ('adl_screener_mom_analysis_enable', parse_boolean),
+    'ADL_SCREENER_mom_period': ('adl_screener_mom_period', int),
+    'ADL_SCREENER_mom_min_threshold_pct': ('adl_screener_mom_min_threshold_pct', float),
+    'ADL_SCREENER_mom_max_threshold_pct': ('adl_screener_mom_max_threshold_pct', float),
+    'ADL_SCREENER_mom_consecutive_months': ('adl_screener_mom_consecutive_months', int),
+    'ADL_SCREENER_mom_lookback_months': ('adl_screener_mom_lookback_months', int),
+    'ADL_SCREENER_mom_min_consistency_score': ('adl_screener_mom_min_consistency_score', float),
+
+    # Short-term Momentum Analysis
+    'ADL_SCREENER_short_term_enable': ('adl_screener_short_term_enable', parse_boolean),
+    'ADL_SCREENER_short_term_periods': ('adl_screener_short_term_periods', _split_semicolon_ints),
+    'ADL_SCREENER_short_term_momentum_threshold': ('adl_screener_short_term_momentum_threshold', float),
+    'ADL_SCREENER_short_term_acceleration_detect': ('adl_screener_short_term_acceleration_detect', parse_boolean),
+    'ADL_SCREENER_short_term_min_score': ('adl_screener_short_term_min_score', float),
+
+    # Moving Average Analysis
+    'ADL_SCREENER_ma_enable': ('adl_screener_ma_enable', parse_boolean),
+    'ADL_SCREENER_ma_periods': ('adl_screener_ma_periods', _split_semicolon_ints),
+    'ADL_SCREENER_ma_type': ('adl_screener_ma_type', str),
+    'ADL_SCREENER_ma_bullish_alignment_required': ('adl_screener_ma_bullish_alignment_required', parse_boolean),
+    'ADL_SCREENER_ma_crossover_detection': ('adl_screener_ma_crossover_detection', parse_boolean),
+    'ADL_SCREENER_ma_crossover_lookback': ('adl_screener_ma_crossover_lookback', int),
+    'ADL_SCREENER_ma_min_slope_threshold': ('adl_screener_ma_min_slope_threshold', float),
+    'ADL_SCREENER_ma_min_alignment_score': ('adl_screener_ma_min_alignment_score', float),
+
+    # Composite Scoring and Ranking
+    'ADL_SCREENER_composite_scoring_enable': ('adl_screener_composite_scoring_enable', parse_boolean),
+    'ADL_SCREENER_composite_weight_longterm': ('adl_screener_composite_weight_longterm', float),
+    'ADL_SCREENER_composite_weight_shortterm': ('adl_screener_composite_weight_shortterm', float),
+    'ADL_SCREENER_composite_weight_ma_align': ('adl_screener_composite_weight_ma_align', float),
+    'ADL_SCREENER_composite_min_score': ('adl_screener_composite_min_score', float),
+    'ADL_SCREENER_ranking_method': ('adl_screener_ranking_method', str),
+    'ADL_SCREENER_output_ranking_file': ('adl_screener_output_ranking_file', parse_boolean),
+    'ADL_SCREENER_top_candidates_count': ('adl_screener_top_candidates_count', int),
+
+    # Output Configuration
+    'ADL_SCREENER_output_separate_signals': ('adl_screener_output_separate_signals', parse_boolean),
+    'ADL_SCREENER_output_include_charts': ('adl_screener_output_include_charts', parse_boolean),
+    'ADL_SCREENER_output_summary_stats': ('adl_screener_output_summary_stats', parse_boolean),
+    
+    # Guppy GMMA Screener Configuration
+    'GUPPY_SCREENER_enable': ('guppy_screener_enable', parse_boolean),
+    'GUPPY_SCREENER_daily_enable': ('guppy_screener_daily_enable', parse_boolean),
+    'GUPPY_SCREENER_weekly_enable': ('guppy_screener_weekly_enable', parse_boolean),
+    'GUPPY_SCREENER_monthly_enable': ('guppy_screener_monthly_enable', parse_boolean),
+    'GUPPY_SCREENER_ma_type': ('guppy_screener_ma_type', str),
+    'GUPPY_SCREENER_short_term_group_daily': ('guppy_screener_short_term_emas', _parse_int_tuple),
+    'GUPPY_SCREENER_long_term_group_daily': ('guppy_screener_long_term_emas', _parse_int_tuple),
+    'GUPPY_SCREENER_min_compression_ratio': ('guppy_screener_min_compression_ratio', float),
+    'GUPPY_SCREENER_min_expansion_ratio': ('guppy_screener_min_expansion_ratio', float),
+    'GUPPY_SCREENER_crossover_confirmation_days': ('guppy_screener_crossover_confirmation_days', int),
+    'GUPPY_SCREENER_volume_confirmation_threshold': ('guppy_screener_volume_confirmation_threshold', float),
+    'GUPPY_SCREENER_min_price': ('guppy_screener_min_price', float),
+    'GUPPY_SCREENER_min_volume_avg': ('guppy_screener_min_volume_avg', int),
+    'GUPPY_SCREENER_min_data_length': ('guppy_screener_min_data_length', int),
+    'GUPPY_SCREENER_save_individual_files': ('guppy_screener_save_individual_files', parse_boolean),
+    
+    # Gold Launch Pad CSV mappings
+    'GOLD_LAUNCH_PAD_enable': ('gold_launch_pad_enable', parse_boolean),
+    'GOLD_LAUNCH_PAD_daily_enable': ('gold_launch_pad_daily_enable', parse_boolean),
+    'GOLD_LAUNCH_PAD_weekly_enable': ('gold_launch_pad_weekly_enable', parse_boolean),
+    'GOLD_LAUNCH_PAD_monthly_enable': ('gold_launch_pad_monthly_enable', parse_boolean),
+    'GOLD_LAUNCH_PAD_ma_periods': ('gold_launch_pad_ma_periods', _parse_period_tuple),
+    'GOLD_LAUNCH_PAD_ma_type': ('gold_launch_pad_ma_type', str),
+    'GOLD_LAUNCH_PAD_zscore_window': ('gold_launch_pad_zscore_window', int),
+    'GOLD_LAUNCH_PAD_max_spread_threshold': ('gold_launch_pad_max_spread_threshold', float),
+    'GOLD_LAUNCH_PAD_slope_lookback_pct': ('gold_launch_pad_slope_lookback_pct', float),
+    'GOLD_LAUNCH_PAD_min_slope_threshold': ('gold_launch_pad_min_slope_threshold', float),
+    'GOLD_LAUNCH_PAD_price_proximity_stdv': ('gold_launch_pad_price_proximity_stdv', float),
+    'GOLD_LAUNCH_PAD_proximity_window': ('gold_launch_pad_proximity_window', int),
+    'GOLD_LAUNCH_PAD_min_price': ('gold_launch_pad_min_price', float),
+    'GOLD_LAUNCH_PAD_min_volume': ('gold_launch_pad_min_volume', int),
+    'GOLD_LAUNCH_PAD_save_individual_files': ('gold_launch_pad_save_individual_files', parse_boolean),
+    
+    # RTI CSV mappings
+    'RTI_enable': ('rti_enable', parse_boolean),
+    'RTI_daily_enable': ('rti_daily_enable', parse_boolean),
+    'RTI_weekly_enable': ('rti_weekly_enable', parse_boolean),
+    'RTI_monthly_enable': ('rti_monthly_enable', parse_boolean),
+    'RTI_period': ('rti_period', int),
+    'RTI_short_period': ('rti_short_period', int),
+    'RTI_swing_period': ('rti_swing_period', int),
+    'RTI_zone1_threshold': ('rti_zone1_threshold', float),
+    'RTI_zone2_threshold': ('rti_zone2_threshold', float),
+    'RTI_zone3_threshold': ('rti_zone3_threshold', float),
+    'RTI_low_volatility_threshold': ('rti_low_volatility_threshold', float),
+    'RTI_expansion_multiplier': ('rti_expansion_multiplier', float),
+    'RTI_consecutive_low_vol_bars': ('rti_consecutive_low_vol_bars', int),
+    'RTI_min_consolidation_period': ('rti_min_consolidation_period', int),
+    'RTI_breakout_confirmation_period': ('rti_breakout_confirmation_period', int),
+    'RTI_min_price': ('rti_min_price', float),
+    'RTI_min_volume': ('rti_min_volume', int),
+    'RTI_save_individual_files': ('rti_save_individual_files', parse_boolean),
+    
+    # Performance optimization
+    'cap_history_data': ('cap_history_data', int),
+    
+    # Market Pulse Configuration
+    'MARKET_PULSE_enable': ('market_pulse_enable', parse_boolean),
+    'MARKET_PULSE_gmi_enable': ('market_pulse_gmi_enable', parse_boolean),
+    'MARKET_PULSE_gmi_threshold': ('market_pulse_gmi_threshold', int),
+    'MARKET_PULSE_gmi_confirmation_days': ('market_pulse_gmi_confirmation_days', int),
+    'MARKET_PULSE_gmi_short_term_sma': ('market_pulse_gmi_short_term_sma', int),
+    'MARKET_PULSE_gmi_long_term_sma': ('market_pulse_gmi_long_term_sma', int),
+    'MARKET_PULSE_gmi_MF_index': ('market_pulse_gmi_mf_index', str),
+    'MARKET_PULSE_gmi_index1': ('market_pulse_gmi_index1', str),
+    'MARKET_PULSE_gmi_index2': ('market_pulse_gmi_index2', str),
+    'MARKET_PULSE_gmi_MF_ma_period': ('market_pulse_gmi_mf_ma_period', int),
+    'MARKET_PULSE_gmi_breath_file_suffix': ('market_pulse_gmi_breath_file_suffix', str),
+
+    # GMI2 Configuration mappings
+    'MARKET_PULSE_gmi2_enable': ('market_pulse_gmi2_enable', parse_boolean),
+    'MARKET_PULSE_gmi2_index': ('market_pulse_gmi2_index', _split_semicolon),
+    'MARKET_PULSE_gmi2_sma': ('market_pulse_gmi2_sma', _split_semicolon_ints),
+    'MARKET_PULSE_gmi2_index_stochastic_threshold': ('market_pulse_gmi2_index_stochastic_threshold', int),
+    'MARKET_PULSE_gmi2_threshold': ('market_pulse_gmi2_threshold', int),
+    'MARKET_PULSE_gmi2_confirmation_days': ('market_pulse_gmi2_confirmation_days', int),
+    
+    'MARKET_PULSE_ftd_dd_enable': ('market_pulse_ftd_dd_enable', parse_boolean),
+    'MARKET_PULSE_ftd_dd_report_enable': ('market_pulse_ftd_dd_report_enable', parse_boolean),
+    'MARKET_PULSE_comprehensive_report_enable': ('market_pulse_comprehensive_report_enable', parse_boolean),
+    'MARKET_PULSE_dd_threshold': ('market_pulse_dd_threshold', float),
+    'MARKET_PULSE_ftd_threshold': ('market_pulse_ftd_threshold', float),
+    'MARKET_PULSE_ftd_optimal_days_min': ('market_pulse_ftd_optimal_days_min', int),
+    'MARKET_PULSE_ftd_optimal_days_max': ('market_pulse_ftd_optimal_days_max', int),
+    'MARKET_PULSE_dd_lookback_period': ('market_pulse_dd_lookback_period', int),
+    'MARKET_PULSE_net_highs_lows_enable': ('market_pulse_net_highs_lows_enable', parse_boolean),
+    'MARKET_PULSE_breadth_threshold_healthy': ('market_pulse_breadth_threshold_healthy', float),
+    'MARKET_PULSE_breadth_threshold_unhealthy': ('market_pulse_breadth_threshold_unhealthy', float),
+    'MARKET_PULSE_chillax_ma_enable': ('market_pulse_chillax_ma_enable', parse_boolean),
+    'MARKET_PULSE_chillax_ma_fast_period': ('market_pulse_chillax_ma_fast_period', int),
+    'MARKET_PULSE_chillax_ma_slow_period': ('market_pulse_chillax_ma_slow_period', int),
+    'MARKET_PULSE_chillax_trend_days': ('market_pulse_chillax_trend_days', int),
+
+    # Chillax MAs Enhanced Configuration
+    'MARKET_PULSE_chillax_mas_indexes': ('market_pulse_chillax_mas_indexes', _split_semicolon),
+    'MARKET_PULSE_chillax_mas_sma': ('market_pulse_chillax_mas_sma', _split_semicolon_ints),
+    'MARKET_PULSE_chillax_mas_charts': ('market_pulse_chillax_mas_charts', _split_semicolon),
+    'MARKET_PULSE_chillax_mas_charts_timeframe': ('market_pulse_chillax_mas_charts_timeframe', int),
+    'MARKET_PULSE_chillax_display_sma': ('market_pulse_chillax_display_sma', _split_semicolon_ints),
+    'MARKET_PULSE_ma_cycles_enable': ('market_pulse_ma_cycles_enable', parse_boolean),
+
+    # MA Cycles Enhanced Configuration
+    'MARKET_PULSE_ma_cycles_indexes': ('market_pulse_ma_cycles_indexes', _split_semicolon),
+    'MARKET_PULSE_ma_cycles_ma_period': ('market_pulse_ma_cycles_ma_period', _split_semicolon_ints),
+    'MARKET_PULSE_ma_cycles_charts': ('market_pulse_ma_cycles_charts', _split_semicolon),
+    'MARKET_PULSE_ma_cycles_charts_timeframe': ('market_pulse_ma_cycles_charts_timeframe', int),
+    'MARKET_PULSE_ma_cycles_cycle_mode': ('market_pulse_ma_cycles_cycle_mode', str),
+    'MARKET_PULSE_ma_cycles_smoothed_candles': ('market_pulse_ma_cycles_smoothed_candles', int),
+
+    # Legacy MA Cycles Configuration
+    'MARKET_PULSE_ma_cycles_reference_period': ('market_pulse_ma_cycles_reference_period', int),
+    'MARKET_PULSE_ma_cycles_min_cycle_length': ('market_pulse_ma_cycles_min_cycle_length', int),
+    'MARKET_PULSE_output_dir': ('market_pulse_output_dir', str),
+    'MARKET_PULSE_save_detailed_results': ('market_pulse_save_detailed_results', parse_boolean),
+    'MARKET_PULSE_generate_alerts': ('market_pulse_generate_alerts', parse_boolean),
+    
+    # Market Breadth Analysis Configuration
+    'MARKET_BREADTH_enable': ('market_breadth_enable', parse_boolean),
+    'MARKET_BREADTH_daily_enable': ('market_breadth_daily_enable', parse_boolean),
+    'MARKET_BREADTH_weekly_enable': ('market_breadth_weekly_enable', parse_boolean),
+    'MARKET_BREADTH_monthly_enable': ('market_breadth_monthly_enable', parse_boolean),
+    # Timeframe configuration
+    'MARKET_BREADTH_daily_ma_periods': ('market_breadth_daily_ma_periods', _parse_period_tuple),
+    'MARKET_BREADTH_daily_new_high_lows_periods': ('market_breadth_daily_new_high_lows_periods', _parse_period_tuple),
+    'MARKET_BREADTH_weekly_ma_periods': ('market_breadth_weekly_ma_periods', _parse_period_tuple),
+    'MARKET_BREADTH_weekly_new_high_lows_periods': ('market_breadth_weekly_new_high_lows_periods', _parse_period_tuple),
+    'MARKET_BREADTH_monthly_ma_periods': ('market_breadth_monthly_ma_periods', _parse_period_tuple),
+    'MARKET_BREADTH_monthly_new_high_lows_periods': ('market_breadth_monthly_new_high_lows_periods', _parse_period_tuple),
+    'MARKET_BREADTH_universe': ('market_breadth_universe', _parse_market_breadth_universe),
+    # Generic threshold configuration
+    'MARKET_BREADTH_new_highs_threshold_long': ('market_breadth_new_highs_threshold_long', int),
+    'MARKET_BREADTH_new_highs_threshold_medium': ('market_breadth_new_highs_threshold_medium', int),
+    'MARKET_BREADTH_new_highs_threshold_short': ('market_breadth_new_highs_threshold_short', int),
+    'MARKET_BREADTH_success_window_pct_long': ('market_breadth_success_window_pct_long', int),
+    'MARKET_BREADTH_success_window_pct_medium': ('market_breadth_success_window_pct_medium', int),
+    'MARKET_BREADTH_success_window_pct_short': ('market_breadth_success_window_pct_short', int),
+    'MARKET_BREADTH_success_threshold_pct_long': ('market_breadth_success_threshold_pct_long', int),
+    'MARKET_BREADTH_success_threshold_pct_medium': ('market_breadth_success_threshold_pct_medium', int),
+    'MARKET_BREADTH_success_threshold_pct_short': ('market_breadth_success_threshold_pct_short', int),
+    # Legacy configuration (deprecated)
+    'MARKET_BREADTH_lookback_days': ('market_breadth_lookback_days', int),
+    'MARKET_BREADTH_ma_periods': ('market_breadth_ma_periods', _parse_period_tuple),
+    # 252-day threshold configuration
+    'MARKET_BREADTH_daily_252day_new_highs_threshold': ('market_breadth_daily_252day_new_highs_threshold', int),
+    'MARKET_BREADTH_ten_day_success_threshold': ('market_breadth_ten_day_success_threshold', int),
+    # 20-day threshold configuration
+    'MARKET_BREADTH_daily_20day_new_highs_threshold': ('market_breadth_daily_20day_new_highs_threshold', int),
+    'MARKET_BREADTH_twenty_day_success_threshold': ('market_breadth_twenty_day_success_threshold', int),
+    # 63-day threshold configuration
+    'MARKET_BREADTH_daily_63day_new_highs_threshold': ('market_breadth_daily_63day_new_highs_threshold', int),
+    'MARKET_BREADTH_sixty_three_day_success_threshold': ('market_breadth_sixty_three_day_success_threshold', int),
+    # Advance/decline thresholds
+    'MARKET_BREADTH_strong_ad_ratio_threshold': ('market_breadth_strong_ad_ratio_threshold', float),
+    'MARKET_BREADTH_weak_ad_ratio_threshold': ('market_breadth_weak_ad_ratio_threshold', float),
+    'MARKET_BREADTH_strong_advance_threshold': ('market_breadth_strong_advance_threshold', float),
+    'MARKET_BREADTH_weak_advance_threshold': ('market_breadth_weak_advance_threshold', float),
+    # Moving average breadth thresholds
+    'MARKET_BREADTH_strong_ma_breadth_threshold': ('market_breadth_strong_ma_breadth_threshold', float),
+    'MARKET_BREADTH_weak_ma_breadth_threshold': ('market_breadth_weak_ma_breadth_threshold', float),
+    # Chart history display configuration
+    'MARKET_BREADTH_chart_history_days': ('market_breadth_chart_history_days', int),
+    'MARKET_BREADTH_chart_history_weeks': ('market_breadth_chart_history_weeks', int),
+    'MARKET_BREADTH_chart_history_months': ('market_breadth_chart_history_months', int),
+    # Output configuration
+    'MARKET_BREADTH_save_detailed_results': ('market_breadth_save_detailed_results', parse_boolean),
+    'MARKET_BREADTH_output_dir': ('market_breadth_output_dir', str),
+    'MARKET_BREADTH_tornado_chart': ('market_breadth_tornado_chart', parse_boolean),
+    'MARKET_BREADTH_tornado_chart_display_units_time': ('market_breadth_tornado_chart_display_units_time', int),
+    
+    # Dashboard Configuration
+    'DASHBOARD_enable': ('dashboard_enable', parse_boolean),
+    'DASHBOARD_output_dir': ('dashboard_output_dir', str),
+    'DASHBOARD_auto_refresh': ('dashboard_auto_refresh', parse_boolean),
+    'DASHBOARD_include_charts': ('dashboard_include_charts', parse_boolean),
+    'DASHBOARD_max_opportunities': ('dashboard_max_opportunities', int),
+    'DASHBOARD_max_alerts': ('dashboard_max_alerts', int),
+    'DASHBOARD_save_historical': ('dashboard_save_historical', parse_boolean),
+
+    # HVE (Highest Volume Ever) Configuration
+    'HVE_enable': ('hve_enable', parse_boolean),
+    'HVE_output_dir': ('hve_output_dir', str),
+    'HVE_limit_years': ('hve_limit_years', int),
+    'HVE_min_volume': ('hve_min_volume', int),
+    'HVE_min_price': ('hve_min_price', float),
+    'HVE_date_range_mode': ('hve_date_range_mode', str),
+    'HVE_start_date': ('hve_start_date', str),
+    'HVE_end_date': ('hve_end_date', str),
+    'HVE_historical_max_events': ('hve_historical_max_events', int),
+    'HVE_historical_export': ('hve_historical_export', parse_boolean),
+    'HVD_historical_export': ('hvd_historical_export', parse_boolean),
+    'HVD_historical_max_days': ('hvd_historical_max_days', int),
+
+    # HV1Y (Highest Volume in 1 Year) Configuration
+    'HV1Y_enable': ('hv1y_enable', parse_boolean),
+    'HV1Y_window_days': ('hv1y_window_days', int)
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigField:
+    """Target field and converter for one CSV configuration variable."""
+    attr_name: str
+    converter: Callable[[str], Any]
+    # False for converters that cannot fail on a string (no try/except needed)
+    may_raise: bool = True
+
+
+# Converters that never raise for a str value
+_SAFE_CONVERTERS = frozenset({
+    str, parse_boolean, _split_semicolon, _split_semicolon_ints,
+    _parse_period_tuple, _parse_int_tuple, _parse_market_breadth_universe,
+})
+
+
+# Intern CSV names and field names so lookups of interned names (CSV rows,
+# override keys) hit the identity fast path; exposed read-only like the
+# other module-level tables
+CONFIG_MAP: Mapping[str, ConfigField] = MappingProxyType({
+    sys.intern(variable): ConfigField(sys.intern(attr_name), converter, converter not in _SAFE_CONVERTERS)
+    for variable, (attr_name, converter) in CONFIG_MAP.items()
+})
+
+
+# Absolute path -> ((mtime_ns, size), configuration, warning messages)
+_USER_DATA_MEMO: dict[str, tuple] = {}
+
+
+def read_user_data(file_path: str = 'user_data.csv') -> UserConfiguration:
+    """
+    Reads user configuration from the restructured CSV file.
+    
+    The new format uses key-value pairs with format:
+    variable_name,value,description
+
+    Within a process the configuration is memoised per file and reused until
+    the file's modification time or size changes. If ``USER_DATA_CACHE_DIR`` is
+    set, parsed settings are also cached on disk keyed by the SHA-256 of the
+    file contents and of this module's source, so unchanged files skip parsing
+    in later runs.
+    
+    Returns UserConfiguration object with all settings.
+    """
+    try:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        memoised = _USER_DATA_MEMO.get(path)
+        if memoised is None or memoised[0] != signature:
+            raw_bytes = Path(path).read_bytes()
+            if USER_DATA_CACHE_DIR is None:
+                cached = _parse_user_data(raw_bytes.decode('utf-8', errors='replace'))
+            else:
+                cache_file = _user_data_cache_file(raw_bytes)
+                cached = _load_user_data_cache(cache_file)
+                if cached is None:
+                    cached = _parse_user_data(raw_bytes.decode('utf-8', errors='replace'))
+                    _save_user_data_cache(cache_file, cached)
+
+            overrides, messages = cached
+            # Instances are immutable, so the same one can be handed out again
+            memoised = (signature, UserConfiguration(**overrides), messages)
+            _USER_DATA_MEMO[path] = memoised
+
+        _, config, messages = memoised
+        for message in messages:
+            print(message)
+        return config
+
+    except FileNotFoundError:
+        print(f"Error: {file_path} not found. Using default configuration.")
+        return UserConfiguration()
+
+    except Exception as e:
+        print(f"Error reading user data: {e}. Using default configuration.")
+        return UserConfiguration()
+
+
+def _user_data_cache_file(raw_bytes: bytes) -> Path:
+    """
+    Get the cache file for a user_data.csv content.
+
+    Args:
+        raw_bytes: Raw contents of the configuration file
+
+    Returns:
+        Path of the pickle holding the parsed settings
+    """
+    digest = hashlib.sha256(raw_bytes)
+    digest.update(_schema_digest().encode())
+    return USER_DATA_CACHE_DIR / f"{digest.hexdigest()}.pkl"
+
+
+@lru_cache(maxsize=1)
+def _schema_digest() -> str:
+    """
+    Hash this module's source so schema or CONFIG_MAP changes invalidate the cache.
+    """
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _load_user_data_cache(cache_file: Path) -> tuple | None:
+    """
+    Load cached (overrides, messages) for a configuration file.
+
+    Only files owned by the current user and not writable by others are
+    unpickled; anything else is ignored.
+
+    Args:
+        cache_file: Path from ``_user_data_cache_file``
+
+    Returns:
+        Cached tuple, or None on a miss, an untrusted file or an unreadable cache
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            info = os.fstat(f.fileno())
+            if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & 0o022):
+                logger.warning(f"Ignoring user data cache {cache_file}: not private to this user")
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable user data cache {cache_file}: {e}")
+        return None
+
+
+def _save_user_data_cache(cache_file: Path, cached: tuple) -> None:
+    """
+    Store parsed (overrides, messages) for reuse; failures are logged and ignored.
+
+    The file is written private to the user, and the oldest entries beyond
+    ``USER_DATA_CACHE_MAX_ENTRIES`` are removed.
+
+    Args:
+        cache_file: Path from ``_user_data_cache_file``
+        cached: Tuple returned by ``_parse_user_data``
+    """
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+        entries = sorted(cache_file.parent.glob('*.pkl'), key=lambda entry: entry.stat().st_mtime_ns)
+        for stale in entries[:-USER_DATA_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f"Could not write user data cache {cache_file}: {e}")
+
+
+def _parse_config_rows(lines: list[str]) -> Iterator[tuple]:
+    """
+    Yield (variable, value) pairs from the lines of a configuration CSV.
+
+    Lines whose first cell starts with '#' and rows without a variable name
+    are skipped. Values are always stripped strings (missing cells give ''),
+    so converters never receive a float placeholder.
+
+    Args:
+        lines: Lines of the configuration file, with line endings kept
+
+    Yields:
+        (variable, value) tuples in file order
+    """
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        variable = sys.intern(row[0].strip())
+        if not variable or variable.startswith('#'):
+            continue
+        yield variable, row[1].strip() if len(row) > 1 else ''
+
+
+# "2", "1-2", " 5 - 8 ": dash-separated group IDs 0-8 (leading '+' or zeros allowed, as int() does)
+_TICKER_CHOICE = re.compile(r'\s*\+?0*[0-8]\s*(?:-\s*\+?0*[0-8]\s*)*')
+
+
+def _parse_user_data(text: str) -> tuple:
+    """
+    Parse user_data.csv into constructor overrides.
+
+    Args:
+        text: Contents of the configuration CSV
+
+    Returns:
+        Tuple of (overrides dict for UserConfiguration, list of warning messages)
+    """
+    messages = []
+
+    lines = text.splitlines(keepends=True)
+
+    # First, read ticker group filenames from comment lines
+    ticker_filenames = _parse_ticker_filenames(lines)
+    
+    # Collect overrides; the configuration object is built once at the end
+    overrides = {'ticker_filenames': ticker_filenames}
+    
+    # Process each configuration row
+    unknown_variables = []
+    # Rows are streamed straight from the csv reader, already stripped and
+    # with comment and empty lines skipped
+    for variable, value in _parse_config_rows(lines):
+        entry = CONFIG_MAP.get(variable)
+        if entry is None:
+            unknown_variables.append(variable)
+            continue
+        attr_name = entry.attr_name
+        converter = entry.converter
+        # Boolean rows are the most common; canonical spellings are resolved
+        # inline (int/float/str are builtins and need no special case)
+        if converter is parse_boolean:
+            result = _BOOL_TABLE.get(value)
+            if result is not None:
+                overrides[attr_name] = result
+                continue
+        if not entry.may_raise:
+            overrides[attr_name] = converter(value)
+            continue
+        try:
+            overrides[attr_name] = converter(value)
+        except (ValueError, TypeError) as e:
+            messages.append(f"Warning: Invalid value '{value}' for {variable}. Using default. Error: {e}")
+
+    # Surface typos instead of silently ignoring them
+    if unknown_variables:
+        messages.append(f"Warning: Unknown configuration variable(s) ignored: {', '.join(unknown_variables)}")
+    
+    # Validation for ticker_choice: dash-separated group IDs, each in range 0-8
+    ticker_choice = overrides.get('ticker_choice', "2")
+    if not _TICKER_CHOICE.fullmatch(str(ticker_choice)):
+        messages.append(f"Warning: ticker_choice '{ticker_choice}' is invalid. Using default ('2').")
+        overrides['ticker_choice'] = "2"
+    
+    # Parse RS period strings into lists of integers
+    # Parse RS periods based on the new configuration structure
+    # Note: RS periods now use the same period configuration as basic calculations
+    # This ensures consistency between RS and basic calculation period definitions
+        
+    return overrides, messages
+
+
+def read_user_data_legacy() -> tuple:
+    """
+    Legacy function for backward compatibility.
+    Returns (ticker_choice, write_info_file) tuple as expected by existing code.
+    """
+    config = read_user_data()
+    return config.ticker_choice, config.write_info_file
+
+
+def _memoise_params(getter):
+    """
+    Cache a get_*_params_for_timeframe result on the configuration.
+
+    Configurations are immutable, so each (getter, timeframe) pair is built
+    once; callers get a copy of the dict/list containers they are free to modify.
+    """
+    name = getter.__name__
+
+    @wraps(getter)
+    def wrapper(config, timeframe):
+        cache = getattr(config, 'param_cache', None)
+        if cache is None:
+            return getter(config, timeframe)
+        key = (name, timeframe)
+        params = cache.get(key)
+        if params is None:
+            params = cache[key] = getter(config, timeframe)
+        return _copy_params(params)
+
+    return wrapper
+
+
+def _copy_params(value):
+    """Copy nested dict/list containers of a parameter result, sharing the leaf values."""
+    if isinstance(value, dict):
+        return {key: _copy_params(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_params(item) for item in value]
+    return value
+
+
+# Fixed ATR settings shared by every timeframe
+_ATR1_BASE_PARAMS = MappingProxyType({
+    'src': 'Close',
+    'src2': 'Close',
+    'min_volume': 10000,
+    'min_price': 1.0,
+})
+_ATR2_BASE_PARAMS = MappingProxyType({
+    'min_volume': 10000,
+    'min_price': 1.0,
+    'high_volatility_threshold': 0.8,
+    'low_volatility_threshold': 0.2,
+    'extended_threshold': 2.0,
+    'optimal_range': 1.0,
+})
+
+
+@_memoise_params
 def get_atr1_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get timeframe-specific ATR1 parameters.
@@ -1910,43 +2622,23 @@ def get_atr1_params_for_timeframe(config: UserConfiguration, timeframe: str) ->
     Returns:
         Dictionary with ATR1 parameters for the specified timeframe
     """
-    base_params = {
-        'src': 'Close',
-        'src2': 'Close',
-        'min_volume': 10000,
-        'min_price': 1.0,
+    params = config.atr1.get(timeframe)
+    if params is None:
+        raise ValueError(f"Unsupported timeframe for ATR1: {timeframe}")
+
+    return {
+        **_ATR1_BASE_PARAMS,
         'ticker_choice': config.ticker_choice,
         'timeframe': timeframe,
-        'cap_history_data': config.cap_history_data
+        'cap_history_data': config.cap_history_data,
+        'length': params.length,
+        'factor': params.factor,
+        'length2': params.length2,
+        'factor2': params.factor2
     }
-    
-    if timeframe == 'daily':
-        base_params.update({
-            'length': config.atr1_daily_length,
-            'factor': config.atr1_daily_factor,
-            'length2': config.atr1_daily_length2,
-            'factor2': config.atr1_daily_factor2
-        })
-    elif timeframe == 'weekly':
-        base_params.update({
-            'length': config.atr1_weekly_length,
-            'factor': config.atr1_weekly_factor,
-            'length2': config.atr1_weekly_length2,
-            'factor2': config.atr1_weekly_factor2
-        })
-    elif timeframe == 'monthly':
-        base_params.update({
-            'length': config.atr1_monthly_length,
-            'factor': config.atr1_monthly_factor,
-            'length2': config.atr1_monthly_length2,
-            'factor2': config.atr1_monthly_factor2
-        })
-    else:
-        raise ValueError(f"Unsupported timeframe for ATR1: {timeframe}")
-    
-    return base_params
 
 
+@_memoise_params
 def get_atr2_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get timeframe-specific ATR2 parameters.
@@ -1958,45 +2650,23 @@ def get_atr2_params_for_timeframe(config: UserConfiguration, timeframe: str) ->
     Returns:
         Dictionary with ATR2 parameters for the specified timeframe
     """
-    base_params = {
-        'min_volume': 10000,
-        'min_price': 1.0,
-        'high_volatility_threshold': 0.8,
-        'low_volatility_threshold': 0.2,
-        'extended_threshold': 2.0,
-        'optimal_range': 1.0,
+    params = config.atr2.get(timeframe)
+    if params is None:
+        raise ValueError(f"Unsupported timeframe for ATR2: {timeframe}")
+
+    return {
+        **_ATR2_BASE_PARAMS,
         'ticker_choice': config.ticker_choice,
         'timeframe': timeframe,
-        'cap_history_data': config.cap_history_data
+        'cap_history_data': config.cap_history_data,
+        'atr_period': params.atr_period,
+        'sma_period': params.sma_period,
+        'enable_percentile': True,
+        'percentile_period': params.percentile_period
     }
-    
-    if timeframe == 'daily':
-        base_params.update({
-            'atr_period': config.atr2_daily_atr_period,
-            'sma_period': config.atr2_daily_sma_period,
-            'enable_percentile': True,
-            'percentile_period': config.atr2_daily_percentile_period
-        })
-    elif timeframe == 'weekly':
-        base_params.update({
-            'atr_period': config.atr2_weekly_atr_period,
-            'sma_period': config.atr2_weekly_sma_period,
-            'enable_percentile': True,
-            'percentile_period': config.atr2_weekly_percentile_period
-        })
-    elif timeframe == 'monthly':
-        base_params.update({
-            'atr_period': config.atr2_monthly_atr_period,
-            'sma_period': config.atr2_monthly_sma_period,
-            'enable_percentile': True,
-            'percentile_period': config.atr2_monthly_percentile_period
-        })
-    else:
-        raise ValueError(f"Unsupported timeframe for ATR2: {timeframe}")
-    
-    return base_params
 
 
+@_memoise_params
 def get_pvb_TWmodel_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get timeframe-specific PVB TWmodel parameters.
@@ -2008,55 +2678,29 @@ def get_pvb_TWmodel_params_for_timeframe(config: UserConfiguration, timeframe: s
     Returns:
         Dictionary with PVB TWmodel parameters for the specified timeframe
     """
-    if timeframe == 'daily':
-        return {
-            'price_breakout_period': config.pvb_TWmodel_daily_price_breakout_period,
-            'volume_breakout_period': config.pvb_TWmodel_daily_volume_breakout_period,
-            'trendline_length': config.pvb_TWmodel_daily_trendline_length,
-            'close_threshold': config.pvb_TWmodel_daily_close_threshold,
-            'signal_max_age': config.pvb_TWmodel_daily_signal_max_age,
-            'order_direction': config.pvb_TWmodel_order_direction,
-            'min_volume': config.pvb_TWmodel_min_volume,
-            'min_price': config.pvb_TWmodel_min_price,
-            'ticker_choice': config.ticker_choice,
-            'timeframe': timeframe
-        }
-    elif timeframe == 'weekly':
-        return {
-            'price_breakout_period': config.pvb_TWmodel_weekly_price_breakout_period,
-            'volume_breakout_period': config.pvb_TWmodel_weekly_volume_breakout_period,
-            'trendline_length': config.pvb_TWmodel_weekly_trendline_length,
-            'close_threshold': config.pvb_TWmodel_weekly_close_threshold,
-            'signal_max_age': config.pvb_TWmodel_weekly_signal_max_age,
-            'order_direction': config.pvb_TWmodel_order_direction,
-            'min_volume': config.pvb_TWmodel_min_volume,
-            'min_price': config.pvb_TWmodel_min_price,
-            'ticker_choice': config.ticker_choice,
-            'timeframe': timeframe
-        }
-    elif timeframe == 'monthly':
-        return {
-            'price_breakout_period': config.pvb_TWmodel_monthly_price_breakout_period,
-            'volume_breakout_period': config.pvb_TWmodel_monthly_volume_breakout_period,
-            'trendline_length': config.pvb_TWmodel_monthly_trendline_length,
-            'close_threshold': config.pvb_TWmodel_monthly_close_threshold,
-            'signal_max_age': config.pvb_TWmodel_monthly_signal_max_age,
-            'order_direction': config.pvb_TWmodel_order_direction,
-            'min_volume': config.pvb_TWmodel_min_volume,
-            'min_price': config.pvb_TWmodel_min_price,
-            'ticker_choice': config.ticker_choice,
-            'timeframe': timeframe
-        }
-    else:
+    params = config.pvb_TWmodel.get(timeframe)
+    if params is None:
         raise ValueError(f"Unsupported timeframe: {timeframe}")
 
+    return {
+        'price_breakout_period': params.price_breakout_period,
+        'volume_breakout_period': params.volume_breakout_period,
+        'trendline_length': params.trendline_length,
+        'close_threshold': params.close_threshold,
+        'signal_max_age': params.signal_max_age,
+        'order_direction': config.pvb_TWmodel_order_direction,
+        'min_volume': config.pvb_TWmodel_min_volume,
+        'min_price': config.pvb_TWmodel_min_price,
+        'ticker_choice': config.ticker_choice,
+        'timeframe': timeframe
+    }
 
-# Legacy function for backward compatibility
-def get_pvb_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
-    """Legacy function - redirects to TWmodel version."""
-    return get_pvb_TWmodel_params_for_timeframe(config, timeframe)
 
+# Legacy name for backward compatibility - same function as the TWmodel version
+get_pvb_params_for_timeframe = get_pvb_TWmodel_params_for_timeframe
 
+
+@_memoise_params
 def get_minervini_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get timeframe-specific Minervini parameters.
@@ -2078,6 +2722,7 @@ def get_minervini_params_for_timeframe(config: UserConfiguration, timeframe: str
     }
 
 
+@_memoise_params
 def get_giusti_params_for_timeframe(config, timeframe):
     """
     Get Giusti screener parameters for specific timeframe.
@@ -2105,6 +2750,7 @@ def get_giusti_params_for_timeframe(config, timeframe):
     }
 
 
+@_memoise_params
 def get_drwish_params_for_timeframe(config: UserConfiguration, timeframe: str) -> list:
     """
     Get Dr. Wish suite screener parameters for specific timeframe.
@@ -2117,59 +2763,86 @@ def get_drwish_params_for_timeframe(config: UserConfiguration, timeframe: str) -
     Returns:
         List of dictionaries with Dr. Wish parameters for each parameter set
     """
-    # Parse semicolon-separated values
-    lookback_periods = [p.strip() for p in config.drwish_lookback_period.split(';') if p.strip()]
-    historical_glb_periods = [p.strip() for p in config.drwish_calculate_historical_GLB.split(';') if p.strip()]
-    confirmation_periods = [p.strip() for p in config.drwish_confirmation_period.split(';') if p.strip()]
+    # Semicolon-separated values, already parsed into tuples
+    lookback_periods = config.parsed('drwish_lookback_period')
+    historical_glb_periods = config.parsed('drwish_calculate_historical_GLB')
+    confirmation_periods = config.parsed('drwish_confirmation_period')
 
-    # Ensure all lists have the same length by padding with the first value
+    # Pad shorter lists with their first value so every set has all three
     max_sets = max(len(lookback_periods), len(historical_glb_periods), len(confirmation_periods))
-
-    if len(lookback_periods) < max_sets:
-        lookback_periods.extend([lookback_periods[0]] * (max_sets - len(lookback_periods)))
-    if len(historical_glb_periods) < max_sets:
-        historical_glb_periods.extend([historical_glb_periods[0]] * (max_sets - len(historical_glb_periods)))
-    if len(confirmation_periods) < max_sets:
-        confirmation_periods.extend([confirmation_periods[0]] * (max_sets - len(confirmation_periods)))
+    period_sets = zip(*(
+        values + values[:1] * (max_sets - len(values))
+        for values in (lookback_periods, historical_glb_periods, confirmation_periods)
+    ))
+
+    # Settings shared by every parameter set, split around the per-set periods
+    common_head = {
+        'min_price': config.drwish_min_price,
+        'min_volume': config.drwish_min_volume,
+        'pivot_strength': config.drwish_pivot_strength,
+    }
+    common_tail = {
+        'require_confirmation': config.drwish_require_confirmation,
+        'enable_glb': config.drwish_enable_glb,
+        'enable_blue_dot': config.drwish_enable_blue_dot,
+        'enable_black_dot': config.drwish_enable_black_dot,
+        'blue_dot_stoch_period': config.drwish_blue_dot_stoch_period,
+        'blue_dot_stoch_threshold': config.drwish_blue_dot_stoch_threshold,
+        'blue_dot_sma_period': config.drwish_blue_dot_sma_period,
+        'black_dot_stoch_period': config.drwish_black_dot_stoch_period,
+        'black_dot_stoch_threshold': config.drwish_black_dot_stoch_threshold,
+        'black_dot_lookback': config.drwish_black_dot_lookback,
+        'black_dot_sma_period': config.drwish_black_dot_sma_period,
+        'black_dot_ema_period': config.drwish_black_dot_ema_period,
+        'show_all_stocks': config.drwish_show_all_stocks,
+        'enable_charts': config.drwish_enable_charts,
+        'chart_output_dir': config.drwish_chart_output_dir,
+        'show_historical_glb': config.drwish_show_historical_glb,
+        'show_breakout_labels': config.drwish_show_breakout_labels,
+        'generate_individual_files': config.drwish_generate_individual_files,
+        'ticker_choice': config.ticker_choice
+    }
 
     # Create parameter sets
-    param_sets = []
-    for i in range(max_sets):
-        param_set = {
+    return [
+        {
             'timeframe': timeframe,
             'parameter_set_index': i,
             'parameter_set_name': f"set{i+1}",
-            'min_price': config.drwish_min_price,
-            'min_volume': config.drwish_min_volume,
-            'pivot_strength': config.drwish_pivot_strength,
-            'lookback_period': lookback_periods[i],
-            'calculate_historical_GLB': historical_glb_periods[i],
-            'confirmation_period': confirmation_periods[i],
-            'require_confirmation': config.drwish_require_confirmation,
-            'enable_glb': config.drwish_enable_glb,
-            'enable_blue_dot': config.drwish_enable_blue_dot,
-            'enable_black_dot': config.drwish_enable_black_dot,
-            'blue_dot_stoch_period': config.drwish_blue_dot_stoch_period,
-            'blue_dot_stoch_threshold': config.drwish_blue_dot_stoch_threshold,
-            'blue_dot_sma_period': config.drwish_blue_dot_sma_period,
-            'black_dot_stoch_period': config.drwish_black_dot_stoch_period,
-            'black_dot_stoch_threshold': config.drwish_black_dot_stoch_threshold,
-            'black_dot_lookback': config.drwish_black_dot_lookback,
-            'black_dot_sma_period': config.drwish_black_dot_sma_period,
-            'black_dot_ema_period': config.drwish_black_dot_ema_period,
-            'show_all_stocks': config.drwish_show_all_stocks,
-            'enable_charts': config.drwish_enable_charts,
-            'chart_output_dir': config.drwish_chart_output_dir,
-            'show_historical_glb': config.drwish_show_historical_glb,
-            'show_breakout_labels': config.drwish_show_breakout_labels,
-            'generate_individual_files': config.drwish_generate_individual_files,
-            'ticker_choice': config.ticker_choice
+            **common_head,
+            'lookback_period': lookback_period,
+            'calculate_historical_GLB': historical_glb,
+            'confirmation_period': confirmation_period,
+            **common_tail,
         }
-        param_sets.append(param_set)
+        for i, (lookback_period, historical_glb, confirmation_period) in enumerate(period_sets)
+    ]
+
 
-    return param_sets
+# Fixed daily indicator periods, scaled once per timeframe (never below 1)
+_VOLUME_SUITE_PERIODS = {
+    timeframe: {
+        name: max(1, int(base * scale))
+        for name, base in (('vroc_period', 25), ('rvol_period', 20), ('mfi_period', 14),
+                           ('vpt_ma_period', 20), ('adtv_ma_period', 50))
+    }
+    for timeframe, scale in _TIMEFRAME_SCALING.items()
+}
+
+# Fixed daily Stockbee Suite periods, scaled once per timeframe (never below their floor)
+_STOCKBEE_SUITE_PERIODS = {
+    timeframe: {
+        name: max(floor, int(base * scale))
+        for name, base, floor in (('9m_rel_vol_period', 20, 1), ('weekly_lookback_days', 5, 3),
+                                  ('weekly_avg_period', 20, 1), ('daily_rel_vol_period', 20, 1),
+                                  ('daily_sma_50_period', 50, 1), ('daily_sma_200_period', 200, 1),
+                                  ('industry_history_period', 50, 10))
+    }
+    for timeframe, scale in _TIMEFRAME_SCALING.items()
+}
 
 
+@_memoise_params
 def get_volume_suite_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get Volume Suite screener parameters for specific timeframe.
@@ -2182,14 +2855,9 @@ def get_volume_suite_params_for_timeframe(config: UserConfiguration, timeframe:
     Returns:
         Dictionary with Volume Suite parameters for the timeframe
     """
-    # Timeframe scaling factors for periods
-    timeframe_scaling = {
-        'daily': 1.0,
-        'weekly': 0.2,  # 5 weeks = 1 month daily
-        'monthly': 0.05  # 12 months = 1 year daily 
-    }
-    
-    scale = timeframe_scaling.get(timeframe, 1.0)
+    scale = _TIMEFRAME_SCALING.get(timeframe, 1.0)
+    periods = _VOLUME_SUITE_PERIODS.get(timeframe, _VOLUME_SUITE_PERIODS['daily'])
+    cutoffs = config.scaled_periods.get(('volume_suite', timeframe)) or config.scaled_periods[('volume_suite', 'daily')]
     
     return {
         'enable_volume_suite': config.volume_suite_enable,
@@ -2204,8 +2872,8 @@ def get_volume_suite_params_for_timeframe(config: UserConfiguration, timeframe:
             'save_individual_files': config.volume_suite_save_individual_files,
             
             # HV Absolute parameters (timeframe-scaled)
-            'hv_month_cutoff': max(1, int(config.volume_suite_hv_month_cutoff * scale)),
-            'hv_day_cutoff': max(1, int(config.volume_suite_hv_day_cutoff * scale)),
+            'hv_month_cutoff': cutoffs['hv_month_cutoff'],
+            'hv_day_cutoff': cutoffs['hv_day_cutoff'],
             'hv_std_cutoff': config.volume_suite_hv_std_cutoff,
             'hv_min_volume': config.volume_suite_hv_min_volume,
             'hv_min_price': config.volume_suite_hv_min_price,
@@ -2216,16 +2884,16 @@ def get_volume_suite_params_for_timeframe(config: UserConfiguration, timeframe:
             
             # Volume Indicators parameters (timeframe-scaled periods)
             'vroc_threshold': config.volume_suite_vroc_threshold,
-            'vroc_period': max(1, int(25 * scale)),  # 25 daily -> 5 weekly -> 1 monthly
+            'vroc_period': periods['vroc_period'],  # 25 daily -> 5 weekly -> 1 monthly
             'rvol_threshold': config.volume_suite_rvol_threshold,
-            'rvol_period': max(1, int(20 * scale)),  # 20 daily -> 4 weekly -> 1 monthly
+            'rvol_period': periods['rvol_period'],  # 20 daily -> 4 weekly -> 1 monthly
             'rvol_extreme_threshold': config.volume_suite_rvol_extreme_threshold,
-            'mfi_period': max(1, int(14 * scale)),   # 14 daily -> 3 weekly -> 1 monthly
+            'mfi_period': periods['mfi_period'],   # 14 daily -> 3 weekly -> 1 monthly
             'mfi_overbought': config.volume_suite_mfi_overbought,
             'mfi_oversold': config.volume_suite_mfi_oversold,
             'vpt_threshold': config.volume_suite_vpt_threshold,
-            'vpt_ma_period': max(1, int(20 * scale)), # 20 daily -> 4 weekly -> 1 monthly
-            'adtv_ma_period': max(1, int(50 * scale)), # 50 daily -> 10 weekly -> 3 monthly
+            'vpt_ma_period': periods['vpt_ma_period'], # 20 daily -> 4 weekly -> 1 monthly
+            'adtv_ma_period': periods['adtv_ma_period'], # 50 daily -> 10 weekly -> 3 monthly
             'adtv_3m_threshold': config.volume_suite_adtv_3m_threshold,
             'adtv_6m_threshold': config.volume_suite_adtv_6m_threshold,
             'adtv_1y_threshold': config.volume_suite_adtv_1y_threshold,
@@ -2238,12 +2906,12 @@ def get_volume_suite_params_for_timeframe(config: UserConfiguration, timeframe:
             'pvb_clmodel_volume_multiplier': config.volume_suite_pvb_clmodel_volume_multiplier,
             'pvb_clmodel_direction': config.volume_suite_pvb_clmodel_direction
         },
-        'volume_output_dir': config.volume_suite_output_dir,
-        'timeframe': timeframe
+        'volume_output_dir': config.volume_suite_output_dir
     }
 
 
-def get_stockbee_suite_params_for_timeframe(config: UserConfiguration, timeframe: str) -> Optional[dict]:
+@_memoise_params
+def get_stockbee_suite_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict | None:
     """
     Get Stockbee Suite screener parameters for specific timeframe with hierarchical flag checking.
     Automatically scales periods based on timeframe.
@@ -2255,23 +2923,12 @@ def get_stockbee_suite_params_for_timeframe(config: UserConfiguration, timeframe
     Returns:
         Dictionary with Stockbee Suite parameters for the timeframe, or None if disabled
     """
-    # Check master flag
-    if not getattr(config, "stockbee_suite_enable", False):
-        return None
-
-    # Check timeframe flag
-    timeframe_flag = f"stockbee_suite_{timeframe}_enable"
-    if not getattr(config, timeframe_flag, True):
+    # Check master and timeframe flags (precomputed on the configuration)
+    if not config.is_module_enabled('stockbee_suite', timeframe):
         return None
 
-    # Timeframe scaling factors for periods
-    timeframe_scaling = {
-        'daily': 1.0,
-        'weekly': 0.2,  # 5 weeks = 1 month daily
-        'monthly': 0.05  # 12 months = 1 year daily
-    }
-
-    scale = timeframe_scaling.get(timeframe, 1.0)
+    scale = _TIMEFRAME_SCALING.get(timeframe, 1.0)
+    periods = _STOCKBEE_SUITE_PERIODS.get(timeframe, _STOCKBEE_SUITE_PERIODS['daily'])
 
     return {
         'enable_stockbee_suite': config.stockbee_suite_enable,
@@ -2291,34 +2948,34 @@ def get_stockbee_suite_params_for_timeframe(config: UserConfiguration, timeframe
             # 9M Movers parameters
             '9m_volume_threshold': config.stockbee_suite_9m_volume_threshold,
             '9m_rel_vol_threshold': config.stockbee_suite_9m_rel_vol_threshold,
-            '9m_rel_vol_period': max(1, int(20 * scale)),  # 20 daily -> 4 weekly
+            '9m_rel_vol_period': periods['9m_rel_vol_period'],  # 20 daily -> 4 weekly
             
             # Weekly Movers parameters (timeframe-scaled)
             'weekly_gain_threshold': config.stockbee_suite_weekly_gain_threshold,
             'weekly_rel_vol_threshold': config.stockbee_suite_weekly_rel_vol_threshold,
             'weekly_min_avg_volume': config.stockbee_suite_weekly_min_avg_volume,
-            'weekly_lookback_days': max(3, int(5 * scale)),  # 5 daily -> 1 weekly
-            'weekly_avg_period': max(1, int(20 * scale)),   # 20 daily -> 4 weekly
+            'weekly_lookback_days': periods['weekly_lookback_days'],  # 5 daily -> 1 weekly
+            'weekly_avg_period': periods['weekly_avg_period'],   # 20 daily -> 4 weekly
             
             # Daily Gainers parameters (timeframe-scaled)
             'daily_gain_threshold': config.stockbee_suite_daily_gain_threshold,
             'daily_rel_vol_threshold': config.stockbee_suite_daily_rel_vol_threshold,
             'daily_min_volume': config.stockbee_suite_daily_min_volume,
-            'daily_rel_vol_period': max(1, int(20 * scale)),  # 20 daily -> 4 weekly
-            'daily_sma_50_period': max(1, int(50 * scale)),   # 50 daily -> 10 weekly
-            'daily_sma_200_period': max(1, int(200 * scale)), # 200 daily -> 40 weekly
+            'daily_rel_vol_period': periods['daily_rel_vol_period'],  # 20 daily -> 4 weekly
+            'daily_sma_50_period': periods['daily_sma_50_period'],   # 50 daily -> 10 weekly
+            'daily_sma_200_period': periods['daily_sma_200_period'], # 200 daily -> 40 weekly
             
             # Industry Leaders parameters
             'industry_top_pct': config.stockbee_suite_industry_top_pct,
             'industry_top_stocks': config.stockbee_suite_industry_top_stocks,
             'industry_min_stocks': 3,  # Minimum stocks per industry
-            'industry_history_period': max(10, int(50 * scale)),  # History needed
+            'industry_history_period': periods['industry_history_period'],  # History needed
         },
-        'stockbee_output_dir': f'results/screeners/stockbee_suite',
-        'timeframe': timeframe
+        'stockbee_output_dir': f'results/screeners/stockbee_suite'
     }
 
 
+@_memoise_params
 def get_qullamaggie_suite_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get Qullamaggie Suite screener parameters for specific timeframe.
@@ -2370,6 +3027,7 @@ def get_qullamaggie_suite_params_for_timeframe(config: UserConfiguration, timefr
     }
 
 
+@_memoise_params
 def get_adl_screener_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get ADL screener parameters for specific timeframe.
@@ -2404,6 +3062,7 @@ def get_adl_screener_params_for_timeframe(config: UserConfiguration, timeframe:
     }
 
 
+@_memoise_params
 def get_guppy_screener_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get Guppy GMMA screener parameters for specific timeframe with hierarchical flag checking.
@@ -2415,17 +3074,9 @@ def get_guppy_screener_params_for_timeframe(config: UserConfiguration, timeframe
     Returns:
         Dictionary with Guppy GMMA screener parameters, empty dict if disabled
     """
-    # Check master enable flag first
-    master_enabled = getattr(config, 'guppy_screener_enable', False)
-    if not master_enabled:
-        return {}  # Skip entirely if master disabled
-
-    # Check timeframe-specific enable flag
-    timeframe_attr = f'guppy_screener_{timeframe}_enable'
-    timeframe_enabled = getattr(config, timeframe_attr, True)  # Default True for compatibility
-
-    if not timeframe_enabled:
-        return {}  # Skip if timeframe disabled
+    # Check master and timeframe flags (precomputed on the configuration)
+    if not config.is_module_enabled('guppy_screener', timeframe):
+        return {}  # Skip if master or timeframe disabled
 
     # Both master AND timeframe flags are enabled - return full parameter set
     return {
@@ -2436,8 +3087,8 @@ def get_guppy_screener_params_for_timeframe(config: UserConfiguration, timeframe
             'ma_type': config.guppy_screener_ma_type,
 
             # EMA periods (NOW from user configuration, not hardcoded)
-            'short_term_emas': config.guppy_screener_short_term_emas,
-            'long_term_emas': config.guppy_screener_long_term_emas,
+            'short_term_emas': list(config.guppy_screener_short_term_emas),
+            'long_term_emas': list(config.guppy_screener_long_term_emas),
             
             # Signal detection thresholds
             'min_compression_ratio': config.guppy_screener_min_compression_ratio,
@@ -2458,7 +3109,8 @@ def get_guppy_screener_params_for_timeframe(config: UserConfiguration, timeframe
     }
 
 
-def get_gold_launch_pad_params_for_timeframe(config: UserConfiguration, timeframe: str) -> Optional[dict]:
+@_memoise_params
+def get_gold_launch_pad_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict | None:
     """
     Get Gold Launch Pad screener parameters for specific timeframe with hierarchical flag checking.
 
@@ -2469,13 +3121,8 @@ def get_gold_launch_pad_params_for_timeframe(config: UserConfiguration, timefram
     Returns:
         Dictionary with Gold Launch Pad screener parameters or None if disabled
     """
-    # Check master flag first
-    if not getattr(config, "gold_launch_pad_enable", False):
-        return None
-
-    # Check timeframe flag
-    timeframe_flag = f"gold_launch_pad_{timeframe}_enable"
-    if not getattr(config, timeframe_flag, True):
+    # Check master and timeframe flags (precomputed on the configuration)
+    if not config.is_module_enabled('gold_launch_pad', timeframe):
         return None
 
     return {
@@ -2483,7 +3130,7 @@ def get_gold_launch_pad_params_for_timeframe(config: UserConfiguration, timefram
         'timeframe': timeframe,
         'gold_launch_pad': {
             # Moving Average Configuration
-            'ma_periods': config.gold_launch_pad_ma_periods,
+            'ma_periods': list(config.gold_launch_pad_ma_periods),
             'ma_type': config.gold_launch_pad_ma_type,
             
             # Z-score Analysis Configuration
@@ -2510,6 +3157,7 @@ def get_gold_launch_pad_params_for_timeframe(config: UserConfiguration, timefram
     }
 
 
+@_memoise_params
 def get_rti_screener_params_for_timeframe(config: UserConfiguration, timeframe: str) -> dict:
     """
     Get RTI screener parameters for specific timeframe.
@@ -2521,23 +3169,17 @@ def get_rti_screener_params_for_timeframe(config: UserConfiguration, timeframe:
     Returns:
         Dictionary with RTI screener parameters
     """
-    # Timeframe scaling for RTI periods
-    timeframe_scaling = {
-        'daily': 1.0,
-        'weekly': 0.2,  # 5 weeks = 1 month daily
-        'monthly': 0.05  # 12 months = 1 year daily
-    }
-    
-    scale = timeframe_scaling.get(timeframe, 1.0)
+    # RTI periods are scaled per timeframe when the configuration is built
+    periods = config.scaled_periods.get(('rti', timeframe)) or config.scaled_periods[('rti', 'daily')]
     
     return {
         'enable_rti': config.rti_enable,
         'timeframe': timeframe,
         'rti_screener': {
             # RTI Calculation Parameters (timeframe-scaled)
-            'rti_period': max(5, int(config.rti_period * scale)),
-            'rti_short_period': max(2, int(config.rti_short_period * scale)),
-            'rti_swing_period': max(3, int(config.rti_swing_period * scale)),
+            'rti_period': periods['rti_period'],
+            'rti_short_period': periods['rti_short_period'],
+            'rti_swing_period': periods['rti_swing_period'],
             
             # Volatility Zone Thresholds
             'zone1_threshold': config.rti_zone1_threshold,
@@ -2547,11 +3189,11 @@ def get_rti_screener_params_for_timeframe(config: UserConfiguration, timeframe:
             
             # Range Expansion Parameters
             'expansion_multiplier': config.rti_expansion_multiplier,
-            'consecutive_low_vol_bars': max(1, int(config.rti_consecutive_low_vol_bars * scale)),
+            'consecutive_low_vol_bars': periods['consecutive_low_vol_bars'],
             
             # Signal Detection Parameters (timeframe-scaled)
-            'min_consolidation_period': max(1, int(config.rti_min_consolidation_period * scale)),
-            'breakout_confirmation_period': max(1, int(config.rti_breakout_confirmation_period * scale)),
+            'min_consolidation_period': periods['min_consolidation_period'],
+            'breakout_confirmation_period': periods['breakout_confirmation_period'],
             
             # Base Filters
             'min_price': config.rti_min_price,
@@ -7,33 +7,45 @@ Creates charts to visualize Highest Volume Ever events.
 
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Chart style, applied only while rendering instead of changing global rcParams
+_CHART_STYLE = plt.style.library['seaborn-v0_8-darkgrid']
+
 
 class HVEVisualizer:
     """
     Creates visualizations for Highest Volume Ever analysis.
     """
 
-    def __init__(self, chart_width: int = 14, chart_height: int = 7):
+    def __init__(self, chart_width: int = 14, chart_height: int = 7,
+                 save_dpi: int = 100, save_compress_level: int = 6):
         """
-        Initialize visualizer with chart dimensions.
+        Initialize visualizer with chart dimensions and PNG output settings.
 
         Args:
             chart_width: Width of charts in inches
             chart_height: Height of charts in inches
+            save_dpi: Resolution of saved charts (lower is faster and smaller)
+            save_compress_level: PNG zlib level 0-9 (1 writes fastest, 9 smallest)
         """
         self.chart_width = chart_width
         self.chart_height = chart_height
+        self.save_dpi = save_dpi
+        self.save_compress_level = save_compress_level
 
-        # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
+        # Price/volume figure shared by every create_hve_chart call (built lazily)
+        self._hve_figure = None
 
     def create_hve_chart(self, ticker: str, df: pd.DataFrame,
                         hve_dates: List[pd.Timestamp],
@@ -53,85 +65,131 @@ class HVEVisualizer:
             True if chart created successfully, False otherwise
         """
         try:
-            # Create figure with 2 subplots (price and volume)
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(self.chart_width, self.chart_height),
-                                          gridspec_kw={'height_ratios': [2, 1]})
-
-            # Plot price
-            ax1.plot(df.index, df['Close'], label='Close Price', color='blue', linewidth=1.5)
-            ax1.set_ylabel('Price ($)', fontsize=12, fontweight='bold')
-            ax1.set_title(f'{ticker} - Highest Volume Ever Analysis ({timeframe.capitalize()})',
-                         fontsize=14, fontweight='bold')
-            ax1.grid(True, alpha=0.3)
-            ax1.legend(loc='upper left')
-
-            # Plot volume bars
-            colors = ['red' if date in hve_dates else 'gray' for date in df.index]
-            ax2.bar(df.index, df['Volume'], color=colors, alpha=0.6, width=0.8)
-            ax2.set_ylabel('Volume', fontsize=12, fontweight='bold')
-            ax2.set_xlabel('Date', fontsize=12, fontweight='bold')
-            ax2.grid(True, alpha=0.3, axis='y')
-
-            # Mark HVE events on both subplots
-            for hve_date in hve_dates:
-                if hve_date in df.index:
-                    hve_price = df.loc[hve_date, 'Close']
-                    hve_volume = df.loc[hve_date, 'Volume']
-
-                    # Mark on price chart
-                    ax1.axvline(x=hve_date, color='red', linestyle='--', alpha=0.5, linewidth=1)
-                    ax1.scatter([hve_date], [hve_price], color='red', s=100,
-                               zorder=5, marker='v', label='HVE' if hve_date == hve_dates[0] else '')
-
-                    # Annotate latest HVE
-                    if hve_date == hve_dates[-1]:
-                        ax1.annotate('Latest HVE', xy=(hve_date, hve_price),
-                                   xytext=(10, 10), textcoords='offset points',
-                                   bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.7),
-                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
-
-                    # Mark on volume chart
-                    ax2.axvline(x=hve_date, color='red', linestyle='--', alpha=0.5, linewidth=1)
-
-            # Format x-axis dates
-            ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            ax2.xaxis.set_major_locator(mdates.AutoDateLocator())
-            plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
-
-            # Add legend for HVE markers on price chart
-            if hve_dates:
-                handles, labels = ax1.get_legend_handles_labels()
-                if 'HVE' in labels:
-                    ax1.legend(loc='upper left')
-
-            # Add text box with HVE statistics
-            hve_count = len(hve_dates)
-            latest_hve = hve_dates[-1] if hve_dates else None
-            days_since = (df.index[-1] - latest_hve).days if latest_hve else None
-
-            stats_text = f'HVE Events: {hve_count}\n'
-            if latest_hve:
-                stats_text += f'Latest: {latest_hve.strftime("%Y-%m-%d")}\n'
-                stats_text += f'Days Since: {days_since}'
-
-            ax1.text(0.02, 0.98, stats_text, transform=ax1.transAxes,
-                    fontsize=10, verticalalignment='top',
-                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-
-            # Tight layout and save
-            plt.tight_layout()
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
+            with plt.rc_context(_CHART_STYLE):
+                fig = self._get_hve_figure()
+                ax1, ax2 = fig.axes
+                self._plot_hve_axes(ax1, ax2, ticker, df, hve_dates, timeframe)
+
+                # Tight layout (starting from the default margins rather than the
+                # previous chart's) and save
+                fig.subplots_adjust(**{side: plt.rcParams[f'figure.subplot.{side}']
+                                       for side in ('left', 'right', 'bottom', 'top', 'hspace')})
+                fig.tight_layout()
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                fig.savefig(output_path, dpi=self.save_dpi,
+                            pil_kwargs={'compress_level': self.save_compress_level})
 
             logger.info(f"Created chart for {ticker}: {output_path}")
             return True
 
         except Exception as e:
             logger.error(f"Error creating chart for {ticker}: {e}")
-            plt.close('all')
             return False
 
+    def _get_hve_figure(self) -> Figure:
+        """
+        Return the price/volume figure, creating it on first use.
+
+        The figure and its two axes are built once per visualizer and cleared
+        between charts, so batches skip the per-chart figure and gridspec setup.
+        A standalone Agg figure is not tracked by pyplot, so nothing needs closing.
+
+        Returns:
+            Figure holding the price and volume axes
+        """
+        if self._hve_figure is None:
+            fig = Figure(figsize=(self.chart_width, self.chart_height))
+            FigureCanvasAgg(fig)
+            fig.subplots(2, 1, gridspec_kw={'height_ratios': [2, 1]})
+            self._hve_figure = fig
+        return self._hve_figure
+
+    def _plot_hve_axes(self, ax1, ax2, ticker: str, df: pd.DataFrame,
+                       hve_dates: List[pd.Timestamp], timeframe: str) -> None:
+        """
+        Draw one ticker's price and volume panels into existing axes.
+
+        Args:
+            ax1: Price axes (cleared first)
+            ax2: Volume axes (cleared first)
+            ticker: Ticker symbol
+            df: DataFrame with OHLCV data
+            hve_dates: List of dates when HVE occurred
+            timeframe: Timeframe being analyzed
+        """
+        ax1.clear()
+        ax2.clear()
+
+        # Plain arrays, so matplotlib does not unwrap the pandas objects itself
+        dates = df.index.to_numpy()
+        close = df['Close'].to_numpy()
+        volume = df['Volume'].to_numpy()
+
+        # Plot price
+        ax1.plot(dates, close, label='Close Price', color='blue', linewidth=1.5)
+        ax1.set_ylabel('Price ($)', fontsize=12, fontweight='bold')
+        ax1.set_title(f'{ticker} - Highest Volume Ever Analysis ({timeframe.capitalize()})',
+                     fontsize=14, fontweight='bold')
+        ax1.grid(True, alpha=0.3)
+        ax1.legend(loc='upper left')
+
+        # Plot volume bars (HVE bars picked with one vectorized membership test)
+        colors = np.where(df.index.isin(hve_dates), 'red', 'gray')
+        ax2.bar(dates, volume, color=colors, alpha=0.6, width=0.8)
+        ax2.set_ylabel('Volume', fontsize=12, fontweight='bold')
+        ax2.set_xlabel('Date', fontsize=12, fontweight='bold')
+        ax2.grid(True, alpha=0.3, axis='y')
+
+        # Mark HVE events on both subplots; bar positions for all events come
+        # from one index lookup (-1 = not in range) and prices from one gather
+        positions = df.index.get_indexer(hve_dates)
+        found = positions >= 0
+        marked_dates = [hve_date for hve_date, hit in zip(hve_dates, found) if hit]
+        marked_prices = close[positions[found]]
+        if marked_dates:
+            # One LineCollection per subplot; like axvline, the lines span
+            # the full axes height without touching the y autoscaling
+            for ax in (ax1, ax2):
+                ax.vlines(marked_dates, 0, 1, transform=ax.get_xaxis_transform(),
+                          colors='red', linestyles='--', alpha=0.5, linewidth=1)
+
+            # Mark on price chart; the legend entry and the annotation belong to
+            # the first and last listed HVE dates, shown only if they are charted
+            ax1.scatter(marked_dates, marked_prices, color='red', s=100,
+                       zorder=5, marker='v', label='HVE' if found[0] else '')
+
+            # Annotate latest HVE
+            if found[-1]:
+                ax1.annotate('Latest HVE', xy=(marked_dates[-1], marked_prices[-1]),
+                           xytext=(10, 10), textcoords='offset points',
+                           bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.7),
+                           arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+
+        # Format x-axis dates
+        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        ax2.xaxis.set_major_locator(mdates.AutoDateLocator())
+        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+
+        # Add legend for HVE markers on price chart
+        if hve_dates:
+            handles, labels = ax1.get_legend_handles_labels()
+            if 'HVE' in labels:
+                ax1.legend(loc='upper left')
+
+        # Add text box with HVE statistics
+        hve_count = len(hve_dates)
+        latest_hve = hve_dates[-1] if hve_dates else None
+        days_since = (df.index[-1] - latest_hve).days if latest_hve else None
+
+        stats_text = f'HVE Events: {hve_count}\n'
+        if latest_hve:
+            stats_text += f'Latest: {latest_hve.strftime("%Y-%m-%d")}\n'
+            stats_text += f'Days Since: {days_since}'
+
+        ax1.text(0.02, 0.98, stats_text, transform=ax1.transAxes,
+                fontsize=10, verticalalignment='top',
+                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
     def create_summary_chart(self, results: List[Dict],
                            output_path: Path,
                            timeframe: str = 'daily',
@@ -158,99 +216,138 @@ class HVEVisualizer:
 
             # Prepare data
             tickers = [r['ticker'] for r in top_results]
-            days_since_hve = [r['days_since_latest_hve'] for r in top_results]
-            hve_counts = [r['hve_count'] for r in top_results]
-
-            # Create figure
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(self.chart_width, self.chart_height))
-
-            # Chart 1: Days since latest HVE (horizontal bar)
-            colors1 = plt.cm.RdYlGn_r(np.array(days_since_hve) / max(days_since_hve))
-            ax1.barh(range(len(tickers)), days_since_hve, color=colors1)
-            ax1.set_yticks(range(len(tickers)))
-            ax1.set_yticklabels(tickers, fontsize=9)
-            ax1.set_xlabel('Days Since Latest HVE', fontsize=12, fontweight='bold')
-            ax1.set_title(f'Most Recent HVE Events\n({timeframe.capitalize()})',
-                         fontsize=12, fontweight='bold')
-            ax1.invert_yaxis()
-            ax1.grid(True, alpha=0.3, axis='x')
-
-            # Add value labels
-            for i, v in enumerate(days_since_hve):
-                ax1.text(v + max(days_since_hve) * 0.02, i, str(v),
-                        va='center', fontsize=8)
-
-            # Chart 2: HVE event counts (horizontal bar)
-            colors2 = plt.cm.Blues(np.array(hve_counts) / max(hve_counts) * 0.7 + 0.3)
-            ax2.barh(range(len(tickers)), hve_counts, color=colors2)
-            ax2.set_yticks(range(len(tickers)))
-            ax2.set_yticklabels(tickers, fontsize=9)
-            ax2.set_xlabel('Number of HVE Events', fontsize=12, fontweight='bold')
-            ax2.set_title(f'HVE Frequency\n({timeframe.capitalize()})',
-                         fontsize=12, fontweight='bold')
-            ax2.invert_yaxis()
-            ax2.grid(True, alpha=0.3, axis='x')
-
-            # Add value labels
-            for i, v in enumerate(hve_counts):
-                ax2.text(v + max(hve_counts) * 0.02, i, str(v),
-                        va='center', fontsize=8)
-
-            # Overall title
-            fig.suptitle(f'Highest Volume Ever (HVE) Analysis - Top {len(top_results)} Tickers',
-                        fontsize=14, fontweight='bold')
-
-            # Tight layout and save
-            plt.tight_layout()
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
-            plt.close(fig)
+            days_since_hve = np.asarray([r['days_since_latest_hve'] for r in top_results], dtype=np.float64)
+            hve_counts = np.asarray([r['hve_count'] for r in top_results], dtype=np.float64)
+            days_max = days_since_hve.max()
+            counts_max = hve_counts.max()
+            # All-zero columns (e.g. every HVE on the latest bar) would otherwise divide 0/0
+            days_scaled = days_since_hve / days_max if days_max else np.zeros_like(days_since_hve)
+            counts_scaled = hve_counts / counts_max if counts_max else np.zeros_like(hve_counts)
+
+            with plt.rc_context(_CHART_STYLE):
+                # Create figure
+                fig = Figure(figsize=(self.chart_width, self.chart_height))
+                FigureCanvasAgg(fig)
+                ax1, ax2 = fig.subplots(1, 2)
+
+                # Chart 1: Days since latest HVE (horizontal bar)
+                colors1 = plt.cm.RdYlGn_r(days_scaled)
+                bars1 = ax1.barh(range(len(tickers)), days_since_hve, color=colors1)
+                ax1.set_yticks(range(len(tickers)))
+                ax1.set_yticklabels(tickers, fontsize=9)
+                ax1.set_xlabel('Days Since Latest HVE', fontsize=12, fontweight='bold')
+                ax1.set_title(f'Most Recent HVE Events\n({timeframe.capitalize()})',
+                             fontsize=12, fontweight='bold')
+                ax1.invert_yaxis()
+                ax1.grid(True, alpha=0.3, axis='x')
+
+                # Add value labels
+                ax1.bar_label(bars1, padding=3, fontsize=8)
+
+                # Chart 2: HVE event counts (horizontal bar)
+                colors2 = plt.cm.Blues(counts_scaled * 0.7 + 0.3)
+                bars2 = ax2.barh(range(len(tickers)), hve_counts, color=colors2)
+                ax2.set_yticks(range(len(tickers)))
+                ax2.set_yticklabels(tickers, fontsize=9)
+                ax2.set_xlabel('Number of HVE Events', fontsize=12, fontweight='bold')
+                ax2.set_title(f'HVE Frequency\n({timeframe.capitalize()})',
+                             fontsize=12, fontweight='bold')
+                ax2.invert_yaxis()
+                ax2.grid(True, alpha=0.3, axis='x')
+
+                # Add value labels
+                ax2.bar_label(bars2, padding=3, fontsize=8)
+
+                # Overall title
+                fig.suptitle(f'Highest Volume Ever (HVE) Analysis - Top {len(top_results)} Tickers',
+                            fontsize=14, fontweight='bold')
+
+                # Tight layout and save
+                fig.tight_layout()
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                fig.savefig(output_path, dpi=self.save_dpi,
+                            pil_kwargs={'compress_level': self.save_compress_level})
 
             logger.info(f"Created summary chart: {output_path}")
             return True
 
         except Exception as e:
             logger.error(f"Error creating summary chart: {e}")
-            plt.close('all')
             return False
 
     def create_charts_for_results(self, results: List[Dict],
                                  batch_data: Dict[str, pd.DataFrame],
                                  output_dir: Path,
                                  timeframe: str = 'daily',
-                                 max_charts: int = 50) -> int:
+                                 max_charts: int = 50,
+                                 max_workers: Optional[int] = None) -> int:
         """
         Create individual HVE charts for screening results.
 
+        Charts are independent, so they are rendered in parallel worker
+        processes; ``max_workers=1`` renders them sequentially in-process.
+
         Args:
             results: List of HVE screening results
             batch_data: Dictionary mapping ticker -> DataFrame
             output_dir: Directory to save charts
             timeframe: Timeframe being analyzed
             max_charts: Maximum number of individual charts to create
+            max_workers: Worker processes to use (default: one per CPU)
 
         Returns:
             Number of charts created successfully
         """
-        charts_created = 0
-
         # Create charts directory
         charts_dir = output_dir / f'charts_{timeframe}'
         charts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create charts for top results
-        for i, result in enumerate(results[:max_charts]):
+        # Collect one picklable task per chart for the top results
+        settings = (self.chart_width, self.chart_height, self.save_dpi, self.save_compress_level)
+        tasks = []
+        for result in results[:max_charts]:
             ticker = result['ticker']
-            hve_dates = result['hve_details']
-            hve_dates_list = [detail['date'] for detail in hve_dates]
-
             if ticker in batch_data:
+                hve_dates_list = [detail['date'] for detail in result['hve_details']]
                 output_path = charts_dir / f'{ticker}_{timeframe}.png'
+                tasks.append((ticker, batch_data[ticker], hve_dates_list, output_path,
+                              timeframe, settings))
 
-                if self.create_hve_chart(ticker, batch_data[ticker],
-                                        hve_dates_list, output_path, timeframe):
-                    charts_created += 1
+        outcomes = None
+        if len(tasks) > 1 and max_workers != 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    outcomes = list(executor.map(_render_hve_chart, tasks, chunksize=4))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel chart rendering unavailable ({e}), rendering sequentially")
 
+        if outcomes is None:
+            outcomes = [self.create_hve_chart(*task[:5]) for task in tasks]
+
+        charts_created = sum(outcomes)
         logger.info(f"Created {charts_created} individual charts for {timeframe}")
 
         return charts_created
+
+
+# One visualizer (and so one reusable figure) per settings tuple in each worker process
+_WORKER_VISUALIZERS: Dict[tuple, HVEVisualizer] = {}
+
+
+def _render_hve_chart(task: tuple) -> bool:
+    """
+    Render one HVE chart in a worker process.
+
+    Args:
+        task: (ticker, df, hve_dates, output_path, timeframe, settings), where
+            settings are the HVEVisualizer constructor arguments
+
+    Returns:
+        True if chart created successfully, False otherwise
+    """
+    ticker, df, hve_dates, output_path, timeframe, settings = task
+    visualizer = _WORKER_VISUALIZERS.get(settings)
+    if visualizer is None:
+        visualizer = HVEVisualizer(*settings)
+        _WORKER_VISUALIZERS[settings] = visualizer
+    return visualizer.create_hve_chart(ticker, df, hve_dates, output_path, timeframe)
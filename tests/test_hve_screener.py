@@ -0,0 +1,183 @@
+"""Behaviour tests for the HVE screener."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.hve_screener import HVEScreener
+
+
+def _frame(volumes, start='2022-01-03'):
+    """Build a business-day OHLCV frame around the given volumes."""
+    index = pd.bdate_range(start, periods=len(volumes))
+    close = np.linspace(10.0, 20.0, len(volumes))
+    return pd.DataFrame({'Open': close - 0.5, 'High': close + 1, 'Low': close - 1,
+                         'Close': close, 'Volume': volumes}, index=index)
+
+
+def _dated_frame(volumes_by_date):
+    """Build an OHLCV frame from a {date: volume} mapping."""
+    frame = _frame(list(volumes_by_date.values()))
+    frame.index = pd.to_datetime(list(volumes_by_date))
+    return frame
+
+
+class FindHVEEventsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.screener = HVEScreener()
+
+    def test_counts_only_new_highs(self):
+        # The first bar has no prior maximum and a repeated maximum is not a new high
+        df = _frame([100.0, 300.0, 200.0, 400.0, 400.0, 50.0])
+
+        result = self.screener.find_hve_events(df)
+
+        self.assertEqual(result['hve_count'], 2)
+        self.assertEqual(result['hve_dates'], [df.index[1], df.index[3]])
+        self.assertEqual(result['latest_hve_date'], df.index[3])
+        self.assertEqual(result['days_since_latest_hve'], (df.index[5] - df.index[3]).days)
+        self.assertEqual(result['current_volume'], 50.0)
+        self.assertEqual(result['max_volume_ever'], 400.0)
+        self.assertEqual([d['volume'] for d in result['hve_details']], [300.0, 400.0])
+        self.assertEqual(result['data_points'], 6)
+
+    def test_details_carry_prices(self):
+        df = _frame([100.0, 300.0])
+
+        detail = self.screener.find_hve_events(df)['hve_details'][-1]
+
+        self.assertEqual(detail['close'], 20.0)
+        self.assertEqual(detail['open'], 19.5)
+        self.assertAlmostEqual(detail['price_change_pct'], 0.5 / 19.5 * 100)
+
+    def test_sorts_unordered_input_and_skips_gaps(self):
+        df = _frame([100.0, np.nan, 200.0, 150.0, 300.0])
+
+        result = self.screener.find_hve_events(df.iloc[::-1])
+
+        self.assertEqual(result['hve_dates'], [df.index[2], df.index[4]])
+        self.assertEqual(result['days_since_latest_hve'], 0)
+
+    def test_missing_data_gives_empty_result(self):
+        empty = self.screener._empty_result()
+        self.assertEqual(self.screener.find_hve_events(None), empty)
+        self.assertEqual(self.screener.find_hve_events(pd.DataFrame()), empty)
+        self.assertEqual(self.screener.find_hve_events(_frame([100.0]).drop(columns='Volume')), empty)
+
+
+class HV1YMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.screener = HVEScreener(hv1y_enabled=True)
+        self.df = _dated_frame({
+            '2022-01-03': 1000.0,
+            '2023-06-01': 200.0,
+            '2023-07-03': 500.0,
+            '2023-08-01': 300.0,
+            '2023-09-01': 600.0,
+            '2023-10-02': 100.0,
+        })
+
+    def test_window_excludes_older_history(self):
+        metrics = self.screener._calculate_hv1y_metrics(self.df, pd.Timestamp('2022-01-03'), 1000.0)
+
+        self.assertEqual(metrics['hv1y_date'], pd.Timestamp('2023-09-01'))
+        self.assertEqual(metrics['hv1y_volume'], 600.0)
+        self.assertEqual(metrics['days_since_hv1y'], 31)
+        self.assertEqual(metrics['hv1y_occ_1y'], 3)
+        self.assertEqual(metrics['total_hv1y_count'], 3)
+        self.assertFalse(metrics['is_hv1y_also_hve'])
+        self.assertAlmostEqual(metrics['hv1y_to_hve_ratio'], 0.6)
+        self.assertEqual([d['volume'] for d in metrics['all_hv1y_details']], [600.0, 500.0, 200.0])
+
+    def test_hv1y_matching_hve(self):
+        df = _frame([100.0, 300.0, 200.0])
+
+        metrics = self.screener._calculate_hv1y_metrics(df, df.index[1], 300.0)
+
+        self.assertTrue(metrics['is_hv1y_also_hve'])
+        self.assertEqual(metrics['hv1y_to_hve_ratio'], 1.0)
+
+    def test_gaps_do_not_count_as_highs(self):
+        df = _frame([100.0, np.nan, 200.0])
+
+        metrics = self.screener._calculate_hv1y_metrics(df, df.index[2], 200.0)
+
+        self.assertEqual(metrics['hv1y_occ_1y'], 2)
+        self.assertEqual(metrics['hv1y_date'], df.index[2])
+
+    def test_short_window_gives_empty_result(self):
+        df = _dated_frame({'2020-01-02': 500.0, '2023-01-03': 100.0})
+        self.assertEqual(self.screener._calculate_hv1y_metrics(df, df.index[0], 500.0),
+                         self.screener._empty_hv1y_result())
+
+
+class ScreenBatchTest(unittest.TestCase):
+
+    def test_volume_columns_keep_float_dtype_with_or_without_gaps(self):
+        screener = HVEScreener(hv1y_enabled=True)
+        whole = _frame([100.0, 300.0, 200.0, 400.0])
+        gappy = _frame([100.0, np.nan, 200.0, 500.0])
+
+        for batch in ({'A': whole}, {'A': whole, 'B': gappy}):
+            results = screener.screen_batch(batch, 'daily')
+            for column in ('hve_volume', 'hv1y_volume', 'latest_volume'):
+                self.assertEqual(results[column].dtype, np.float64, column)
+            self.assertEqual(results.loc[results['ticker'] == 'A', 'hve_volume'].iloc[0], 400.0)
+
+    def test_hv1y_columns_follow_current_setting(self):
+        screener = HVEScreener()
+        batch = {'A': _frame([100.0, 300.0, 200.0])}
+
+        self.assertNotIn('hv1y_volume', screener.screen_batch(batch, 'daily').columns)
+        screener.hv1y_enabled = True
+        results = screener.screen_batch(batch, 'daily')
+
+        self.assertEqual(results['hv1y_volume'].iloc[0], 300.0)
+        # HV1Y columns sit between the HVE details and the latest-bar columns
+        columns = results.columns.tolist()
+        self.assertEqual(columns[columns.index('all_hve_details') + 1], 'hv1y_date')
+
+
+class ScoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.screener = HVEScreener()
+
+    def test_calculate_score_components(self):
+        # Recent HVE, 4 events, at 50% of max volume: 50 + 12 + 10
+        self.assertEqual(self.screener.calculate_score(
+            {'days_since_latest_hve': 5, 'hve_count': 4, 'volume_ratio_to_max': 50}), 72.0)
+        # Recency decays to 25 at 90 days and 0 after two years; both other scores are capped
+        self.assertEqual(self.screener.calculate_score(
+            {'days_since_latest_hve': 90, 'hve_count': 20, 'volume_ratio_to_max': 500}), 75.0)
+        self.assertEqual(self.screener.calculate_score(
+            {'days_since_latest_hve': 800, 'hve_count': 0, 'volume_ratio_to_max': 0}), 0.0)
+
+    def test_missing_inputs_score_zero(self):
+        self.assertEqual(self.screener.calculate_score({}), 0.0)
+        self.assertEqual(self.screener.calculate_score({'days_since_latest_hve': None}), 0.0)
+        self.assertEqual(self.screener.calculate_score({'days_since_latest_hve': 'n/a'}), 0.0)
+
+    def test_enrich_scores_non_numeric_input_zero(self):
+        results = [dict(days_since_latest_hve=5, hve_count=4, volume_ratio_to_max=50),
+                   dict(days_since_latest_hve=5, hve_count='n/a', volume_ratio_to_max=50)]
+
+        enriched = self.screener.enrich_results_with_scores(results)
+
+        self.assertEqual([r['score'] for r in enriched], [72.0, 0.0])
+
+    def test_enrich_matches_calculate_score_and_sorts(self):
+        results = [dict(days_since_latest_hve=d, hve_count=c, volume_ratio_to_max=v)
+                   for d, c, v in [(400, 2, 30), (5, 1, 10), (31, 4, 50), (200, 0, 0)]]
+        expected = [self.screener.calculate_score(r) for r in results]
+
+        enriched = self.screener.enrich_results_with_scores([dict(r) for r in results])
+
+        self.assertEqual([r['score'] for r in enriched], sorted(expected, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+"""Behaviour tests for the unified ticker file generator."""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from src.unified_ticker_generator import HAS_PYARROW, UNIVERSE_CACHE_VERSION, UnifiedTickerGenerator
+
+
+class _TickersConfig:
+    """Minimal config object exposing the tickers directory."""
+
+    def __init__(self, tickers_dir, ticker_filenames=None):
+        self.directories = {'TICKERS_DIR': str(tickers_dir)}
+        self.ticker_filenames = ticker_filenames or {}
+
+
+class ParseUserChoiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.generator = UnifiedTickerGenerator(_TickersConfig(Path(self._tmp.name)))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_zero_is_universe(self):
+        self.assertEqual(self.generator._parse_user_choice(0), [0])
+        self.assertEqual(self.generator._parse_user_choice('0'), [0])
+
+    def test_single_choice(self):
+        self.assertEqual(self.generator._parse_user_choice(2), [2])
+        self.assertEqual(self.generator._parse_user_choice('5'), [5])
+
+    def test_dash_separated_choices(self):
+        self.assertEqual(self.generator._parse_user_choice('1-2'), [1, 2])
+        self.assertEqual(self.generator._parse_user_choice(' 3 - 4 '), [3, 4])
+
+    def test_cached_int_tuple(self):
+        self.assertEqual(self.generator._parse_user_choice((1, 2)), [1, 2])
+        self.assertEqual(self.generator._parse_user_choice((7,)), [7])
+
+    def test_invalid_choice(self):
+        self.assertEqual(self.generator._parse_user_choice('x'), [])
+
+
+class UniverseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.generator = UnifiedTickerGenerator(_TickersConfig(self.root / 'tickers'))
+        self.source = self.root / 'tradingview_universe.csv'
+        self.source.write_text('Symbol,Index\nAAPL,S&P 500\n')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_stamp_records_version_and_content(self):
+        stamp = self.generator._universe_source_stamp(self.source)
+        self.assertTrue(stamp.startswith(f"v{UNIVERSE_CACHE_VERSION}:"))
+
+        self.source.write_text('Symbol,Index\nMSFT,S&P 500\n')
+        self.assertNotEqual(self.generator._universe_source_stamp(self.source), stamp)
+
+    def test_stamp_ignores_modification_time(self):
+        stamp = self.generator._universe_source_stamp(self.source)
+        self.source.write_text(self.source.read_text())
+        self.assertEqual(self.generator._universe_source_stamp(self.source), stamp)
+
+    def test_clear_removes_cache_and_stamp(self):
+        self.generator.universe_cache_file.write_bytes(b'stale')
+        self.generator.universe_stamp_file.write_text('v0:stale')
+
+        self.generator._clear_universe_cache()
+
+        self.assertFalse(self.generator.universe_cache_file.exists())
+        self.assertFalse(self.generator.universe_stamp_file.exists())
+        self.generator._clear_universe_cache()
+
+
+_UNIVERSE_CSV = """Symbol,Description,Exchange,Analyst Rating,Index
+AAPL,Apple,NASDAQ,Buy,"S&P 500, NASDAQ 100, NASDAQ Composite"
+JPM,JPMorgan,NYSE,Buy,S&P 500
+BRK.B,Berkshire,NYSE,Neutral,S&P 500
+ABC/P,Preferred,NYSE,Buy,S&P 500
+ZS,Zscaler,NASDAQ,Strong buy,NASDAQ Composite
+"""
+
+
+class GenerateTickerFilesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        # The root universe and individual ticker files are looked up in the working directory
+        self._cwd = os.getcwd()
+        os.chdir(self.root)
+        (self.root / 'tradingview_universe.csv').write_text(_UNIVERSE_CSV)
+        (self.root / 'test_tickers.csv').write_text('ticker\nAAPL\nNOTHERE\n')
+        self.tickers_dir = self.root / 'tickers'
+        self.config = _TickersConfig(self.tickers_dir, {8: 'test_tickers.csv'})
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _generate(self, user_choice):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ok = UnifiedTickerGenerator(self.config).generate_all_ticker_files(user_choice)
+        return ok, output.getvalue()
+
+    def _tickers(self, choice):
+        return (self.tickers_dir / f'combined_tickers_{choice}.csv').read_text().split()
+
+    def _info(self, choice):
+        return pd.read_csv(self.tickers_dir / f'combined_info_tickers_{choice}.csv', index_col='ticker')
+
+    def test_cleans_universe_tickers(self):
+        ok, _ = self._generate(0)
+
+        self.assertTrue(ok)
+        # '/' tickers are dropped and '.' becomes '-'
+        self.assertEqual(self._tickers(0), ['ticker', 'AAPL', 'JPM', 'BRK-B', 'ZS'])
+
+    def test_index_columns_select_choices(self):
+        self._generate(1)
+        self._generate(2)
+
+        self.assertEqual(self._tickers(1), ['ticker', 'AAPL', 'JPM', 'BRK-B'])
+        self.assertEqual(self._tickers(2), ['ticker', 'AAPL'])
+        info = self._info(0)
+        self.assertEqual(info['SP500'].tolist(), [True, True, True, False])
+        self.assertEqual(info['NASDAQ100'].tolist(), [True, False, False, False])
+        self.assertEqual(info['NASDAQComposite'].tolist(), [True, False, False, True])
+
+    def test_exchange_and_rating_columns(self):
+        self._generate(0)
+
+        info = self._info(0)
+        self.assertEqual(info.columns[:4].tolist(), ['description', 'exchange', 'analyst rating', 'index'])
+        self.assertEqual(info['exchange_NYSE'].tolist(), [False, True, True, False])
+        self.assertEqual(info['rating_Strong_buy'].tolist(), [False, False, False, True])
+
+    def test_individual_file_choice_keeps_unknown_tickers(self):
+        ok, _ = self._generate(8)
+
+        self.assertTrue(ok)
+        self.assertEqual(self._tickers(8), ['ticker', 'AAPL', 'NOTHERE'])
+        info = self._info(8)
+        self.assertEqual(info.loc['AAPL', 'description'], 'Apple')
+        self.assertTrue(pd.isna(info.loc['NOTHERE', 'description']))
+
+    def test_missing_root_universe_fails_and_clears_cache(self):
+        self._generate(0)
+        (self.root / 'tradingview_universe.csv').unlink()
+
+        ok, output = self._generate(2)
+
+        self.assertFalse(ok)
+        self.assertIn('Missing root TradingView universe file', output)
+        self.assertFalse((self.tickers_dir / 'tradingview_universe_bool.parquet').exists())
+        self.assertFalse((self.tickers_dir / 'tradingview_universe_bool.stamp').exists())
+
+    @unittest.skipUnless(HAS_PYARROW, 'Parquet cache needs pyarrow')
+    def test_universe_cache_reused_until_source_changes(self):
+        self._generate(1)
+        _, output = self._generate(1)
+        self.assertIn('using cached universe data', output)
+
+        (self.root / 'tradingview_universe.csv').write_text(_UNIVERSE_CSV.replace('ZS,', 'NET,'))
+        _, output = self._generate(0)
+
+        self.assertNotIn('using cached universe data', output)
+        self.assertEqual(self._tickers(0), ['ticker', 'AAPL', 'JPM', 'BRK-B', 'NET'])
+
+    def test_clean_info_file_matches_info_file(self):
+        self._generate('1-2')
+
+        for choice in (0, 1, 2, '1-2'):
+            info = (self.tickers_dir / f'combined_info_tickers_{choice}.csv').read_text()
+            clean = (self.tickers_dir / f'combined_info_tickers_clean_{choice}.csv').read_text()
+            self.assertEqual(info, clean, choice)
+
+    def test_combined_choice_deduplicates_in_order(self):
+        ok, _ = self._generate('2-1')
+
+        self.assertTrue(ok)
+        self.assertEqual(self._tickers('2-1'), ['ticker', 'AAPL', 'JPM', 'BRK-B'])
+        self.assertEqual(self._info('2-1').index.tolist(), ['AAPL', 'JPM', 'BRK-B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
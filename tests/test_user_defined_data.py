@@ -0,0 +1,176 @@
+"""Behaviour tests for user_data.csv parsing and configuration helpers."""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import user_defined_data
+from src.user_defined_data import ensure_output_dir, read_user_data
+
+
+def _read_quietly(path):
+    """Read a configuration file, discarding its printed warnings."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return read_user_data(str(path))
+
+
+class EnsureOutputDirTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_recreates_directory_removed_during_run(self):
+        target = self.root / 'results' / 'daily'
+
+        self.assertEqual(ensure_output_dir(target), target)
+        shutil.rmtree(self.root / 'results')
+        ensure_output_dir(target)
+
+        self.assertTrue(target.is_dir())
+
+
+class ReadUserDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._no_disk_cache = mock.patch.object(user_defined_data, 'USER_DATA_CACHE_DIR', None)
+        self._no_disk_cache.start()
+        user_defined_data._USER_DATA_MEMO.clear()
+
+    def tearDown(self):
+        user_defined_data._USER_DATA_MEMO.clear()
+        self._no_disk_cache.stop()
+        self._tmp.cleanup()
+
+    def _read(self, *rows):
+        """Write the rows to a fresh user_data.csv and return (configuration, printed output)."""
+        path = self.root / f'user_data_{len(list(self.root.iterdir()))}.csv'
+        path.write_text('# comment line\n' + ''.join(f'{row}\n' for row in rows))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            config = read_user_data(str(path))
+        return config, output.getvalue()
+
+    def test_boolean_spellings(self):
+        config, _ = self._read('YF_hist_data,TRUE,', 'YF_daily_data,y,', 'YF_weekly_data, Enabled ,',
+                               'YF_monthly_data,t,', 'VOLUME_SUITE_daily_enable,n,',
+                               'VOLUME_SUITE_weekly_enable,Off,', 'VOLUME_SUITE_hv_absolute,disable,',
+                               'HV1Y_enable,0,')
+
+        self.assertIs(config.yf_hist_data, True)
+        self.assertIs(config.yf_daily_data, True)
+        self.assertIs(config.yf_weekly_data, True)
+        self.assertIs(config.yf_monthly_data, True)
+        self.assertIs(config.volume_suite_daily_enable, False)
+        self.assertIs(config.volume_suite_weekly_enable, False)
+        self.assertIs(config.volume_suite_hv_absolute, False)
+        self.assertIs(config.hv1y_enable, False)
+
+    def test_unrecognised_boolean_is_false_and_logged(self):
+        with self.assertLogs(user_defined_data.logger, 'WARNING') as logs:
+            config, _ = self._read('HVE_historical_export,sometimes,')
+
+        self.assertIs(config.hve_historical_export, False)
+        self.assertIn("'sometimes'", logs.output[0])
+
+    def test_valid_ticker_choices(self):
+        for choice in ('0', '2', '1-2', ' 5 - 8 ', '02'):
+            config, output = self._read(f'ticker_choice,{choice},')
+            self.assertEqual(config.ticker_choice, choice.strip(), choice)
+            self.assertNotIn('ticker_choice', output, choice)
+
+    def test_invalid_ticker_choice_falls_back_to_default(self):
+        for choice in ('9', 'x-y', '1-', '1;2'):
+            config, output = self._read(f'ticker_choice,{choice},')
+            self.assertEqual(config.ticker_choice, '2', choice)
+            self.assertIn(f"ticker_choice '{choice}' is invalid", output)
+
+    def test_invalid_value_keeps_default(self):
+        config, output = self._read('HV1Y_window_days,soon,')
+
+        self.assertEqual(config.hv1y_window_days, 365)
+        self.assertIn("Invalid value 'soon' for HV1Y_window_days", output)
+
+    def test_formerly_duplicated_keys(self):
+        # Each of these variables used to appear twice in CONFIG_MAP
+        config, output = self._read('VOLUME_SUITE_vroc_threshold,12.5,', 'RS_output_dir,out/rs,',
+                                    'VOLUME_SUITE_pvb_TWmodel_integration,false,')
+
+        self.assertEqual(config.volume_suite_vroc_threshold, 12.5)
+        self.assertIsInstance(config.volume_suite_vroc_threshold, float)
+        self.assertEqual(config.rs_output_dir, 'out/rs')
+        self.assertIs(config.volume_suite_pvb_clmodel_integration, False)
+        self.assertNotIn('Unknown configuration', output)
+
+        config, _ = self._read('VOLUME_SUITE_pvb_Clmodel_integration,false,')
+        self.assertIs(config.volume_suite_pvb_clmodel_integration, False)
+
+    def test_unknown_variable_is_reported(self):
+        _, output = self._read('not_a_setting,1,')
+        self.assertIn('Unknown configuration variable(s) ignored: not_a_setting', output)
+
+
+class UserDataDiskCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.cache_dir = self.root / 'cache'
+        user_defined_data._USER_DATA_MEMO.clear()
+
+    def tearDown(self):
+        user_defined_data._USER_DATA_MEMO.clear()
+        self._tmp.cleanup()
+
+    def _write_config(self, name, batch_size):
+        path = self.root / name
+        path.write_text(f'batch_size,{batch_size},\n')
+        return path
+
+    def test_disabled_by_default(self):
+        with mock.patch.object(user_defined_data, 'USER_DATA_CACHE_DIR', None), \
+                mock.patch.object(user_defined_data, '_save_user_data_cache') as save:
+            config = _read_quietly(self._write_config('user_data.csv', 7))
+
+        self.assertEqual(config.batch_size, 7)
+        save.assert_not_called()
+
+    def test_opt_in_cache_is_private_reused_and_pruned(self):
+        with mock.patch.object(user_defined_data, 'USER_DATA_CACHE_DIR', self.cache_dir), \
+                mock.patch.object(user_defined_data, 'USER_DATA_CACHE_MAX_ENTRIES', 2):
+            for batch_size in (1, 2, 3):
+                self.assertEqual(_read_quietly(self._write_config(f'u{batch_size}.csv', batch_size)).batch_size,
+                                 batch_size)
+
+            entries = list(self.cache_dir.glob('*.pkl'))
+            self.assertEqual(len(entries), 2)
+            self.assertEqual(entries[0].stat().st_mode & 0o077, 0)
+
+            user_defined_data._USER_DATA_MEMO.clear()
+            with mock.patch.object(user_defined_data, '_parse_user_data') as parse:
+                self.assertEqual(_read_quietly(self.root / 'u3.csv').batch_size, 3)
+            parse.assert_not_called()
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'POSIX permissions only')
+    def test_ignores_cache_writable_by_others(self):
+        with mock.patch.object(user_defined_data, 'USER_DATA_CACHE_DIR', self.cache_dir):
+            path = self._write_config('user_data.csv', 9)
+            _read_quietly(path)
+            cache_file = next(self.cache_dir.glob('*.pkl'))
+            cache_file.chmod(0o666)
+
+            self.assertIsNone(user_defined_data._load_user_data_cache(cache_file))
+
+
+if __name__ == '__main__':
+    unittest.main()